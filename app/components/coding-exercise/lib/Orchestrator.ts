@@ -6,7 +6,7 @@ import type { EditorView } from "@codemirror/view";
 import type { Frame } from "@jiki/interpreters/shared";
 import type { Messages as InterpreterMessages } from "@jiki/interpreters";
 import type { ExerciseDefinition, Language, ReadonlyRange, Messages as CurriculumMessages } from "@jiki/curriculum";
-import { getLanguageFeatures } from "@jiki/curriculum";
+import { getLanguageFeatures, VisualExercise } from "@jiki/curriculum";
 import { debounce } from "lodash";
 import type { StoreApi } from "zustand/vanilla";
 import { EditorManager } from "./orchestrator/EditorManager";
@@ -59,6 +59,10 @@ class Orchestrator {
   // useExerciseLoader (fetched in the blocking load); tests default to an empty
   // dict, which resolves keys as-is.
   private readonly exerciseLocaleMessages: CurriculumMessages;
+  // The exercise's external functions, built once for linting. Compiling only
+  // reads their names and descriptions, so there's no need to construct a fresh
+  // exercise (and its view) on every keystroke.
+  private lintExternalFunctions: Array<{ name: string; func: any; description: string }> | null = null;
 
   constructor({
     exercise,
@@ -338,13 +342,19 @@ class Orchestrator {
         ...this.exercise.interpreterOptions
       };
 
-      // Instantiate the exercise (uniform for visual and IO) to get its functions.
-      const tempExercise = new this.exercise.ExerciseClass();
-      const availableFunctions: Array<{ name: string; func: any; description: string }> =
-        tempExercise.getExternalFunctions(this.language);
-
+      // Instantiate the exercise to get its functions. The functions are never
+      // called, so one instance serves every lint, and a visual exercise is built
+      // headless so linting doesn't attach a view to the document.
+      this.lintExternalFunctions ??= (
+        this.exercise.type === "visual"
+          ? VisualExercise.createHeadless(this.exercise.ExerciseClass)
+          : new this.exercise.ExerciseClass()
+      ).getExternalFunctions(this.language);
+
+      // Unchanged code is a cache hit in the interpreter's program cache, so
+      // re-linting after edits that net out (e.g. undo) doesn't re-parse.
       const result = interpreter.compile(code, {
-        externalFunctions: availableFunctions,
+        externalFunctions: this.lintExternalFunctions,
         languageFeatures,
         localeMessages: this.interpreterLocaleMessages
       });
@@ -0,0 +1,140 @@
+import type { Frame } from "@jiki/interpreters/shared";
+
+/**
+ * Precomputed lookups over a test's frames, so scrubbing and stepping don't
+ * scan the whole run on every pointer move.
+ *
+ * Frame times never decrease (the executor only ever advances its clock), so
+ * time lookups are binary searches. Folding is handled with per-frame
+ * next/prev-visible tables, built from a bitset of folded lines. They're only
+ * rebuilt when the folded lines actually change.
+ */
+export class FrameIndex {
+  private static readonly cache = new WeakMap<Frame[], FrameIndex>();
+
+  private readonly times: Float64Array;
+
+  // For each frame index, the nearest index at or after (next) / at or before
+  // (prev) it whose line isn't folded, or -1 if there's none.
+  private readonly nextVisible: Int32Array;
+  private readonly prevVisible: Int32Array;
+  private foldedLines: readonly number[] | null = null;
+
+  private constructor(private readonly frames: Frame[]) {
+    this.times = Float64Array.from(frames, (frame) => frame.time);
+    this.nextVisible = new Int32Array(frames.length);
+    this.prevVisible = new Int32Array(frames.length);
+  }
+
+  /**
+   * The index for `frames`, built on first use. Frames arrays are never
+   * modified once a test has run, so the index is cached against the array.
+   */
+  static for(frames: Frame[], foldedLines: readonly number[]): FrameIndex {
+    let index = FrameIndex.cache.get(frames);
+    if (!index) {
+      index = new FrameIndex(frames);
+      FrameIndex.cache.set(frames, index);
+    }
+    index.applyFolds(foldedLines);
+    return index;
+  }
+
+  get length(): number {
+    return this.frames.length;
+  }
+
+  /** Index of the first frame with time >= `time` (length if none). */
+  firstAtOrAfter(time: number): number {
+    let lo = 0;
+    let hi = this.times.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (this.times[mid] < time) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    return lo;
+  }
+
+  /** Index of the first frame with time > `time` (length if none). */
+  firstAfter(time: number): number {
+    let lo = 0;
+    let hi = this.times.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (this.times[mid] <= time) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    return lo;
+  }
+
+  /** The first non-folded frame index at or after `idx`, or undefined. */
+  nextVisibleIdx(idx: number): number | undefined {
+    if (idx < 0) {
+      idx = 0;
+    }
+    if (idx >= this.frames.length) {
+      return undefined;
+    }
+    const next = this.nextVisible[idx];
+    return next === -1 ? undefined : next;
+  }
+
+  /** The last non-folded frame index at or before `idx`, or undefined. */
+  prevVisibleIdx(idx: number): number | undefined {
+    if (idx < 0) {
+      return undefined;
+    }
+    if (idx >= this.frames.length) {
+      idx = this.frames.length - 1;
+    }
+    const prev = this.prevVisible[idx];
+    return prev === -1 ? undefined : prev;
+  }
+
+  private applyFolds(foldedLines: readonly number[]): void {
+    if (this.foldedLines !== null && sameLines(this.foldedLines, foldedLines)) {
+      return;
+    }
+    this.foldedLines = [...foldedLines];
+
+    let maxLine = 0;
+    for (const line of foldedLines) {
+      maxLine = Math.max(maxLine, line);
+    }
+    const folded = new Uint8Array(maxLine + 1);
+    for (const line of foldedLines) {
+      folded[line] = 1;
+    }
+    const isFolded = (line: number) => line <= maxLine && folded[line] === 1;
+
+    const count = this.frames.length;
+    let next = -1;
+    for (let idx = count - 1; idx >= 0; idx--) {
+      if (!isFolded(this.frames[idx].line)) {
+        next = idx;
+      }
+      this.nextVisible[idx] = next;
+    }
+    let prev = -1;
+    for (let idx = 0; idx < count; idx++) {
+      if (!isFolded(this.frames[idx].line)) {
+        prev = idx;
+      }
+      this.prevVisible[idx] = prev;
+    }
+  }
+}
+
+function sameLines(a: readonly number[], b: readonly number[]): boolean {
+  if (a === b) {
+    return true;
+  }
+  return a.length === b.length && a.every((line, idx) => line === b[idx]);
+}
@@ -5,13 +5,17 @@ import { toastError } from "@/lib/toast";
 import type { StoreApi } from "zustand/vanilla";
 import { ERROR_HIGHLIGHT_COLOR } from "../../ui/codemirror/extensions/lineHighlighter";
 import { processMessageContent } from "../../ui/messageUtils";
-import type { TestExpect, TestSuiteResult } from "../test-results-types";
+import type { TestExpect, TestResult, TestSuiteResult } from "../test-results-types";
 import type { ExerciseContext, OrchestratorStore } from "../types";
 
 /**
  * Manages test suite execution, results, and processing
  */
 export class TestSuiteManager {
+  // The run in progress, aborted when a newer one starts so a stale suite
+  // neither keeps the main thread busy nor overwrites the newer results.
+  private currentRun: AbortController | null = null;
+
   constructor(
     private readonly store: StoreApi<OrchestratorStore>,
     // The active locale's interpreter catalog, injected into every interpreter run
@@ -39,6 +43,7 @@ export class TestSuiteManager {
     state.setStatus("running");
     state.setError(null);
     state.setUnderlineRange(undefined);
+    state.setPendingTestResults([]);
   }
 
   /**
@@ -105,6 +110,10 @@ export class TestSuiteManager {
    * Run tests on the provided code
    */
   async runCode(code: string, exercise: ExerciseDefinition): Promise<void> {
+    this.currentRun?.abort();
+    const run = new AbortController();
+    this.currentRun = run;
+
     this.prepareStateForTestRun();
 
     // Fire and forget - submission is recorded server-side but doesn't block the test run
@@ -117,13 +126,25 @@ export class TestSuiteManager {
       // Get the current language from the store
       const language = this.store.getState().language;
 
+      // Publish each scenario's result as it finishes, so the scenario dots fill
+      // in while the rest of the suite is still running.
+      let pending: TestResult[] = [];
+      const onTestResult = (result: TestResult) => {
+        pending = [...pending, result];
+        this.store.getState().setPendingTestResults(pending);
+      };
+
       const testResults = await runTests(
         code,
         exercise,
         language,
         this.interpreterLocaleMessages,
-        this.exerciseLocaleMessages
+        this.exerciseLocaleMessages,
+        { onTestResult, signal: run.signal }
       );
+      if (run.signal.aborted) {
+        return;
+      }
 
       // Set the results in the store (will also set the first test as current)
       const state = this.store.getState();
@@ -134,6 +155,10 @@ export class TestSuiteManager {
         this.taskManager.updateTaskProgress(testResults, exercise);
       }
     } catch (error) {
+      // Superseded by a newer run, which owns the state now
+      if (run.signal.aborted) {
+        return;
+      }
       console.error(error);
 
       // Check if it's a SyntaxError (has location property)
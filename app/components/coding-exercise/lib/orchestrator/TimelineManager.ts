@@ -1,10 +1,14 @@
 import type { Frame } from "@jiki/interpreters/shared";
 import type { StoreApi } from "zustand/vanilla";
 import type { OrchestratorState } from "../types";
+import { FrameIndex } from "./FrameIndex";
 
 /**
  * TimelineManager handles all timeline and frame-related operations.
  * This includes frame navigation, timeline time management, and caching.
+ *
+ * Frame lookups go through a FrameIndex (binary search on time plus
+ * precomputed folded-line tables), so they stay cheap on long runs.
  */
 export class TimelineManager {
   constructor(private readonly store: StoreApi<OrchestratorState & any>) {}
@@ -15,13 +19,7 @@ export class TimelineManager {
    * startIdx is inclusive - it checks from startIdx down to 0.
    */
   private static findPrevFrameIdx(frames: Frame[], startIdx: number, foldedLines: number[]): number | undefined {
-    for (let idx = startIdx; idx >= 0; idx--) {
-      const frame = frames[idx];
-      if (!foldedLines.includes(frame.line)) {
-        return idx;
-      }
-    }
-    return undefined;
+    return FrameIndex.for(frames, foldedLines).prevVisibleIdx(startIdx);
   }
 
   /**
@@ -54,6 +52,7 @@ export class TimelineManager {
     }
 
     const time = frame.time;
+    const index = FrameIndex.for(frames, foldedLines);
 
     // Find current position
     let currentIdx: number;
@@ -61,8 +60,8 @@ export class TimelineManager {
       currentIdx = -1;
     } else {
       // Find the first frame after the timeline time
-      const idx = frames.findIndex((f: Frame) => f.time > time);
-      if (idx === -1) {
+      const idx = index.firstAfter(time);
+      if (idx === frames.length) {
         // Past all frames
         return undefined;
       }
@@ -70,13 +69,8 @@ export class TimelineManager {
     }
 
     // Find next non-folded frame
-    for (let idx = currentIdx + 1; idx < frames.length; idx++) {
-      if (!foldedLines.includes(frames[idx].line)) {
-        return frames[idx];
-      }
-    }
-
-    return undefined;
+    const nextIdx = index.nextVisibleIdx(currentIdx + 1);
+    return nextIdx !== undefined ? frames[nextIdx] : undefined;
   }
 
   /**
@@ -89,15 +83,12 @@ export class TimelineManager {
     }
 
     const time = frame.time;
+    const index = FrameIndex.for(frames, foldedLines);
 
     // Special case: if timeline is after all frames, return the last non-folded frame
     if (frames.length > 0 && time > frames[frames.length - 1].time) {
-      for (let i = frames.length - 1; i >= 0; i--) {
-        if (!foldedLines.includes(frames[i].line)) {
-          return frames[i];
-        }
-      }
-      return undefined;
+      const lastIdx = index.prevVisibleIdx(frames.length - 1);
+      return lastIdx !== undefined ? frames[lastIdx] : undefined;
     }
 
     // Find current position
@@ -106,24 +97,12 @@ export class TimelineManager {
     }
 
     // Find the last frame before or at the timeline time
-    let lastIdx = -1;
-    for (let i = 0; i < frames.length; i++) {
-      if (frames[i].time <= time) {
-        lastIdx = i;
-      } else {
-        break;
-      }
-    }
+    const lastIdx = index.firstAfter(time) - 1;
     const currentIdx = lastIdx === -1 ? 0 : lastIdx;
 
     // Find previous non-folded frame
-    for (let idx = currentIdx - 1; idx >= 0; idx--) {
-      if (!foldedLines.includes(frames[idx].line)) {
-        return frames[idx];
-      }
-    }
-
-    return undefined;
+    const prevIdx = index.prevVisibleIdx(currentIdx - 1);
+    return prevIdx !== undefined ? frames[prevIdx] : undefined;
   }
 
   /**
@@ -136,12 +115,11 @@ export class TimelineManager {
     }
 
     // Find the first frame at or after the timeline time that isn't folded
-    const idx = frames.findIndex((frame: Frame) => {
-      return frame.time >= time && !foldedLines.includes(frame.line);
-    });
+    const index = FrameIndex.for(frames, foldedLines);
+    const idx = index.nextVisibleIdx(index.firstAtOrAfter(time));
 
     // If there's no frame after the timeline time, return the last frame
-    if (idx === -1) {
+    if (idx === undefined) {
       return frames.length - 1;
     }
 
@@ -260,13 +238,8 @@ export class TimelineManager {
 
       // Special case: if timeline is after all frames, return the last non-folded frame
       if (time !== undefined && frames.length > 0 && time > frames[frames.length - 1].time) {
-        // Start from the last frame and find the last non-folded one
-        for (let i = frames.length - 1; i >= 0; i--) {
-          if (!state.foldedLines.includes(frames[i].line)) {
-            return frames[i];
-          }
-        }
-        return undefined;
+        const lastIdx = FrameIndex.for(frames, state.foldedLines).prevVisibleIdx(frames.length - 1);
+        return lastIdx !== undefined ? frames[lastIdx] : undefined;
       }
     }
 
@@ -305,13 +278,7 @@ export class TimelineManager {
       return undefined;
     }
 
-    for (let idx = startIdx + 1; idx < frames.length; idx++) {
-      const frame = frames[idx];
-      if (!foldedLines.includes(frame.line)) {
-        return idx;
-      }
-    }
-    return undefined;
+    return FrameIndex.for(frames, foldedLines).nextVisibleIdx(startIdx + 1);
   }
 
   /**
@@ -331,9 +298,9 @@ export class TimelineManager {
       return -1;
     }
 
-    // Find the first frame at or after the timeline time
-    const idx = frames.findIndex((f: Frame) => f.time > time);
-    if (idx === -1) {
+    // Find the first frame after the timeline time
+    const idx = FrameIndex.for(frames, state.foldedLines).firstAfter(time);
+    if (idx === frames.length) {
       // Past all frames, return last index
       return frames.length - 1;
     }
@@ -364,14 +331,7 @@ export class TimelineManager {
     }
 
     // Find the last frame before or at the timeline time
-    let lastIdx = -1;
-    for (let i = 0; i < frames.length; i++) {
-      if (frames[i].time <= time) {
-        lastIdx = i;
-      } else {
-        break;
-      }
-    }
+    const lastIdx = FrameIndex.for(frames, state.foldedLines).firstAfter(time) - 1;
 
     // If no frame found (timeline before all frames), return 0
     // Otherwise return the last matching frame index
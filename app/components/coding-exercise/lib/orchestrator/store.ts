@@ -180,6 +180,7 @@ export function createOrchestratorStore({
 
         // Test results state
         testSuiteResult: null,
+        pendingTestResults: [],
         shouldPlayOnTestChange: true,
 
         // Frame navigation state (moved from currentTest to top level)
@@ -294,8 +295,10 @@ export function createOrchestratorStore({
             return;
           }
 
-          // Find the index of this test in the test suite
-          const testIdx = state.testSuiteResult?.tests.findIndex((t) => t.slug === test.slug) ?? 0;
+          // Find the index of this test in the test suite (or, mid-run, in the
+          // results streamed in so far)
+          const suiteTests = state.status === "running" ? state.pendingTestResults : state.testSuiteResult?.tests;
+          const testIdx = suiteTests?.findIndex((t) => t.slug === test.slug) ?? 0;
 
           // Check if we have a saved time for this test
           const savedTime = state.testCurrentTimes[test.slug];
@@ -497,6 +500,7 @@ export function createOrchestratorStore({
           // Set the test suite result and reset things.
           set({
             testSuiteResult: result,
+            pendingTestResults: [],
             shouldPlayOnTestChange: true,
             hasCodeBeenEdited: false,
             status: "success", // This will get reset via the setCurrentTest below.
@@ -520,6 +524,7 @@ export function createOrchestratorStore({
             showCompletionModalIfReady();
           }
         },
+        setPendingTestResults: (results) => set({ pendingTestResults: results }),
         setShouldPlayOnTestChange: (shouldAutoPlay) => set({ shouldPlayOnTestChange: shouldAutoPlay }),
         setIsPlaying: (playing) => {
           const state = get();
@@ -668,6 +673,7 @@ export function createOrchestratorStore({
 
             // Reset test results state
             testSuiteResult: null,
+            pendingTestResults: [],
             shouldPlayOnTestChange: true,
 
             // Reset frame navigation state
@@ -738,6 +744,7 @@ export function useOrchestratorStore(orchestrator: { getStore: () => StoreApi<Or
 
       // Test results state
       testSuiteResult: state.testSuiteResult,
+      pendingTestResults: state.pendingTestResults,
       shouldPlayOnTestChange: state.shouldPlayOnTestChange,
 
       // Frame navigation state
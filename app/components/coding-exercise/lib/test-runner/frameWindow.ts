@@ -0,0 +1,99 @@
+import type { Frame, Shared } from "@jiki/interpreters/shared";
+
+// Runs with more frames than this are windowed; shorter runs are left untouched.
+export const FRAME_WINDOW_THRESHOLD = 5_000;
+
+// Frames at each end of a long run that keep their full evaluation detail. The
+// scrubber opens on the first frame and students usually inspect the end state.
+const RETAINED_EDGE_FRAMES = 250;
+
+// How many descriptions either side of a requested frame are rebuilt per re-run.
+const DESCRIPTION_WINDOW = 250;
+
+// A cheap stand-in for a frame's result: its primitive fields and the values of
+// any immutable JikiObjects directly on it. Enough to tell "set x to 7" from
+// "set x to 3" once the result itself has been dropped.
+function fingerprint(result: unknown): string {
+  if (typeof result !== "object" || result === null) {
+    return String(result);
+  }
+  const parts: string[] = [];
+  for (const value of Object.values(result)) {
+    if (typeof value !== "object" || value === null) {
+      parts.push(String(value));
+    } else if (isJikiObject(value)) {
+      parts.push(value.isImmutable ? value.toString() : value.type);
+    }
+  }
+  return parts.join("|");
+}
+
+function isJikiObject(value: object): value is Shared.JikiObject {
+  return "isImmutable" in value && "type" in value;
+}
+
+/**
+ * Bounds the memory a long run's frames hold onto.
+ *
+ * Each frame keeps its evaluation `result` (a tree of JikiObject snapshots) and
+ * AST `context` only so its description can be generated on demand. For runs
+ * near `maxTotalLoopIterations` that's tens of thousands of result trees per
+ * scenario, kept alive for as long as the test results are. So outside the
+ * first and last few hundred frames, the detail is dropped and descriptions
+ * are rebuilt by re-running the scenario. Each re-run fills a window of
+ * descriptions around the requested frame, so stepping through the scrubber
+ * only re-runs occasionally.
+ *
+ * Only use this for runs that re-run identically: a fixed random seed, and an
+ * exercise without randomness of its own. As a safety net, a rebuilt frame's
+ * description is only used if its line, time, status and result fingerprint
+ * match the original's; otherwise it gets none rather than a wrong one.
+ *
+ * Re-runs happen synchronously on the main thread, under the same wall-clock
+ * budget as the original run. A re-run that is slower than the original and
+ * gets stopped early leaves the frames past that point without descriptions.
+ *
+ * Line, time, status and error are kept on every frame: the scrubber, the
+ * animation timeline and the expectations only need those.
+ */
+export function windowFrames(frames: Frame[], rerun: () => Frame[]): void {
+  if (frames.length <= FRAME_WINDOW_THRESHOLD) {
+    return;
+  }
+
+  const descriptions = new Map<number, string>();
+  const fingerprints = frames.map((frame) => fingerprint(frame.result));
+
+  const describe = (idx: number): string => {
+    const cached = descriptions.get(idx);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    // Only the current window is kept, so memory stays bounded however far we scrub.
+    descriptions.clear();
+    const rerunFrames = rerun();
+    const end = Math.min(frames.length, idx + DESCRIPTION_WINDOW + 1);
+    for (let i = Math.max(0, idx - DESCRIPTION_WINDOW); i < end; i++) {
+      const original = frames[i];
+      const rebuilt = rerunFrames.at(i);
+      // A mismatch means the re-run diverged (randomness, or it was stopped
+      // early), so its descriptions would be for different steps or values.
+      const matches =
+        rebuilt !== undefined &&
+        rebuilt.line === original.line &&
+        rebuilt.time === original.time &&
+        rebuilt.status === original.status &&
+        fingerprint(rebuilt.result) === fingerprints[i];
+      descriptions.set(i, matches ? rebuilt.generateDescription() : "");
+    }
+    return descriptions.get(idx) ?? "";
+  };
+
+  for (let idx = RETAINED_EDGE_FRAMES; idx < frames.length - RETAINED_EDGE_FRAMES; idx++) {
+    const frame = frames[idx];
+    delete frame.result;
+    delete frame.context;
+    frame.generateDescription = () => describe(idx);
+  }
+}
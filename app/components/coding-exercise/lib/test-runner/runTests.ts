@@ -6,13 +6,30 @@ import { bonusScenarioSlugs } from "../bonusScenarios";
 import { runIOScenario } from "./runIOScenario";
 import { runVisualScenario } from "./runVisualScenario";
 import { getInterpreter } from "./getInterpreter";
+import { yieldToMain } from "./yieldToMain";
+
+// How long one run of the student's code may take in real time before the
+// interpreter stops it with a "took too long" error, rather than freezing the tab.
+// Loop limits don't catch deep recursion or slow calls; this does. An exercise
+// can still set its own via interpreterOptions.
+const SCENARIO_TIME_BUDGET_MS = 5_000;
+
+export interface RunTestsOptions {
+  // Called with each scenario's result as soon as it finishes, in scenario order,
+  // so callers can surface progress before the whole suite is done.
+  onTestResult?: (result: TestResult, index: number) => void;
+  // Aborting stops the suite at the next scenario boundary, rejecting with the
+  // signal's reason. A scenario already running finishes first (it's synchronous).
+  signal?: AbortSignal;
+}
 
 export async function runTests(
   studentCode: string,
   exercise: ExerciseDefinition,
   language: Language,
   interpreterLocaleMessages: InterpreterMessages,
-  exerciseLocaleMessages: CurriculumMessages
+  exerciseLocaleMessages: CurriculumMessages,
+  options: RunTestsOptions = {}
 ): Promise<TestSuiteResult> {
   const interpreter = await getInterpreter(language);
 
@@ -32,6 +49,7 @@ export async function runTests(
   const levelFeatures = getLanguageFeatures(exercise.levelId, language);
   const languageFeatures = {
     timePerFrame: 1,
+    maxWallClockTimeMs: SCENARIO_TIME_BUDGET_MS,
     ...levelFeatures,
     ...exercise.interpreterOptions
   };
@@ -48,38 +66,57 @@ export async function runTests(
     throw compilationResult.error;
   }
 
-  // Compilation succeeded, run all scenarios
+  // Compilation succeeded, run all scenarios. Each scenario runs the student's
+  // code to completion synchronously, so yield back to the browser between them:
+  // otherwise a long suite freezes the editor until the very last one finishes.
+  // Those yields are also where an aborted run stops.
   const tests: TestResult[] = [];
+  const record = (result: TestResult) => {
+    tests.push(result);
+    options.onTestResult?.(result, tests.length - 1);
+  };
+  const nextScenario = async () => {
+    if (tests.length > 0) {
+      await yieldToMain();
+    }
+    if (options.signal?.aborted) {
+      throw options.signal.reason;
+    }
+  };
 
   if (exercise.type === "visual") {
     // Run visual scenarios
     for (const scenario of exercise.scenarios) {
-      const result = runVisualScenario(
-        scenario,
-        studentCode,
-        exercise.ExerciseClass,
-        language,
-        interpreter,
-        languageFeatures,
-        interpreterLocaleMessages,
-        messages
+      await nextScenario();
+      record(
+        runVisualScenario(
+          scenario,
+          studentCode,
+          exercise.ExerciseClass,
+          language,
+          interpreter,
+          languageFeatures,
+          interpreterLocaleMessages,
+          messages
+        )
       );
-      tests.push(result);
     }
   } else {
     // Run IO scenarios
     for (const scenario of exercise.scenarios) {
-      const result = runIOScenario(
-        scenario,
-        studentCode,
-        exercise.ExerciseClass,
-        language,
-        interpreter,
-        languageFeatures,
-        interpreterLocaleMessages,
-        messages
+      await nextScenario();
+      record(
+        runIOScenario(
+          scenario,
+          studentCode,
+          exercise.ExerciseClass,
+          language,
+          interpreter,
+          languageFeatures,
+          interpreterLocaleMessages,
+          messages
+        )
       );
-      tests.push(result);
     }
   }
 
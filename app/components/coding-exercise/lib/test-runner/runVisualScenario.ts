@@ -2,11 +2,10 @@ import type {
   IsolatedCheck,
   Language,
   Messages as CurriculumMessages,
-  VisualExercise,
   VisualScenario,
   VisualTestExpect
 } from "@jiki/curriculum";
-import { createTranslator } from "@jiki/curriculum";
+import { createTranslator, VisualExercise } from "@jiki/curriculum";
 import { resolveCodeCheckError } from "./resolveCodeCheckError";
 import { editorMessage } from "../i18n/editorMessages";
 import type { InterpretResult } from "@jiki/interpreters/shared";
@@ -14,6 +13,7 @@ import type { Messages as InterpreterMessages } from "@jiki/interpreters";
 import { AnimationTimeline as AnimationTimelineClass } from "../AnimationTimeline";
 import type { VisualTestResult } from "../test-results-types";
 import type { Interpreter } from "./getInterpreter";
+import { windowFrames } from "./frameWindow";
 
 export function runVisualScenario(
   scenario: VisualScenario,
@@ -40,6 +40,28 @@ export function runVisualScenario(
     exerciseLocaleMessages
   );
 
+  // Long runs drop per-frame detail outside a window, rebuilding descriptions on
+  // demand by re-running with the same seed. Without a seed the interpreter falls
+  // back to Math.random, so a re-run wouldn't reproduce the run being described.
+  if (resolvedSeed !== undefined) {
+    windowFrames(
+      primary.frames,
+      () =>
+        executeStudentCode(
+          scenario,
+          ExerciseClass,
+          studentCode,
+          language,
+          interpreter,
+          languageFeatures,
+          resolvedSeed,
+          interpreterLocaleMessages,
+          exerciseLocaleMessages,
+          true
+        ).result.frames
+    );
+  }
+
   const hasFrameError = primary.frames.some((f) => f.status === "ERROR");
 
   // When the student's code throws at runtime, the scenario's expectations are
@@ -97,6 +119,8 @@ interface PrimaryCheckResult {
 
 // Creates a fresh Exercise, runs setup, executes the student's code, and returns both
 // the exercise (for expectations / view) and the InterpretResult (for frames / logLines).
+// Only the primary run's view is ever shown: every other run is headless, so it
+// leaves nothing in the document and records no animations.
 function executeStudentCode(
   scenario: VisualScenario,
   ExerciseClass: new () => VisualExercise,
@@ -107,9 +131,10 @@ function executeStudentCode(
   randomSeed: number | undefined,
   interpreterLocaleMessages: InterpreterMessages,
   exerciseLocaleMessages: CurriculumMessages,
+  headless: boolean,
   overrides?: { secretConstants?: Record<string, number | string | boolean> }
 ): { exercise: VisualExercise; result: InterpretResult } {
-  const exercise = new ExerciseClass();
+  const exercise = headless ? VisualExercise.createHeadless(ExerciseClass) : new ExerciseClass();
   exercise.randomSeed = randomSeed;
 
   // Inject the active-locale message dict before student code runs so the
@@ -159,7 +184,8 @@ function runPrimaryCheck(
     languageFeatures,
     randomSeed,
     interpreterLocaleMessages,
-    exerciseLocaleMessages
+    exerciseLocaleMessages,
+    false
   );
 
   const expects = scenario.expectations(exercise);
@@ -225,6 +251,7 @@ function runIsolatedCheck(
       randomSeed,
       interpreterLocaleMessages,
       exerciseLocaleMessages,
+      true,
       { secretConstants: check.secretConstants }
     );
 
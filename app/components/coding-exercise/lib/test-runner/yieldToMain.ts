@@ -0,0 +1,17 @@
+interface Scheduler {
+  yield?: () => Promise<void>;
+}
+
+/**
+ * Give the browser a chance to paint and handle input before carrying on.
+ *
+ * Uses `scheduler.yield()` where available, which resumes ahead of other queued
+ * tasks, and falls back to a zero-delay timeout everywhere else.
+ */
+export function yieldToMain(): Promise<void> {
+  const scheduler = (globalThis as { scheduler?: Scheduler }).scheduler;
+  if (scheduler?.yield) {
+    return scheduler.yield();
+  }
+  return new Promise((resolve) => setTimeout(resolve, 0));
+}
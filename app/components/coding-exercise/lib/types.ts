@@ -84,6 +84,8 @@ export interface OrchestratorState {
 
   // Test results state
   testSuiteResult: TestSuiteResult | null;
+  // Results of the run in progress, in scenario order, as each scenario finishes
+  pendingTestResults: TestResult[];
   shouldPlayOnTestChange: boolean;
 
   // Frame navigation state (moved from currentTest to top level)
@@ -151,6 +153,7 @@ export interface OrchestratorActions {
 
   // Test results actions
   setTestSuiteResult: (result: TestSuiteResult | null) => void;
+  setPendingTestResults: (results: TestResult[]) => void;
 
   // Play/pause action
   setIsPlaying: (playing: boolean) => void;
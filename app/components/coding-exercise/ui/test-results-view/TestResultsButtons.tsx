@@ -12,11 +12,16 @@ import RunButton from "../RunButton";
 
 export function TestResultsButtons() {
   const orchestrator = useOrchestrator();
-  const { testSuiteResult, currentTestIdx } = useOrchestratorStore(orchestrator);
+  const { testSuiteResult, pendingTestResults, status: runStatus, currentTestIdx } = useOrchestratorStore(orchestrator);
   const exercise = orchestrator.getExercise();
   const scenarios = exercise.scenarios;
   const bonusSlugs = bonusScenarioSlugs(exercise);
 
+  // While a run is in progress, the dots show its results as each scenario
+  // finishes rather than the previous run's.
+  const isRunning = runStatus === "running";
+  const shownTests = isRunning ? pendingTestResults : testSuiteResult?.tests;
+
   const handleSelection = (idx: number, test?: TestResult) => {
     if (test) {
       orchestrator.setCurrentTest(test);
@@ -31,24 +36,25 @@ export function TestResultsButtons() {
           status: frame.status
         });
       }
-    } else {
+    } else if (!isRunning) {
+      // A scenario the running suite hasn't reached yet has nothing to show
       orchestrator.setCurrentTestIdx(idx);
     }
   };
 
-  const statusLineStatus = testSuiteResult?.tests[currentTestIdx]?.status ?? "idle";
+  const statusLineStatus = shownTests?.[currentTestIdx]?.status ?? "idle";
 
   // Until the core (non-bonus) scenarios all pass, don't reveal a bonus as
   // failing - show it in the neutral not-yet-run style instead. Passing bonuses
   // still show as passed.
-  const coreComplete = Boolean(testSuiteResult?.passed);
+  const coreComplete = !isRunning && Boolean(testSuiteResult?.passed);
 
   return (
     <div className={styles.DotsSection}>
       <div className={styles.dotsRow}>
         <div className={styles.Dots} data-testid="test-selector-buttons">
           {scenarios.map((scenario, idx) => {
-            const test = testSuiteResult?.tests[idx];
+            const test = shownTests?.[idx];
             const status = test?.status ?? "idle";
             const isBonus = bonusSlugs.has(scenario.slug);
             const displayStatus = isBonus && !coreComplete && status === "fail" ? "idle" : status;
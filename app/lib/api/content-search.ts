@@ -1,9 +1,18 @@
 import lunr from "lunr";
 import { contentIndexHashes } from "@/lib/generated/content-hashes";
 import { assetsUrl } from "@/lib/assets";
-import { searchIndexPath, searchIndexPointerPath } from "@/lib/assets-paths";
+import { searchIndexPath, searchIndexPointerPath, searchShardPath, shardedSearchIndexPath } from "@/lib/assets-paths";
 import { createHashResolver } from "@/lib/i18n/catalogPointer";
-import type { SearchIndexData } from "@/lib/content/types";
+import { DEFAULT_LOCALE } from "@/lib/locales";
+import { ShardedSearch } from "@/lib/api/sharded-search";
+import type { SearchIndexData, SearchShard, ShardedSearchManifest } from "@/lib/content/types";
+
+type SearchType = "articles" | "guides";
+
+/** A loaded search index: the slugs matching a query, best first. */
+export interface ContentSearch {
+  search(query: string): Promise<string[]>;
+}
 
 // A locale with no search index resolves to an empty (but valid) lunr index
 // rather than silently falling back to the English one. Building an empty index
@@ -24,12 +33,12 @@ function emptySearchIndex(): SearchIndexData {
 // front-end rebuild.
 const resolveHash = createHashResolver({
   label: "search index",
-  compiledHashes: (type) => contentIndexHashes.search[type as "articles" | "guides"],
-  pointerPath: (locale, type) => searchIndexPointerPath(type as "articles" | "guides", locale),
+  compiledHashes: (type) => contentIndexHashes.search[type as SearchType],
+  pointerPath: (locale, type) => searchIndexPointerPath(type as SearchType, locale),
   resolveUrl: assetsUrl
 });
 
-async function fetchSearchIndex(type: "articles" | "guides", locale: string): Promise<SearchIndexData> {
+async function fetchSearchIndex(type: SearchType, locale: string): Promise<SearchIndexData> {
   let hash: string;
   try {
     hash = await resolveHash(locale, type);
@@ -51,3 +60,61 @@ export async function getSearchIndex(locale: string): Promise<SearchIndexData> {
 export async function getGuidesSearchIndex(locale: string): Promise<SearchIndexData> {
   return fetchSearchIndex("guides", locale);
 }
+
+async function fetchJson<T>(path: string, what: string): Promise<T> {
+  const res = await fetch(assetsUrl(path));
+  if (!res.ok) {
+    throw new Error(`Failed to fetch ${what}`);
+  }
+  return res.json();
+}
+
+// Exact/stemmed search first, then a wildcard for partial prefix matches. An
+// invalid query (lunr throws on some syntax) just has no results.
+function lunrSearch(data: SearchIndexData): ContentSearch {
+  const index = lunr.Index.load(data.index);
+  return {
+    search: async (query) => {
+      try {
+        let results = index.search(query);
+        if (results.length === 0) {
+          results = index.search(`${query}*`);
+        }
+        return results.map((r) => r.ref);
+      } catch {
+        return [];
+      }
+    }
+  };
+}
+
+/**
+ * Load search for a content type in a locale.
+ *
+ * The default locale uses the sharded index this build writes, so opening
+ * search costs one small manifest and each query only fetches the shards its
+ * words start in. Every other locale uses the Lunr index its pointer names,
+ * since that is what the i18n repo publishes.
+ */
+async function loadContentSearch(type: SearchType, locale: string): Promise<ContentSearch> {
+  const shardedHash = locale === DEFAULT_LOCALE ? contentIndexHashes.shardedSearch[type][locale] : undefined;
+  if (shardedHash === undefined) {
+    return lunrSearch(await fetchSearchIndex(type, locale));
+  }
+
+  const manifest = await fetchJson<ShardedSearchManifest>(
+    shardedSearchIndexPath(type, locale, shardedHash),
+    `${type} search index`
+  );
+  return new ShardedSearch(manifest, (key, hash) =>
+    fetchJson<SearchShard>(searchShardPath(type, locale, key, hash), `${type} search shard`)
+  );
+}
+
+export async function getArticlesSearch(locale: string): Promise<ContentSearch> {
+  return loadContentSearch("articles", locale);
+}
+
+export async function getGuidesSearch(locale: string): Promise<ContentSearch> {
+  return loadContentSearch("guides", locale);
+}
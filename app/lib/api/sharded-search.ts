@@ -0,0 +1,142 @@
+import lunr from "lunr";
+import type { SearchShard, ShardedSearchManifest } from "@/lib/content/types";
+
+// The encoding this reader understands (SHARDED_SEARCH_FORMAT in
+// @jiki.io/content-renderer). A manifest in any other format is refused rather
+// than misread.
+const SUPPORTED_FORMAT = 1;
+
+// Query terms go through the same steps lunr's own search applies, so a query
+// matches the terms lunr's indexing pipeline stored.
+const queryPipeline = new lunr.Pipeline();
+queryPipeline.add(lunr.trimmer, lunr.stemmer);
+
+// A prefix is only trimmed: stemming "variab" would stop it matching "variabl"
+const prefixPipeline = new lunr.Pipeline();
+prefixPipeline.add(lunr.trimmer);
+
+interface DecodedShard {
+  terms: string[];
+  offsets: Uint32Array;
+  postings: Uint16Array;
+}
+
+interface QueryTerm {
+  term: string;
+  prefix: boolean;
+}
+
+function decodeBase64(base64: string): ArrayBuffer {
+  const binary = atob(base64);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return bytes.buffer;
+}
+
+function decodeShard(shard: SearchShard): DecodedShard {
+  return {
+    terms: shard.terms,
+    offsets: new Uint32Array(decodeBase64(shard.offsets)),
+    postings: new Uint16Array(decodeBase64(shard.postings))
+  };
+}
+
+function shardKey(term: string): string {
+  return term.codePointAt(0)!.toString(16);
+}
+
+// The index of the first term >= `term` (terms are sorted by code unit)
+function lowerBound(terms: string[], term: string): number {
+  let low = 0;
+  let high = terms.length;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (terms[mid] < term) {
+      low = mid + 1;
+    } else {
+      high = mid;
+    }
+  }
+  return low;
+}
+
+/**
+ * Search over a prefix-sharded index, fetching only the shards a query's terms
+ * start in (each at most once).
+ *
+ * Matches the lunr search it stands in for: a query is first looked up as
+ * whole, stemmed words and, if nothing matches, again with its last word
+ * treated as a prefix. Items matching any word are returned, best first.
+ */
+export class ShardedSearch {
+  private readonly shards = new Map<string, Promise<DecodedShard | null>>();
+
+  constructor(
+    private readonly manifest: ShardedSearchManifest,
+    private readonly fetchShard: (key: string, hash: string) => Promise<SearchShard>
+  ) {
+    if (manifest.format !== SUPPORTED_FORMAT) {
+      throw new Error(`Unsupported search index format: ${manifest.format}`);
+    }
+  }
+
+  async search(query: string): Promise<string[]> {
+    const words = lunr.tokenizer(query).map((token) => token.toString());
+    if (words.length === 0) {
+      return [];
+    }
+
+    const exact = words.flatMap((word) => queryPipeline.runString(word).map((term) => ({ term, prefix: false })));
+    const results = await this.run(exact);
+    if (results.length > 0) {
+      return results;
+    }
+
+    const prefix = prefixPipeline.runString(words[words.length - 1]).map((term) => ({ term, prefix: true }));
+    if (prefix.length === 0) {
+      return [];
+    }
+    return this.run([...exact.slice(0, -1), ...prefix]);
+  }
+
+  private async run(queryTerms: QueryTerm[]): Promise<string[]> {
+    const scores = new Map<number, number>();
+    const shards = await Promise.all(queryTerms.map(({ term }) => this.shard(shardKey(term))));
+
+    queryTerms.forEach(({ term, prefix }, i) => {
+      const shard = shards[i];
+      if (shard === null) {
+        return;
+      }
+      const first = lowerBound(shard.terms, term);
+      for (let t = first; t < shard.terms.length; t++) {
+        const matches = prefix ? shard.terms[t].startsWith(term) : shard.terms[t] === term;
+        if (!matches) {
+          break;
+        }
+        for (let p = shard.offsets[t]; p < shard.offsets[t + 1]; p += 2) {
+          const item = shard.postings[p];
+          scores.set(item, (scores.get(item) ?? 0) + shard.postings[p + 1]);
+        }
+      }
+    });
+
+    return [...scores]
+      .sort(([itemA, scoreA], [itemB, scoreB]) => scoreB - scoreA || itemA - itemB)
+      .map(([item]) => this.manifest.items[item].slug);
+  }
+
+  private shard(key: string): Promise<DecodedShard | null> {
+    let shard = this.shards.get(key);
+    if (shard === undefined) {
+      const hash = this.manifest.shards[key] as string | undefined;
+      shard = hash === undefined ? Promise.resolve(null) : this.fetchShard(key, hash).then(decodeShard);
+      // A failed fetch is retried on the next query rather than cached
+      shard.catch(() => this.shards.delete(key));
+      this.shards.set(key, shard);
+    }
+    return shard;
+  }
+}
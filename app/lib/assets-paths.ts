@@ -151,6 +151,16 @@ export function searchIndexPath(type: SearchType, locale: string, hash: string):
   return `/static/content/search/${type}/${locale}/index-${hash}.json`;
 }
 
+/** The entry point of a locale's prefix-sharded search index: result rows and shard hashes. */
+export function shardedSearchIndexPath(type: SearchType, locale: string, hash: string): string {
+  return `/static/content/search/${type}/${locale}/sharded-${hash}.json`;
+}
+
+/** One shard of a sharded search index, named by its key (a hex code point) and its hash. */
+export function searchShardPath(type: SearchType, locale: string, key: string, hash: string): string {
+  return `/static/content/search/${type}/${locale}/shards/${key}-${hash}.json`;
+}
+
 /**
  * Pointers for every remaining per-locale namespace.
  *
@@ -188,3 +188,24 @@ export interface SearchIndexData {
   index: object;
   items: Array<{ slug: string; title: string; excerpt: string }>;
 }
+
+/**
+ * The entry point of a prefix-sharded search index, built by
+ * @jiki.io/content-renderer's buildShardedSearchIndex: the result rows, and each
+ * shard's hash keyed by the hex code point its terms start with.
+ */
+export interface ShardedSearchManifest {
+  format: number;
+  items: SearchIndexData["items"];
+  shards: Record<string, string>;
+}
+
+/**
+ * One shard: a sorted term dictionary and, as base64 little-endian typed
+ * arrays, the Uint32 `offsets` into the Uint16 (item index, weight) `postings`.
+ */
+export interface SearchShard {
+  terms: string[];
+  offsets: string;
+  postings: string;
+}
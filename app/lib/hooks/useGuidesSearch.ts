@@ -1,12 +1,6 @@
 import { useState, useEffect, useCallback, useRef } from "react";
-import lunr from "lunr";
 import { useDebounce } from "./useDebounce";
-import { getGuidesSearchIndex } from "@/lib/api/content-search";
-
-interface SearchIndex {
-  index: lunr.Index;
-  items: Array<{ slug: string; title: string; excerpt: string }>;
-}
+import { getGuidesSearch, type ContentSearch } from "@/lib/api/content-search";
 
 interface UseGuidesSearchResult {
   searchQuery: string;
@@ -19,20 +13,18 @@ export function useGuidesSearch(locale: string): UseGuidesSearchResult {
   const [searchQuery, setSearchQuery] = useState("");
   const [searchResults, setSearchResults] = useState<string[] | null>(null);
   const [isLoading, setIsLoading] = useState(false);
-  const indexRef = useRef<SearchIndex | null>(null);
+  const indexRef = useRef<ContentSearch | null>(null);
   const debouncedQuery = useDebounce(searchQuery, 300);
 
   // Load search index on demand
-  const loadIndex = useCallback(async (): Promise<SearchIndex> => {
+  const loadIndex = useCallback(async (): Promise<ContentSearch> => {
     if (indexRef.current) {
       return indexRef.current;
     }
 
     setIsLoading(true);
     try {
-      const data = await getGuidesSearchIndex(locale);
-      const index = lunr.Index.load(data.index);
-      indexRef.current = { index, items: data.items };
+      indexRef.current = await getGuidesSearch(locale);
       return indexRef.current;
     } finally {
       setIsLoading(false);
@@ -48,14 +40,10 @@ export function useGuidesSearch(locale: string): UseGuidesSearchResult {
 
     const performSearch = async () => {
       const searchIndex = await loadIndex();
-
       try {
-        let results = searchIndex.index.search(debouncedQuery);
-        if (results.length === 0) {
-          results = searchIndex.index.search(`${debouncedQuery}*`);
-        }
-        setSearchResults(results.map((r) => r.ref));
+        setSearchResults(await searchIndex.search(debouncedQuery));
       } catch {
+        // A shard that failed to load is retried on the next query
         setSearchResults([]);
       }
     };
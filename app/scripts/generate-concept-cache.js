@@ -29,7 +29,8 @@ import fs from "fs";
 import path from "path";
 import { fileURLToPath } from "url";
 import { computeHash, writeFile } from "./lib/cache-utils.js";
-import { parseFrontmatter, renderMarkdown } from "@jiki.io/content-renderer";
+import { openRenderCache } from "./lib/render-cache.js";
+import { parseFrontmatter, registeredLanguages, renderMarkdown } from "@jiki.io/content-renderer";
 
 // Markdown to HTML (marked config, the jikiscript/javascript highlight.js
 // grammars, and the <define>/<literal> strip) lives in @jiki.io/content-renderer
@@ -44,6 +45,9 @@ const STATIC_DIR = path.join(__dirname, "../public/static/concepts");
 const GENERATED_DIR = path.join(__dirname, "../lib/generated");
 const ICONS_DIR = path.join(__dirname, "../public/static/icons/concepts");
 
+// Renders from the previous build, reused for unchanged concepts (see lib/render-cache.js)
+const renderCache = openRenderCache("concepts", registeredLanguages());
+
 // English. Its index hash is compiled into the worker and its artifacts ship
 // with the deploy, so it has no pointer and never needs one.
 const DEFAULT_LOCALE = "en";
@@ -182,7 +186,7 @@ function processConcepts() {
         // Render markdown to HTML for non-category concepts
         let html = null;
         if (!config.category) {
-          html = renderMarkdown(markdown);
+          html = renderCache.render(markdown, () => ({ html: renderMarkdown(markdown) })).html;
         } else if (markdown.trim()) {
           console.warn(`   Warning: category concept "${slug}" has body content in ${file.name} — it will be ignored`);
         }
@@ -345,6 +349,7 @@ function generateConceptCache() {
   // Write the fingerprinted-icon manifest consumed by ConceptIcon.tsx
   const fallbackUrl = copyHashedIcon("fallback", path.join(ICONS_DIR, "fallback.webp"));
   writeIconManifest(fallbackUrl);
+  renderCache.save();
 
   // Count totals
   const conceptCount = Object.keys(concepts).length;
@@ -361,6 +366,7 @@ function generateConceptCache() {
   console.log(`   Concepts: ${conceptCount}`);
   console.log(`   Locales: ${Object.keys(copyHashes).join(", ")}`);
   console.log(`   Content files: ${contentFileCount}`);
+  console.log(`   Rendered: ${renderCache.stats.rendered} (reused ${renderCache.stats.reused} from the last build)`);
   console.log(`   Output: ${STATIC_DIR}\n`);
 }
 
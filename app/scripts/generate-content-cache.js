@@ -18,6 +18,11 @@
  *   public/static/content/search/{type}/{locale}/index-{hash}.json
  *     - Lunr search indexes for articles + guides
  *
+ *   public/static/content/search/{type}/{locale}/sharded-{hash}.json
+ *   public/static/content/search/{type}/{locale}/shards/{key}-{hash}.json
+ *     - The same indexes split by the first character of each term, so search
+ *       only fetches the shards a query needs
+ *
  *   public/static/content/structure-{hash}.json
  *     - Locale-invariant post metadata: date, author, cover image, and the
  *       featured/listed/premium/order flags, all from English config, plus the
@@ -59,10 +64,13 @@ import path from "path";
 import crypto from "crypto";
 import { fileURLToPath } from "url";
 import { computeHash, writeFile } from "./lib/cache-utils.js";
+import { openRenderCache } from "./lib/render-cache.js";
 import {
   buildSearchIndex,
+  buildShardedSearchIndex,
   parseFrontmatter,
   postImageUrl,
+  registeredPostLanguages,
   renderPost,
   rewriteImageRefs
 } from "@jiki.io/content-renderer";
@@ -139,6 +147,38 @@ function hashAndCopyImage(imageRef) {
   return url;
 }
 
+const renderCache = openRenderCache("posts", registeredPostLanguages());
+
+/**
+ * Render a post body, reusing the previous build's HTML when the body is
+ * unchanged (see lib/render-cache.js).
+ *
+ * The HTML embeds the fingerprinted URL of every image it references, so a
+ * cached render also records those URLs. Re-resolving them on a hit copies the
+ * images into this build's output, and an image whose bytes have changed since
+ * gets a new URL, which forces a fresh render.
+ */
+function renderPostCached(markdown) {
+  const { html } = renderCache.render(
+    markdown,
+    () => {
+      const images = {};
+      const html = renderPost(markdown, {
+        resolveImage: (imageRef) => {
+          const url = hashAndCopyImage(imageRef);
+          if (url !== imageRef) {
+            images[imageRef] = url;
+          }
+          return url;
+        }
+      });
+      return { html, images };
+    },
+    (entry) => Object.entries(entry.images).every(([imageRef, url]) => hashAndCopyImage(imageRef) === url)
+  );
+  return html;
+}
+
 /**
  * Rewrite image paths ("/images/...") to their fingerprinted URLs. Handles both
  * markdown images (![alt](/images/...)) and raw <img src="/images/..."> tags,
@@ -246,7 +286,7 @@ function processContentDir(type, requiredFields, extraFields) {
         // Pre-render markdown to HTML. renderPost applies the same image rewrite
         // itself (it is inside the byte contract), which is a no-op the second
         // time because a rewritten ref no longer starts with "/images/".
-        const html = renderPost(parsed.body, { resolveImage: hashAndCopyImage });
+        const html = renderPostCached(parsed.body);
 
         // Hash based on all inputs that affect the output
         const hashInput = crypto.createHash("sha256");
@@ -473,7 +513,7 @@ function processProjects() {
           const frontmatter = parsed.data;
           // renderPost applies the /images/ rewrite itself, and the resolver
           // copies each referenced image into the cache as it goes.
-          const html = renderPost(parsed.body, { resolveImage: hashAndCopyImage });
+          const html = renderPostCached(parsed.body);
 
           const summary = normalizeEpisodeSummary(frontmatter.summary, `${filePath}`);
 
@@ -696,36 +736,34 @@ function buildStaticFiles(type, content) {
 }
 
 /**
- * Generate Lunr search indexes for a content type (one per locale).
+ * Generate search indexes for a content type (one per locale).
  *
  * `type` is the filename prefix (e.g. "articles", "guides"). `filterFn` selects
  * which entries to index (articles index only `listed` ones; guides index all,
- * including premium ones so premium guides remain searchable). The JSON shape is
- * shared across types: { index, items }.
+ * including premium ones so premium guides remain searchable). Each locale gets
+ * both a Lunr index, shaped { index, items } for every type, and a sharded one
+ * (a manifest plus one file per shard).
  *
- * Returns search index hashes per locale.
+ * Returns the Lunr index and sharded manifest hashes per locale.
  */
 function generateSearchIndexes(type, byLocale, filterFn) {
   const searchHashes = {};
+  const shardedHashes = {};
 
   for (const [locale, entries] of Object.entries(byLocale)) {
-    const items = entries.filter(filterFn);
-
     // Built by @jiki.io/content-renderer, because a search index is derived
     // entirely from translated copy and so is published by the i18n repo for
     // every non-English locale. Field order, boosts and the lunr version are all
     // part of the bytes, so they live in the package both repos pin.
-    const output = JSON.stringify(
-      buildSearchIndex(
-        items.map((item) => ({
-          slug: item.slug,
-          title: item.title,
-          excerpt: item.excerpt,
-          description: item.seo.description,
-          keywords: item.seo.keywords.join(" ")
-        }))
-      )
-    );
+    const items = entries.filter(filterFn).map((item) => ({
+      slug: item.slug,
+      title: item.title,
+      excerpt: item.excerpt,
+      description: item.seo.description,
+      keywords: item.seo.keywords.join(" ")
+    }));
+
+    const output = JSON.stringify(buildSearchIndex(items));
     const searchHash = computeHash(output);
     searchHashes[locale] = searchHash;
 
@@ -738,22 +776,36 @@ function generateSearchIndexes(type, byLocale, filterFn) {
       );
     }
     console.log(`   Search index: search/${type}/${locale}/index-${searchHash}.json (${items.length} ${type})`);
+
+    // Each shard's manifest hash is already the hash of its bytes
+    const { manifest, shards } = buildShardedSearchIndex(items);
+    for (const [key, shard] of Object.entries(shards)) {
+      writeFile(
+        path.join(STATIC_DIR, "search", type, locale, "shards", `${key}-${manifest.shards[key]}.json`),
+        JSON.stringify(shard)
+      );
+    }
+    const manifestOutput = JSON.stringify(manifest);
+    const shardedHash = computeHash(manifestOutput);
+    shardedHashes[locale] = shardedHash;
+    writeFile(path.join(STATIC_DIR, "search", type, locale, `sharded-${shardedHash}.json`), manifestOutput);
+    const shardCount = Object.keys(shards).length;
+    console.log(`   Sharded search index: search/${type}/${locale}/sharded-${shardedHash}.json (${shardCount} shards)`);
   }
 
-  return searchHashes;
+  return { searchHashes, shardedHashes };
 }
 
 /**
  * Write the TypeScript hash manifest.
  *
- * Four kinds of hash: the search indexes, the per-locale post copy this repo
- * writes for local dev, the English project and testimonial copy catalogs, and
- * the one locale-invariant structure hash. Only the default locale is ever read
+ * Four kinds of hash: the search indexes (Lunr and sharded), the per-locale
+ * post copy this repo writes for local dev, the English project and testimonial
+ * copy catalogs, and the one locale-invariant structure hash. Only the default locale is ever read
  * from the per-locale maps at runtime; the rest resolve through their pointers.
  */
 function writeHashManifest(
-  searchHashes,
-  guideSearchHashes,
+  { articles: articleSearch, guides: guideSearch },
   { copyHashes, structureHash, projectCopyHash, testimonialsCopyHash }
 ) {
   function formatEntries(hashes) {
@@ -771,16 +823,25 @@ function writeHashManifest(
 // entries are kept because they are what a local build without R2 runs on.
 export const contentIndexHashes: {
   search: { articles: Record<string, string>; guides: Record<string, string> };
+  shardedSearch: { articles: Record<string, string>; guides: Record<string, string> };
   copy: Record<string, string>;
   projects: Record<string, string>;
   testimonials: Record<string, string>;
 } = {
   search: {
     articles: {
-${formatEntries(searchHashes)},
+${formatEntries(articleSearch.searchHashes)},
     },
     guides: {
-${formatEntries(guideSearchHashes)},
+${formatEntries(guideSearch.searchHashes)},
+    },
+  },
+  shardedSearch: {
+    articles: {
+${formatEntries(articleSearch.shardedHashes)},
+    },
+    guides: {
+${formatEntries(guideSearch.shardedHashes)},
     },
   },
   copy: {
@@ -1032,8 +1093,10 @@ function generateContentCache() {
 
   // Generate search indexes. Articles index only `listed` ones; guides index all
   // (including premium guides, which stay searchable but are kept out of the sitemap).
-  const searchHashes = generateSearchIndexes("articles", articlesByLocale, (a) => a.listed);
-  const guideSearchHashes = generateSearchIndexes("guides", guidesByLocale, () => true);
+  const searchHashes = {
+    articles: generateSearchIndexes("articles", articlesByLocale, (a) => a.listed),
+    guides: generateSearchIndexes("guides", guidesByLocale, () => true)
+  };
 
   // Write the per-locale metadata artifacts, then the hash manifest naming them
   const contentMeta = writeContentMeta(
@@ -1044,11 +1107,12 @@ function generateContentCache() {
     testimonials.structure
   );
   const testimonialsCopyHash = writeTestimonialCopy(testimonials.copy);
-  writeHashManifest(searchHashes, guideSearchHashes, {
+  writeHashManifest(searchHashes, {
     ...contentMeta,
     projectCopyHash,
     testimonialsCopyHash
   });
+  renderCache.save();
 
   // Count totals
   let contentFileCount = 0;
@@ -1075,6 +1139,7 @@ function generateContentCache() {
   console.log(`   Testimonials: ${Object.keys(testimonials.copy.quotes).length} quotes (en)`);
   console.log(`   Project episodes: ${episodeCount} (locale-files)`);
   console.log(`   Content files: ${contentFileCount}`);
+  console.log(`   Rendered: ${renderCache.stats.rendered} (reused ${renderCache.stats.reused} from the last build)`);
   console.log(
     `   Locales: ${[
       ...new Set([...Object.keys(blogByLocale), ...Object.keys(articlesByLocale), ...Object.keys(guidesByLocale)])
@@ -0,0 +1,109 @@
+/**
+ * A content-addressed cache of rendered Markdown, kept between builds.
+ *
+ * Rendering is the slow part of the content and concept cache builds, yet most
+ * builds (and every `content:watch` run) change a handful of documents at most.
+ * So each render is stored under the hash of its source, in a cache file that
+ * is only trusted while the renderer is unchanged: the file records a
+ * fingerprint of RENDERER_VERSION, the pipeline's highlight.js grammar set and
+ * the installed renderer's own code (so rebuilding the workspace package
+ * without a version bump can't serve stale HTML), and is thrown away when that
+ * fingerprint moves.
+ *
+ * Output trees are still wiped and rewritten on every build. Only the renders
+ * are reused, so a cache hit produces exactly the bytes a render would.
+ *
+ * Lives under node_modules/.cache, like other build tools' caches. Set
+ * JIKI_RENDER_CACHE=0 to render everything from scratch.
+ */
+
+import fs from "fs";
+import path from "path";
+import crypto from "crypto";
+import { fileURLToPath } from "url";
+import { RENDERER_VERSION } from "@jiki.io/content-renderer";
+import { writeFile } from "./cache-utils.js";
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const CACHE_DIR = path.join(__dirname, "../../node_modules/.cache/jiki-render");
+const ENABLED = process.env.JIKI_RENDER_CACHE !== "0";
+
+function sha256(...parts) {
+  const hash = crypto.createHash("sha256");
+  for (const part of parts) {
+    hash.update(part);
+    hash.update("\0");
+  }
+  return hash.digest("hex");
+}
+
+/**
+ * Hash the installed renderer's compiled code, so a local change to the
+ * workspace package invalidates the cache even before its version is bumped.
+ */
+function rendererCodeHash() {
+  const entry = fileURLToPath(import.meta.resolve("@jiki.io/content-renderer"));
+  const dir = path.dirname(entry);
+  const files = fs
+    .readdirSync(dir)
+    .filter((name) => name.endsWith(".js"))
+    .sort();
+  return sha256(...files.flatMap((name) => [name, fs.readFileSync(path.join(dir, name))]));
+}
+
+/**
+ * Open the render cache for one pipeline ("posts" or "concepts").
+ *
+ * `grammars` is the pipeline's registered highlight.js language list.
+ * Call `save()` once the build has succeeded; entries not used by this build
+ * are dropped, so the file never outgrows the content.
+ */
+export function openRenderCache(pipeline, grammars) {
+  const cachePath = path.join(CACHE_DIR, `${pipeline}.json`);
+  const fingerprint = sha256(RENDERER_VERSION, grammars.join(","), rendererCodeHash());
+
+  let previous = {};
+  if (ENABLED && fs.existsSync(cachePath)) {
+    try {
+      const stored = JSON.parse(fs.readFileSync(cachePath, "utf-8"));
+      if (stored.fingerprint === fingerprint) {
+        previous = stored.entries;
+      }
+    } catch {
+      // A corrupt cache is just an empty one
+    }
+  }
+
+  const entries = {};
+  const stats = { reused: 0, rendered: 0 };
+
+  return {
+    stats,
+
+    /**
+     * Return the cached entry for `source`, or the result of `render()` (which
+     * must be JSON-serialisable). `isFresh(entry)` may reject a cached entry
+     * whose output depends on more than the source, e.g. on image bytes.
+     */
+    render(source, render, isFresh = () => true) {
+      const key = sha256(source);
+      const cached = entries[key] ?? previous[key];
+      if (cached !== undefined && isFresh(cached)) {
+        entries[key] = cached;
+        stats.reused++;
+        return cached;
+      }
+
+      const entry = render();
+      entries[key] = entry;
+      stats.rendered++;
+      return entry;
+    },
+
+    save() {
+      if (ENABLED) {
+        writeFile(cachePath, JSON.stringify({ fingerprint, entries }));
+      }
+    }
+  };
+}
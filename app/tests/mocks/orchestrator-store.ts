@@ -45,6 +45,7 @@ export function createMockOrchestratorStore(overrides: Partial<OrchestratorStore
 
       // Test results state
       testSuiteResult: null,
+      pendingTestResults: [],
       shouldPlayOnTestChange: true,
 
       // Frame navigation state
@@ -129,6 +130,7 @@ export function createMockOrchestratorStore(overrides: Partial<OrchestratorStore
 
       // Test results actions
       setTestSuiteResult: jest.fn(),
+      setPendingTestResults: jest.fn(),
       setShouldPlayOnTestChange: jest.fn(),
 
       // Play/pause action
@@ -0,0 +1,41 @@
+import { FrameIndex } from "@/components/coding-exercise/lib/orchestrator/FrameIndex";
+
+import { createMockFrame } from "@/tests/mocks";
+
+describe("FrameIndex", () => {
+  const frames = [
+    createMockFrame(0, { line: 1 }),
+    createMockFrame(100000, { line: 2 }),
+    createMockFrame(200000, { line: 3 }),
+    createMockFrame(300000, { line: 2 }),
+    createMockFrame(400000, { line: 4 })
+  ];
+
+  it("binary searches frame times", () => {
+    const index = FrameIndex.for(frames, []);
+    expect(index.firstAtOrAfter(100000)).toBe(1);
+    expect(index.firstAfter(100000)).toBe(2);
+    expect(index.firstAtOrAfter(150000)).toBe(2);
+    expect(index.firstAfter(500000)).toBe(frames.length);
+    expect(index.firstAtOrAfter(-1)).toBe(0);
+  });
+
+  it("skips folded lines in both directions", () => {
+    const index = FrameIndex.for(frames, [2]);
+    expect(index.nextVisibleIdx(1)).toBe(2);
+    expect(index.nextVisibleIdx(3)).toBe(4);
+    expect(index.prevVisibleIdx(3)).toBe(2);
+    expect(index.prevVisibleIdx(1)).toBe(0);
+  });
+
+  it("returns undefined when every remaining frame is folded", () => {
+    const index = FrameIndex.for(frames, [4]);
+    expect(index.nextVisibleIdx(4)).toBeUndefined();
+    expect(index.prevVisibleIdx(-1)).toBeUndefined();
+  });
+
+  it("rebuilds the folded tables when the folds change", () => {
+    expect(FrameIndex.for(frames, [3]).nextVisibleIdx(2)).toBe(3);
+    expect(FrameIndex.for(frames, []).nextVisibleIdx(2)).toBe(2);
+  });
+});
@@ -4,6 +4,7 @@ import * as localStorage from "@/components/coding-exercise/lib/localStorage";
 import { createMockAnimationTimeline, createMockFrame } from "@/tests/mocks";
 import { createMockExercise } from "@/tests/mocks/exercise";
 import { makeTestOrchestrator } from "@/tests/test-utils/makeTestOrchestrator";
+import { VisualExercise } from "@jiki/curriculum";
 import { renderHook } from "@testing-library/react";
 
 // Mock localStorage functions
@@ -12,6 +13,12 @@ jest.mock("@/components/coding-exercise/lib/localStorage", () => ({
   saveCodeMirrorContent: jest.fn()
 }));
 
+jest.mock("@/components/coding-exercise/lib/test-runner/getInterpreter", () => ({
+  getInterpreter: jest.fn().mockResolvedValue({
+    compile: jest.fn().mockReturnValue({ success: true, lintErrors: [] })
+  })
+}));
+
 const mockLoadCodeMirrorContent = localStorage.loadCodeMirrorContent as jest.MockedFunction<
   typeof localStorage.loadCodeMirrorContent
 >;
@@ -878,4 +885,21 @@ describe("Orchestrator", () => {
       expect(submittedCode).not.toBeNull();
     });
   });
+
+  describe("lintCode", () => {
+    it("gets the exercise's functions from one headless instance", async () => {
+      const orchestrator = makeTestOrchestrator(createMockExercise());
+      const attachedViews = () => document.querySelectorAll(".exercise-test-exercise").length;
+      const viewsBefore = attachedViews();
+      const createHeadless = jest.spyOn(VisualExercise, "createHeadless");
+
+      await orchestrator.lintCode("move()");
+      await orchestrator.lintCode("move()\nmove()");
+
+      expect(createHeadless).toHaveBeenCalledTimes(1);
+      expect(attachedViews()).toBe(viewsBefore);
+      expect(orchestrator.getStore().getState().lintErrors).toEqual([]);
+      createHeadless.mockRestore();
+    });
+  });
 });
@@ -107,7 +107,29 @@ describe("TestSuiteManager", () => {
 
       await manager.runCode(mockCode, mockExercise);
 
-      expect(runTests).toHaveBeenCalledWith(mockCode, mockExercise, "javascript", {}, {});
+      expect(runTests).toHaveBeenCalledWith(mockCode, mockExercise, "javascript", {}, {}, {
+        onTestResult: expect.any(Function),
+        signal: expect.any(AbortSignal)
+      });
+    });
+
+    it("publishes each scenario's result to the store as it finishes", async () => {
+      const manager = buildManager({ type: "lesson", slug: "maze-solve-basic" });
+
+      const { runTests } = await import("@/components/coding-exercise/lib/test-runner/runTests");
+      const first = { slug: "first", status: "pass" };
+      const second = { slug: "second", status: "fail" };
+      (runTests as jest.Mock).mockImplementation(async (...args: any[]) => {
+        const { onTestResult } = args[5];
+        onTestResult(first, 0);
+        onTestResult(second, 1);
+        return { tests: [first, second], passed: false };
+      });
+
+      await manager.runCode(mockCode, mockExercise);
+
+      const { setPendingTestResults } = mockStore.getState();
+      expect((setPendingTestResults as jest.Mock).mock.calls).toEqual([[[]], [[first]], [[first, second]]]);
     });
 
     it("does not block test execution when submission fails", async () => {
@@ -221,6 +243,29 @@ describe("TestSuiteManager", () => {
       expect(mockStore.getState().setUnderlineRange).toHaveBeenCalledWith(undefined);
     });
 
+    it("aborts a run superseded by a newer one and leaves the state to it", async () => {
+      const manager = buildManager({ type: "lesson", slug: "maze-solve-basic" });
+
+      const { runTests } = await import("@/components/coding-exercise/lib/test-runner/runTests");
+      const stale = { tests: [], passed: false };
+      const fresh = { tests: [], passed: true };
+      let finishFirst: (result: typeof stale) => void = () => {};
+      (runTests as jest.Mock)
+        .mockReturnValueOnce(new Promise((resolve) => (finishFirst = resolve)))
+        .mockResolvedValueOnce(fresh);
+
+      const first = manager.runCode(mockCode, mockExercise);
+      await flushMicrotasks();
+      await manager.runCode(mockCode, mockExercise);
+      finishFirst(stale);
+      await first;
+
+      const firstSignal: AbortSignal = (runTests as jest.Mock).mock.calls[0][5].signal;
+      expect(firstSignal.aborted).toBe(true);
+      expect(mockStore.getState().setTestSuiteResult).toHaveBeenCalledTimes(1);
+      expect(mockStore.getState().setTestSuiteResult).toHaveBeenCalledWith(fresh);
+    });
+
     it("rethrows non-syntax errors in test/dev so they surface in the overlay", async () => {
       const manager = buildManager({ type: "lesson", slug: "maze-solve-basic" });
 
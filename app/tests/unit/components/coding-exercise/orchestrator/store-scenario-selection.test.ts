@@ -275,3 +275,27 @@ describe("setCurrentTest isPlaying reset", () => {
     expect(state.currentTest?.slug).toBe("test-2");
   });
 });
+
+describe("setCurrentTest while a suite is running", () => {
+  it("indexes the test among the results streamed in so far", () => {
+    const exercise = createMockExercise({
+      slug: "maze-solve-basic",
+      stubs: { javascript: "", python: "", jikiscript: "" }
+    });
+    const orchestrator = makeTestOrchestrator(exercise);
+    const store = orchestrator.getStore();
+    const frames = [createMockFrame(0, { line: 1 })];
+
+    store
+      .getState()
+      .setTestSuiteResult(createMockTestSuiteResult([createMockTestResult({ slug: "old", status: "fail", frames })]));
+    const first = createMockTestResult({ slug: "first", status: "pass", frames });
+    const second = createMockTestResult({ slug: "second", status: "fail", frames });
+    store.setState({ status: "running", pendingTestResults: [first, second] });
+
+    orchestrator.setCurrentTest(second);
+
+    expect(store.getState().currentTest).toBe(second);
+    expect(store.getState().currentTestIdx).toBe(1);
+  });
+});
@@ -0,0 +1,90 @@
+import { FRAME_WINDOW_THRESHOLD, windowFrames } from "@/components/coding-exercise/lib/test-runner/frameWindow";
+import type { Frame } from "@jiki/interpreters/shared";
+
+function buildFrames(count: number): Frame[] {
+  return Array.from({ length: count }, (_, idx) => {
+    const frame: Frame = {
+      line: (idx % 3) + 1,
+      code: "x = x + 1",
+      status: "SUCCESS",
+      time: idx,
+      timeInMs: idx / 1000,
+      result: { value: idx },
+      context: { type: "ExpressionStatement" },
+      generateDescription: () => `frame ${idx}`
+    };
+    return frame;
+  });
+}
+
+describe("windowFrames", () => {
+  it("leaves short runs untouched", () => {
+    const frames = buildFrames(10);
+    const rerun = jest.fn(() => buildFrames(10));
+
+    windowFrames(frames, rerun);
+
+    expect(frames[5].result).toEqual({ value: 5 });
+    expect(frames[5].generateDescription()).toBe("frame 5");
+    expect(rerun).not.toHaveBeenCalled();
+  });
+
+  it("drops detail from the middle of long runs but keeps the edges", () => {
+    const count = FRAME_WINDOW_THRESHOLD + 1000;
+    const frames = buildFrames(count);
+
+    windowFrames(frames, () => buildFrames(count));
+
+    expect(frames[0].result).toEqual({ value: 0 });
+    expect(frames[count - 1].result).toEqual({ value: count - 1 });
+    expect(frames[2000].result).toBeUndefined();
+    expect(frames[2000].context).toBeUndefined();
+    expect(frames[2000].time).toBe(2000);
+  });
+
+  it("rebuilds descriptions by re-running, once per window", () => {
+    const count = FRAME_WINDOW_THRESHOLD + 1000;
+    const frames = buildFrames(count);
+    const rerun = jest.fn(() => buildFrames(count));
+
+    windowFrames(frames, rerun);
+
+    expect(frames[2000].generateDescription()).toBe("frame 2000");
+    expect(frames[2001].generateDescription()).toBe("frame 2001");
+    expect(rerun).toHaveBeenCalledTimes(1);
+  });
+
+  it("returns no description when the re-run diverges", () => {
+    const count = FRAME_WINDOW_THRESHOLD + 1000;
+    const frames = buildFrames(count);
+
+    windowFrames(frames, () => buildFrames(10));
+
+    expect(frames[2000].generateDescription()).toBe("");
+  });
+
+  it("returns no description when the re-run has the same steps but different values", () => {
+    const count = FRAME_WINDOW_THRESHOLD + 1000;
+    const frames = buildFrames(count);
+    const rerunFrames = buildFrames(count);
+    rerunFrames[2000].result = { value: 7 };
+
+    windowFrames(frames, () => rerunFrames);
+
+    expect(frames[2000].generateDescription()).toBe("");
+    expect(frames[2001].generateDescription()).toBe("frame 2001");
+  });
+
+  it("returns no description for frames past where a re-run was stopped", () => {
+    const count = FRAME_WINDOW_THRESHOLD + 1000;
+    const frames = buildFrames(count);
+    const rerunFrames = buildFrames(2001);
+    rerunFrames[2000].status = "ERROR";
+
+    windowFrames(frames, () => rerunFrames);
+
+    expect(frames[1999].generateDescription()).toBe("frame 1999");
+    expect(frames[2000].generateDescription()).toBe("");
+    expect(frames[2001].generateDescription()).toBe("");
+  });
+});
@@ -179,6 +179,58 @@ describe("runTests", () => {
       expect(result.passed).toBe(true);
     });
 
+    it("should stream each result as its scenario finishes", async () => {
+      (mockJikiscript.interpret as jest.Mock).mockReturnValue({
+        frames: [{ time: 100000, timeInMs: 100, status: "SUCCESS", line: 1 }],
+        value: undefined,
+        status: "SUCCESS",
+        lintErrors: []
+      });
+
+      const onTestResult = jest.fn();
+      const result = await runTests("move()", testExercise, "jikiscript", {}, {}, { onTestResult });
+
+      expect(onTestResult).toHaveBeenCalledTimes(2);
+      expect(onTestResult).toHaveBeenNthCalledWith(1, result.tests[0], 0);
+      expect(onTestResult).toHaveBeenNthCalledWith(2, result.tests[1], 1);
+    });
+
+    it("should stop at the next scenario once aborted", async () => {
+      (mockJikiscript.interpret as jest.Mock).mockReturnValue({
+        frames: [{ time: 100000, timeInMs: 100, status: "SUCCESS", line: 1 }],
+        value: undefined,
+        status: "SUCCESS",
+        lintErrors: []
+      });
+
+      const controller = new AbortController();
+      const onTestResult = jest.fn(() => controller.abort(new Error("superseded")));
+      await expect(
+        runTests("move()", testExercise, "jikiscript", {}, {}, { onTestResult, signal: controller.signal })
+      ).rejects.toThrow("superseded");
+
+      expect(onTestResult).toHaveBeenCalledTimes(1);
+      expect(mockJikiscript.interpret).toHaveBeenCalledTimes(1);
+    });
+
+    it("should give each run a wall-clock budget", async () => {
+      (mockJikiscript.interpret as jest.Mock).mockReturnValue({
+        frames: [{ time: 100000, timeInMs: 100, status: "SUCCESS", line: 1 }],
+        value: undefined,
+        status: "SUCCESS",
+        lintErrors: []
+      });
+
+      await runTests("move()", testExercise, "jikiscript", {}, {});
+
+      expect(mockJikiscript.compile).toHaveBeenCalledWith(
+        "move()",
+        expect.objectContaining({
+          languageFeatures: expect.objectContaining({ maxWallClockTimeMs: 5000 })
+        })
+      );
+    });
+
     it("should set codeRun to the student code for each test", async () => {
       const mockFrames = [{ time: 100000, timeInMs: 100, status: "SUCCESS", line: 1 }];
 
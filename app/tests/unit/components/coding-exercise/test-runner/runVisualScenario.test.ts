@@ -509,6 +509,46 @@ describe("runVisualScenario", () => {
         })
       );
     });
+
+    it("should only drop frame detail from long runs that can be re-run with the same seed", () => {
+      const longRun = () => ({
+        frames: Array.from({ length: 6000 }, (_, idx) => ({ time: idx, line: 1, status: "SUCCESS", result: { idx } })),
+        logLines: [],
+        meta: { sourceCode: "move()" }
+      });
+      const baseScenario: VisualScenario = {
+        slug: "long-run",
+        name: "Long Run",
+        description: "Test with a long run",
+        taskId: "task-1",
+        expectations: jest.fn().mockReturnValue([{ pass: true, errorHtml: undefined }])
+      };
+      const interpreter = createMockInterpreter({ interpret: jest.fn(longRun) });
+
+      const unseeded = runVisualScenario(
+        baseScenario,
+        "move()",
+        MockExercise as any,
+        "jikiscript",
+        interpreter,
+        undefined,
+        {},
+        {}
+      );
+      const seeded = runVisualScenario(
+        { ...baseScenario, randomSeed: 42 },
+        "move()",
+        MockExercise as any,
+        "jikiscript",
+        interpreter,
+        undefined,
+        {},
+        {}
+      );
+
+      expect(unseeded.frames[3000].result).toEqual({ idx: 3000 });
+      expect(seeded.frames[3000].result).toBeUndefined();
+    });
   });
 
   describe("functionCall support", () => {
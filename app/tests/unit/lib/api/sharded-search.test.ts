@@ -0,0 +1,86 @@
+import { ShardedSearch } from "@/lib/api/sharded-search";
+import type { SearchShard, ShardedSearchManifest } from "@/lib/content/types";
+
+// Shards are hand-built here in the encoding @jiki.io/content-renderer writes
+// (its own tests cover building them from content): sorted, stemmed terms, and
+// (item index, weight) postings located by per-term offsets.
+
+function encode(array: Uint16Array | Uint32Array): string {
+  return Buffer.from(array.buffer).toString("base64");
+}
+
+function shard(terms: string[], postings: number[][]): SearchShard {
+  const offsets = [0];
+  for (const pairs of postings) {
+    offsets.push(offsets[offsets.length - 1] + pairs.length);
+  }
+  return {
+    terms,
+    offsets: encode(Uint32Array.from(offsets)),
+    postings: encode(Uint16Array.from(postings.flat()))
+  };
+}
+
+const shards: Record<string, SearchShard> = {
+  // "l"
+  "6c": shard(["list", "loop"], [[2, 50], [0, 300, 1, 100]]),
+  // "v"
+  "76": shard(["variabl"], [[1, 400]])
+};
+
+const manifest: ShardedSearchManifest = {
+  format: 1,
+  items: [
+    { slug: "loops", title: "Loops", excerpt: "" },
+    { slug: "loop-variables", title: "Loop variables", excerpt: "" },
+    { slug: "lists", title: "Lists", excerpt: "" }
+  ],
+  shards: { "6c": "hash-l", "76": "hash-v" }
+};
+
+function setup() {
+  const fetchShard = jest.fn(async (key: string, _hash: string) => shards[key]);
+  return { search: new ShardedSearch(manifest, fetchShard), fetchShard };
+}
+
+describe("ShardedSearch", () => {
+  it("matches stemmed words and ranks by summed weight", async () => {
+    const { search } = setup();
+    expect(await search.search("loops")).toEqual(["loops", "loop-variables"]);
+    expect(await search.search("loop variables")).toEqual(["loop-variables", "loops"]);
+  });
+
+  it("only fetches the shards a query's words start in, once each", async () => {
+    const { search, fetchShard } = setup();
+    await search.search("loops");
+    await search.search("looping");
+    expect(fetchShard).toHaveBeenCalledTimes(1);
+    expect(fetchShard).toHaveBeenCalledWith("6c", "hash-l");
+  });
+
+  it("falls back to a prefix match on the last word", async () => {
+    const { search } = setup();
+    expect(await search.search("lo")).toEqual(["loops", "loop-variables"]);
+    expect(await search.search("li")).toEqual(["lists"]);
+  });
+
+  it("finds nothing for words with no shard, without fetching", async () => {
+    const { search, fetchShard } = setup();
+    expect(await search.search("zebra")).toEqual([]);
+    expect(await search.search("   ")).toEqual([]);
+    expect(fetchShard).not.toHaveBeenCalled();
+  });
+
+  it("retries a shard whose fetch failed", async () => {
+    const { search, fetchShard } = setup();
+    fetchShard.mockRejectedValueOnce(new Error("offline"));
+    await expect(search.search("loops")).rejects.toThrow("offline");
+    expect(await search.search("loops")).toEqual(["loops", "loop-variables"]);
+  });
+
+  it("refuses a manifest in another format", () => {
+    expect(() => new ShardedSearch({ ...manifest, format: 2 }, jest.fn())).toThrow(
+      "Unsupported search index format: 2"
+    );
+  });
+});
@@ -50,7 +50,17 @@ import { stripInlineTags } from "./shared.js";
 
 export { isSupportedLanguage, registeredLanguages } from "./highlighting.js";
 export { contentHash, stripInlineTags } from "./shared.js";
-export { buildSearchIndex, type SearchIndex, type SearchItem } from "./search.js";
+export {
+  buildSearchIndex,
+  buildShardedSearchIndex,
+  searchShardKey,
+  SHARDED_SEARCH_FORMAT,
+  type SearchIndex,
+  type SearchItem,
+  type SearchShard,
+  type ShardedSearchIndex,
+  type ShardedSearchManifest
+} from "./search.js";
 export { parseFrontmatter, type Frontmatter } from "./frontmatter.js";
 export {
   postImageUrl,
@@ -70,7 +80,7 @@ export {
  * identically from source, from `dist`, and from a bundler that will not import
  * JSON. A test asserts it against package.json, so the duplication cannot drift.
  */
-export const RENDERER_VERSION = "0.4.0";
+export const RENDERER_VERSION = "0.5.0";
 
 /**
  * A private `marked` instance, never the module-level `marked` singleton.
@@ -15,7 +15,9 @@
  * exactly here, beside the renderers, for the same reason.
  */
 
+import { Buffer } from "node:buffer";
 import lunr from "lunr";
+import { contentHash } from "./shared.js";
 
 /** One entry in a search index, as both repos must construct it. */
 export interface SearchItem {
@@ -59,3 +61,155 @@ export function buildSearchIndex(items: SearchItem[]): SearchIndex {
     items: items.map((item) => ({ slug: item.slug, title: item.title, excerpt: item.excerpt }))
   };
 }
+
+/**
+ * The sharded index format's version. The client refuses any other, so a
+ * change to the encoding, the tokeniser pipeline or the scoring is a bump here
+ * as well as a package version bump.
+ */
+export const SHARDED_SEARCH_FORMAT = 1;
+
+/**
+ * A sharded index's entry point: the result rows, plus the content hash of each
+ * shard keyed by shard key. Small enough to fetch before the first keystroke.
+ */
+export interface ShardedSearchManifest {
+  format: number;
+  items: SearchIndex["items"];
+  shards: Record<string, string>;
+}
+
+/**
+ * The terms starting with one character, and the items each appears in.
+ *
+ * `terms` is sorted by code unit. `offsets` and `postings` are base64 of
+ * little-endian typed arrays: term `i`'s postings are the (item index, weight)
+ * pairs from `offsets[i]` up to `offsets[i + 1]` in the Uint16Array `postings`,
+ * and `offsets` is a Uint32Array one longer than `terms`.
+ */
+export interface SearchShard {
+  terms: string[];
+  offsets: string;
+  postings: string;
+}
+
+export interface ShardedSearchIndex {
+  manifest: ShardedSearchManifest;
+  shards: Record<string, SearchShard>;
+}
+
+// The same fields and boosts as buildSearchIndex, and lunr's default indexing
+// pipeline, so both formats find the same items for the same query.
+const SHARDED_FIELDS = [
+  ["title", 10],
+  ["excerpt", 5],
+  ["description", 4],
+  ["keywords", 3]
+] as const;
+
+const indexPipeline = new lunr.Pipeline();
+indexPipeline.add(lunr.trimmer, lunr.stopWordFilter, lunr.stemmer);
+
+// BM25 parameters (lunr's defaults) and the fixed-point scale weights are
+// stored at. A weight is a term's whole contribution to an item's score,
+// summed over fields, so a query only has to add weights up.
+const K1 = 1.2;
+const B = 0.75;
+const WEIGHT_SCALE = 100;
+const MAX_WEIGHT = 0xffff;
+
+/**
+ * The shard a term lives in: the hex code point of its first character, which
+ * keeps shard filenames ASCII whatever the locale.
+ */
+export function searchShardKey(term: string): string {
+  return term.codePointAt(0)!.toString(16);
+}
+
+function toBase64(array: Uint16Array | Uint32Array): string {
+  return Buffer.from(array.buffer, array.byteOffset, array.byteLength).toString("base64");
+}
+
+/**
+ * Build the prefix-sharded index for one locale and content type.
+ *
+ * Each shard's hash in the manifest is contentHash(JSON.stringify(shard)), so a
+ * shard is written as exactly those bytes under that hash.
+ */
+export function buildShardedSearchIndex(items: SearchItem[]): ShardedSearchIndex {
+  // Term frequencies and lengths per field per item, after lunr's pipeline
+  const fieldTerms = SHARDED_FIELDS.map(([field]) =>
+    items.map((item) => indexPipeline.run(lunr.tokenizer(item[field])).map((token) => token.toString()))
+  );
+  const averageLengths = fieldTerms.map(
+    (perItem) => perItem.reduce((sum, terms) => sum + terms.length, 0) / Math.max(1, items.length)
+  );
+
+  const documentFrequency = new Map<string, number>();
+  items.forEach((_, itemIndex) => {
+    const seen = new Set(fieldTerms.flatMap((perItem) => perItem[itemIndex]));
+    for (const term of seen) {
+      documentFrequency.set(term, (documentFrequency.get(term) ?? 0) + 1);
+    }
+  });
+
+  // term -> item index -> score
+  const scores = new Map<string, Map<number, number>>();
+  SHARDED_FIELDS.forEach(([, boost], fieldIndex) => {
+    fieldTerms[fieldIndex].forEach((terms, itemIndex) => {
+      const frequencies = new Map<string, number>();
+      for (const term of terms) {
+        frequencies.set(term, (frequencies.get(term) ?? 0) + 1);
+      }
+      const lengthNorm = 1 - B + B * (terms.length / (averageLengths[fieldIndex] || 1));
+      for (const [term, tf] of frequencies) {
+        const df = documentFrequency.get(term)!;
+        const idf = Math.log(1 + Math.abs((items.length - df + 0.5) / (df + 0.5)));
+        const score = (boost * idf * (K1 + 1) * tf) / (K1 * lengthNorm + tf);
+        let byItem = scores.get(term);
+        if (byItem === undefined) {
+          byItem = new Map();
+          scores.set(term, byItem);
+        }
+        byItem.set(itemIndex, (byItem.get(itemIndex) ?? 0) + score);
+      }
+    });
+  });
+
+  const termsByShard = new Map<string, string[]>();
+  for (const term of [...scores.keys()].sort()) {
+    const key = searchShardKey(term);
+    const shardTerms = termsByShard.get(key);
+    if (shardTerms === undefined) {
+      termsByShard.set(key, [term]);
+    } else {
+      shardTerms.push(term);
+    }
+  }
+
+  const shards: Record<string, SearchShard> = {};
+  const shardHashes: Record<string, string> = {};
+  for (const [key, terms] of termsByShard) {
+    const offsets = new Uint32Array(terms.length + 1);
+    const postings: number[] = [];
+    terms.forEach((term, i) => {
+      const byItem = [...scores.get(term)!].sort(([a], [b]) => a - b);
+      for (const [itemIndex, score] of byItem) {
+        postings.push(itemIndex, Math.min(MAX_WEIGHT, Math.max(1, Math.round(score * WEIGHT_SCALE))));
+      }
+      offsets[i + 1] = postings.length;
+    });
+    const shard = { terms, offsets: toBase64(offsets), postings: toBase64(Uint16Array.from(postings)) };
+    shards[key] = shard;
+    shardHashes[key] = contentHash(JSON.stringify(shard));
+  }
+
+  return {
+    manifest: {
+      format: SHARDED_SEARCH_FORMAT,
+      items: items.map((item) => ({ slug: item.slug, title: item.title, excerpt: item.excerpt })),
+      shards: shardHashes
+    },
+    shards
+  };
+}
@@ -7,6 +7,7 @@ import {
   RENDERER_VERSION,
   contentHash,
   buildSearchIndex,
+  buildShardedSearchIndex,
   postImageUrl,
   prepareInstructions,
   registeredLanguages,
@@ -14,6 +15,7 @@ import {
   renderMarkdown,
   renderPost,
   rewriteImageRefs,
+  searchShardKey,
   stripInlineTags
 } from "../src/index.js";
 
@@ -210,3 +212,42 @@ describe("buildSearchIndex", () => {
     expect(JSON.stringify(buildSearchIndex(items))).toBe(JSON.stringify(buildSearchIndex(items)));
   });
 });
+
+describe("buildShardedSearchIndex", () => {
+  const items = [
+    { slug: "arrays", title: "Arrays", excerpt: "An ordered chain", description: "About arrays", keywords: "list" },
+    { slug: "loops", title: "Loops", excerpt: "Doing things again", description: "About loops", keywords: "repeat" }
+  ];
+
+  function postingsFor(term: string) {
+    const built = buildShardedSearchIndex(items);
+    const shard = built.shards[searchShardKey(term)];
+    const offsets = new Uint32Array(new Uint8Array(Buffer.from(shard.offsets, "base64")).buffer);
+    const postings = new Uint16Array(new Uint8Array(Buffer.from(shard.postings, "base64")).buffer);
+    const i = shard.terms.indexOf(term);
+    return i === -1 ? [] : Array.from(postings.slice(offsets[i], offsets[i + 1]));
+  }
+
+  it("indexes stemmed terms under their first character", () => {
+    const built = buildShardedSearchIndex(items);
+    expect(built.shards[searchShardKey("array")].terms).toContain("array");
+    expect(postingsFor("array")).toEqual([0, expect.any(Number)]);
+    expect(postingsFor("loop")).toEqual([1, expect.any(Number)]);
+  });
+
+  it("drops stop words, like lunr", () => {
+    expect(postingsFor("an")).toEqual([]);
+  });
+
+  it("names each shard by the hash of its bytes", () => {
+    const built = buildShardedSearchIndex(items);
+    for (const [key, hash] of Object.entries(built.manifest.shards)) {
+      expect(contentHash(JSON.stringify(built.shards[key]))).toBe(hash);
+    }
+    expect(built.manifest.items).toEqual(buildSearchIndex(items).items);
+  });
+
+  it("is deterministic", () => {
+    expect(JSON.stringify(buildShardedSearchIndex(items))).toBe(JSON.stringify(buildShardedSearchIndex(items)));
+  });
+});
@@ -5,9 +5,16 @@ import type { AvailableFunction, Language } from "./types";
 
 // Base exercise class for visual exercises with animations and state
 
+// Set while VisualExercise.createHeadless() is constructing an exercise.
+let constructingHeadless = false;
+
 export abstract class VisualExercise extends Exercise {
   animations: Animation[] = [];
   view!: HTMLElement;
+  // Headless exercises are only run for their state (isolated checks, re-runs,
+  // curriculum tests) and are never shown, so their view is never attached to
+  // the document and they don't record animations.
+  public readonly headless: boolean = constructingHeadless;
   public randomSeed?: number;
   protected abstract get slug(): string;
 
@@ -37,6 +44,16 @@ export abstract class VisualExercise extends Exercise {
     this.createView();
   }
 
+  // Construct an exercise that will only be run for its state (see `headless`).
+  static createHeadless<T extends VisualExercise>(ExerciseClass: new () => T): T {
+    constructingHeadless = true;
+    try {
+      return new ExerciseClass();
+    } finally {
+      constructingHeadless = false;
+    }
+  }
+
   protected createView() {
     const cssClass = `exercise-${this.slug}`;
     this.view = document.createElement("div");
@@ -46,7 +63,11 @@ export abstract class VisualExercise extends Exercise {
     // The body is only a hidden holding spot until the canvas re-parents the
     // view, and it can genuinely be null during page teardown (typed non-null
     // but seen null in production - JIKI-FRONT-END-3K), so skip it safely.
-    (document.body as HTMLElement | null)?.appendChild(this.view);
+    // Headless views are never shown, so they stay detached and are collected
+    // with the exercise rather than piling up in the body.
+    if (!this.headless) {
+      (document.body as HTMLElement | null)?.appendChild(this.view);
+    }
   }
 
   protected populateView() {}
@@ -56,6 +77,9 @@ export abstract class VisualExercise extends Exercise {
   }
 
   public addAnimation(animation: Animation) {
+    if (this.headless) {
+      return;
+    }
     this.animations.push(animation);
   }
 
@@ -1,5 +1,5 @@
 import type { ExecutionContext } from "@jiki/interpreters";
-import type { Animation } from "../VisualExercise";
+import type { VisualExercise } from "../VisualExercise";
 
 const DURATION_MS = 1500;
 const BURST_COUNT = 3;
@@ -29,7 +29,8 @@ function mulberry32(seed: number) {
   };
 }
 
-export function fireFireworks(view: HTMLElement, animations: Animation[], executionCtx: ExecutionContext) {
+export function fireFireworks(exercise: VisualExercise, executionCtx: ExecutionContext) {
+  const view = exercise.view;
   const startTime = executionCtx.getCurrentTimeInMs();
   // Per-view call index so DOM IDs stay unique within this view across
   // repeated calls, without relying on module-level state that leaks between
@@ -66,14 +67,14 @@ export function fireFireworks(view: HTMLElement, animations: Animation[], execut
       const dy = Math.sin(angle) * radius;
       const target = `#${burstId} .spark:nth-child(${i + 1})`;
 
-      animations.push({
+      exercise.addAnimation({
         targets: target,
         offset: burstStart,
         duration: 1,
         transformations: { opacity: 1 }
       });
 
-      animations.push({
+      exercise.addAnimation({
         targets: target,
         offset: burstStart + 1,
         duration: burstDuration,
@@ -16,6 +16,7 @@ import {
 import type { Shape } from "./shapes";
 import { Circle, Line, Rectangle, Triangle, Ellipse } from "./shapes";
 import { getCircleAt, getLineAt, getEllipseAt, getRectangleAt, getTriangleAt } from "./retrievers";
+import { ShapeIndex } from "./shapeIndex";
 
 export function hexToHsl(hex: string): { h: number; s: number; l: number } {
   const r = parseInt(hex.slice(1, 3), 16) / 255;
@@ -156,16 +157,7 @@ export abstract class DrawExercise extends VisualExercise {
   // rectangle's exact bounds. Lets a filled area (e.g. a border) be drawn as one big
   // rectangle or several smaller ones and still be recognised.
   public hasRectangleCoveringPointWithColor(x: number, y: number, color: string): boolean {
-    const resolved = resolveNamedColor(color);
-    return this.shapes.some(
-      (shape) =>
-        shape instanceof Rectangle &&
-        shape.fillColor === resolved &&
-        shape.x <= x &&
-        x <= shape.x + shape.width &&
-        shape.y <= y &&
-        y <= shape.y + shape.height
-    );
+    return ShapeIndex.for(this.shapes).hasRectangleCoveringPoint(x, y, resolveNamedColor(color));
   }
   public hasCircleAt(cx: number, cy: number, radius: number): boolean {
     return getCircleAt(this.shapes, cx, cy, radius) !== undefined;
@@ -210,35 +202,24 @@ export abstract class DrawExercise extends VisualExercise {
     lower: [number, number, number, number, number, number],
     upper: [number, number, number, number, number, number]
   ): boolean {
-    const lowerTriangle = getTriangleAt(this.shapes, ...lower);
-    const upperTriangle = getTriangleAt(this.shapes, ...upper);
+    const index = ShapeIndex.for(this.shapes);
+    const lowerTriangle = index.getTriangleAt(...lower);
+    const upperTriangle = index.getTriangleAt(...upper);
     if (lowerTriangle === undefined || upperTriangle === undefined) {
       return false;
     }
-    return this.shapes.indexOf(lowerTriangle) < this.shapes.indexOf(upperTriangle);
+    return index.drawOrderOf(lowerTriangle) < index.drawOrderOf(upperTriangle);
   }
   // True if every triangle filled with `topColor` is drawn after every triangle filled with
   // `bottomColor`, so the top colour always renders above the bottom colour where they overlap.
   public trianglesColorDrawnAbove(topColor: string, bottomColor: string): boolean {
-    const resolvedTop = resolveNamedColor(topColor);
-    const resolvedBottom = resolveNamedColor(bottomColor);
-    const topIndices: number[] = [];
-    const bottomIndices: number[] = [];
-    this.shapes.forEach((shape, index) => {
-      if (!(shape instanceof Triangle)) {
-        return;
-      }
-      if (shape.fillColor === resolvedTop) {
-        topIndices.push(index);
-      }
-      if (shape.fillColor === resolvedBottom) {
-        bottomIndices.push(index);
-      }
-    });
-    if (topIndices.length === 0 || bottomIndices.length === 0) {
+    const index = ShapeIndex.for(this.shapes);
+    const top = index.triangleColorRange(resolveNamedColor(topColor));
+    const bottom = index.triangleColorRange(resolveNamedColor(bottomColor));
+    if (top === undefined || bottom === undefined) {
       return false;
     }
-    return Math.min(...topIndices) > Math.max(...bottomIndices);
+    return top.first > bottom.last;
   }
 
   // These all delegate to checks.
@@ -1,36 +1,10 @@
 import type { Shape } from "./shapes";
 import { Circle, Rectangle, Line } from "./shapes";
+import { ShapeIndex } from "./shapeIndex";
 
+// Whether circles cover at least `requiredPercentage` of a 100x100 grid of points.
 export function checkCanvasCoverage(shapes: Shape[], requiredPercentage: number) {
-  const gridSize = 100;
-  const grid = Array.from({ length: gridSize }, () => Array(gridSize).fill(false));
-
-  // Iterate through each circle
-  shapes.forEach((shape) => {
-    if (!(shape instanceof Circle)) {
-      return;
-    }
-    for (let x = 0; x < gridSize; x++) {
-      for (let y = 0; y < gridSize; y++) {
-        const distanceSquared = (x - shape.cx) ** 2 + (y - shape.cy) ** 2;
-        if (distanceSquared <= shape.radius ** 2) {
-          grid[x][y] = true; // Mark grid point as covered
-        }
-      }
-    }
-  });
-
-  // Count covered points
-  let coveredPoints = 0;
-  grid.forEach((row) => {
-    coveredPoints += row.filter((point) => point === true).length;
-  });
-
-  // Calculate coverage percentage
-  const totalPoints = gridSize * gridSize;
-  const percentage = (coveredPoints / totalPoints) * 100;
-
-  return percentage >= requiredPercentage;
+  return ShapeIndex.for(shapes).coveragePercentage() >= requiredPercentage;
 }
 
 export function checkUniqueColoredRectangles(shapes: Shape[], count: number) {
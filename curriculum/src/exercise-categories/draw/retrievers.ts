@@ -1,7 +1,19 @@
 import type { Shape } from "./shapes";
-import { Circle, Ellipse, Line, Rectangle, Triangle } from "./shapes";
+import { Rectangle } from "./shapes";
+import { ShapeIndex } from "./shapeIndex";
+
+// Each retriever returns the first matching shape in draw order.
 
 export function getRectangleAt(shapes: Shape[], x: number, y: number, width: number, height: number) {
+  // Callers outside TypeScript can leave dimensions undefined to match any value,
+  // which the exact-geometry index can't answer, so those fall back to a scan.
+  if (x === undefined || y === undefined || width === undefined || height === undefined) {
+    return findRectangle(shapes, x, y, width, height);
+  }
+  return ShapeIndex.for(shapes).getRectangleAt(x, y, width, height);
+}
+
+function findRectangle(shapes: Shape[], x: number, y: number, width: number, height: number) {
   return shapes.find((shape): shape is Rectangle => {
     if (shape instanceof Rectangle) {
       if (x !== undefined) {
@@ -32,53 +44,15 @@ export function getRectangleAt(shapes: Shape[], x: number, y: number, width: num
   });
 }
 export function getLineAt(shapes: Shape[], x1: number, y1: number, x2: number, y2: number) {
-  return shapes.find((shape): shape is Line => {
-    if (shape instanceof Line) {
-      return shape.x1 === x1 && shape.y1 === y1 && shape.x2 === x2 && shape.y2 === y2;
-    }
-    return false;
-  });
+  return ShapeIndex.for(shapes).getLineAt(x1, y1, x2, y2);
 }
 export function getCircleAt(shapes: Shape[], cx: number, cy: number, radius: number) {
-  return shapes.find((shape): shape is Circle => {
-    if (shape instanceof Circle) {
-      return shape.cx === cx && shape.cy === cy && shape.radius === radius;
-    }
-    return false;
-  });
+  return ShapeIndex.for(shapes).getCircleAt(cx, cy, radius);
 }
 export function getEllipseAt(shapes: Shape[], x: number, y: number, rx: number, ry: number) {
-  return shapes.find((shape): shape is Ellipse => {
-    if (shape instanceof Ellipse) {
-      return shape.x === x && shape.y === y && shape.rx === rx && shape.ry === ry;
-    }
-    return false;
-  });
+  return ShapeIndex.for(shapes).getEllipseAt(x, y, rx, ry);
 }
+// Vertices match in any order.
 export function getTriangleAt(shapes: Shape[], x1: number, y1: number, x2: number, y2: number, x3: number, y3: number) {
-  return shapes.find((shape): shape is Triangle => {
-    if (shape instanceof Triangle) {
-      const arePointsEqual = (p1: [number, number], p2: [number, number]) => p1[0] === p2[0] && p1[1] === p2[1];
-
-      const shapePoints = [
-        [shape.x1, shape.y1] as [number, number],
-        [shape.x2, shape.y2] as [number, number],
-        [shape.x3, shape.y3] as [number, number]
-      ];
-      const points = [[x1, y1] as [number, number], [x2, y2] as [number, number], [x3, y3] as [number, number]];
-
-      const match = (a: [number, number], b: [number, number], c: [number, number]) =>
-        arePointsEqual(shapePoints[0], a) && arePointsEqual(shapePoints[1], b) && arePointsEqual(shapePoints[2], c);
-
-      return (
-        match(points[0], points[1], points[2]) ||
-        match(points[0], points[2], points[1]) ||
-        match(points[1], points[0], points[2]) ||
-        match(points[1], points[2], points[0]) ||
-        match(points[2], points[0], points[1]) ||
-        match(points[2], points[1], points[0])
-      );
-    }
-    return false;
-  });
+  return ShapeIndex.for(shapes).getTriangleAt(x1, y1, x2, y2, x3, y3);
 }
@@ -0,0 +1,256 @@
+import type { Shape } from "./shapes";
+import { Circle, Ellipse, Line, Rectangle, Triangle } from "./shapes";
+
+// The coverage grid samples the integer points 0..99 on each axis.
+const COVERAGE_GRID_SIZE = 100;
+
+// Rectangles are bucketed into square cells this wide for point lookups.
+const CELL_SIZE = 10;
+
+// Rectangles spanning more cells than this (e.g. huge or infinite ones) are kept
+// in a plain list instead, so one shape can't blow up the grid.
+const MAX_CELLS_PER_RECTANGLE = 400;
+
+interface ColorRange {
+  first: number;
+  last: number;
+}
+
+/**
+ * Lookups over a list of drawn shapes, so checks and retrievers don't rescan
+ * every shape on each call. Scenarios make dozens of these calls against
+ * programs that draw thousands of shapes.
+ *
+ * An index is kept per shapes array and catches up with whatever has been
+ * appended since it was last used, so shapes can keep being pushed straight onto
+ * the array. Shapes are never edited once drawn and the arrays only grow; if one
+ * is emptied or shrunk, the index is rebuilt from scratch.
+ */
+export class ShapeIndex {
+  private static readonly cache = new WeakMap<Shape[], ShapeIndex>();
+
+  private indexed = 0;
+
+  // First shape drawn with each exact geometry (see geometryKey).
+  private byGeometry = new Map<string, Shape>();
+  // Draw order of each shape (its first position in the array).
+  private drawOrder = new Map<Shape, number>();
+  // First and last draw position of triangles of each fill colour.
+  private triangleColors = new Map<string, ColorRange>();
+  // Rectangles of each fill colour, bucketed by the cells they cover.
+  private rectangleCells = new Map<string, Map<number, Rectangle[]>>();
+  private oversizedRectangles = new Map<string, Rectangle[]>();
+  // Grid points covered by at least one circle.
+  private coverage = new Uint8Array(COVERAGE_GRID_SIZE * COVERAGE_GRID_SIZE);
+  private coveredPoints = 0;
+
+  private constructor(private readonly shapes: Shape[]) {}
+
+  static for(shapes: Shape[]): ShapeIndex {
+    let index = ShapeIndex.cache.get(shapes);
+    if (!index) {
+      index = new ShapeIndex(shapes);
+      ShapeIndex.cache.set(shapes, index);
+    }
+    index.sync();
+    return index;
+  }
+
+  getRectangleAt(x: number, y: number, width: number, height: number): Rectangle | undefined {
+    return this.lookup(geometryKey("rectangle", [x, y, width, height])) as Rectangle | undefined;
+  }
+
+  getLineAt(x1: number, y1: number, x2: number, y2: number): Line | undefined {
+    return this.lookup(geometryKey("line", [x1, y1, x2, y2])) as Line | undefined;
+  }
+
+  getCircleAt(cx: number, cy: number, radius: number): Circle | undefined {
+    return this.lookup(geometryKey("circle", [cx, cy, radius])) as Circle | undefined;
+  }
+
+  getEllipseAt(x: number, y: number, rx: number, ry: number): Ellipse | undefined {
+    return this.lookup(geometryKey("ellipse", [x, y, rx, ry])) as Ellipse | undefined;
+  }
+
+  // Vertices match in any order.
+  getTriangleAt(x1: number, y1: number, x2: number, y2: number, x3: number, y3: number): Triangle | undefined {
+    return this.lookup(triangleKey(x1, y1, x2, y2, x3, y3)) as Triangle | undefined;
+  }
+
+  private lookup(key: string | undefined): Shape | undefined {
+    return key === undefined ? undefined : this.byGeometry.get(key);
+  }
+
+  drawOrderOf(shape: Shape): number {
+    return this.drawOrder.get(shape) ?? -1;
+  }
+
+  triangleColorRange(fillColor: string): ColorRange | undefined {
+    return this.triangleColors.get(fillColor);
+  }
+
+  hasRectangleCoveringPoint(x: number, y: number, fillColor: string): boolean {
+    const covers = (rect: Rectangle) =>
+      rect.x <= x && x <= rect.x + rect.width && rect.y <= y && y <= rect.y + rect.height;
+
+    const cells = this.rectangleCells.get(fillColor);
+    const candidates = cells?.get(cellKey(Math.floor(x / CELL_SIZE), Math.floor(y / CELL_SIZE)));
+    if (candidates?.some(covers)) {
+      return true;
+    }
+    return this.oversizedRectangles.get(fillColor)?.some(covers) ?? false;
+  }
+
+  // Percentage of the coverage grid's points inside at least one circle.
+  coveragePercentage(): number {
+    return (this.coveredPoints / (COVERAGE_GRID_SIZE * COVERAGE_GRID_SIZE)) * 100;
+  }
+
+  private sync() {
+    if (this.shapes.length < this.indexed) {
+      this.reset();
+    }
+    for (; this.indexed < this.shapes.length; this.indexed++) {
+      this.add(this.shapes[this.indexed], this.indexed);
+    }
+  }
+
+  private reset() {
+    this.indexed = 0;
+    this.byGeometry = new Map();
+    this.drawOrder = new Map();
+    this.triangleColors = new Map();
+    this.rectangleCells = new Map();
+    this.oversizedRectangles = new Map();
+    this.coverage = new Uint8Array(COVERAGE_GRID_SIZE * COVERAGE_GRID_SIZE);
+    this.coveredPoints = 0;
+  }
+
+  private add(shape: Shape, position: number) {
+    if (!this.drawOrder.has(shape)) {
+      this.drawOrder.set(shape, position);
+    }
+
+    const key = shapeGeometryKey(shape);
+    if (key !== undefined && !this.byGeometry.has(key)) {
+      this.byGeometry.set(key, shape);
+    }
+
+    if (shape instanceof Triangle) {
+      const range = this.triangleColors.get(shape.fillColor);
+      if (range === undefined) {
+        this.triangleColors.set(shape.fillColor, { first: position, last: position });
+      } else {
+        range.last = position;
+      }
+    } else if (shape instanceof Rectangle) {
+      this.addRectangle(shape);
+    } else if (shape instanceof Circle) {
+      this.addCoverage(shape);
+    }
+  }
+
+  private addRectangle(rect: Rectangle) {
+    const minX = Math.floor(rect.x / CELL_SIZE);
+    const maxX = Math.floor((rect.x + rect.width) / CELL_SIZE);
+    const minY = Math.floor(rect.y / CELL_SIZE);
+    const maxY = Math.floor((rect.y + rect.height) / CELL_SIZE);
+
+    // Bounds that aren't safe integers (huge, infinite or NaN coordinates) can't be
+    // stepped through cell by cell, so those rectangles go in the plain list too.
+    const bounds = [minX, maxX, minY, maxY];
+    if (
+      !bounds.every((bound) => Number.isSafeInteger(bound)) ||
+      (maxX - minX + 1) * (maxY - minY + 1) > MAX_CELLS_PER_RECTANGLE
+    ) {
+      appendTo(this.oversizedRectangles, rect.fillColor, rect);
+      return;
+    }
+
+    let cells = this.rectangleCells.get(rect.fillColor);
+    if (cells === undefined) {
+      cells = new Map();
+      this.rectangleCells.set(rect.fillColor, cells);
+    }
+    // Negative sizes give an empty range: such rectangles cover no point.
+    for (let cx = minX; cx <= maxX; cx++) {
+      for (let cy = minY; cy <= maxY; cy++) {
+        appendTo(cells, cellKey(cx, cy), rect);
+      }
+    }
+  }
+
+  private addCoverage(circle: Circle) {
+    // Only points within the circle's bounding box (plus a point of slack for
+    // rounding) can be covered, so there's no need to test the whole grid.
+    const reach = Math.abs(circle.radius) + 1;
+    const minX = Math.max(0, Math.floor(circle.cx - reach));
+    const maxX = Math.min(COVERAGE_GRID_SIZE - 1, Math.ceil(circle.cx + reach));
+    const minY = Math.max(0, Math.floor(circle.cy - reach));
+    const maxY = Math.min(COVERAGE_GRID_SIZE - 1, Math.ceil(circle.cy + reach));
+    const radiusSquared = circle.radius ** 2;
+
+    for (let x = minX; x <= maxX; x++) {
+      for (let y = minY; y <= maxY; y++) {
+        const point = x * COVERAGE_GRID_SIZE + y;
+        if (this.coverage[point] === 0 && (x - circle.cx) ** 2 + (y - circle.cy) ** 2 <= radiusSquared) {
+          this.coverage[point] = 1;
+          this.coveredPoints++;
+        }
+      }
+    }
+  }
+}
+
+function shapeGeometryKey(shape: Shape): string | undefined {
+  if (shape instanceof Rectangle) {
+    return geometryKey("rectangle", [shape.x, shape.y, shape.width, shape.height]);
+  }
+  if (shape instanceof Line) {
+    return geometryKey("line", [shape.x1, shape.y1, shape.x2, shape.y2]);
+  }
+  if (shape instanceof Circle) {
+    return geometryKey("circle", [shape.cx, shape.cy, shape.radius]);
+  }
+  if (shape instanceof Ellipse) {
+    return geometryKey("ellipse", [shape.x, shape.y, shape.rx, shape.ry]);
+  }
+  if (shape instanceof Triangle) {
+    return triangleKey(shape.x1, shape.y1, shape.x2, shape.y2, shape.x3, shape.y3);
+  }
+  return undefined;
+}
+
+// Numbers stringify the same exactly when they're ===, except NaN, which equals
+// nothing. So geometry containing NaN gets no key and is never matched.
+function geometryKey(kind: string, values: number[]): string | undefined {
+  if (values.some((value) => Number.isNaN(value))) {
+    return undefined;
+  }
+  return `${kind}:${values.join(",")}`;
+}
+
+function triangleKey(x1: number, y1: number, x2: number, y2: number, x3: number, y3: number): string | undefined {
+  const points: Array<[number, number]> = [
+    [x1, y1],
+    [x2, y2],
+    [x3, y3]
+  ];
+  points.sort(([ax, ay], [bx, by]) => ax - bx || ay - by);
+  return geometryKey("triangle", points.flat());
+}
+
+// Distinct cells can share a key far from the canvas, which only adds candidates:
+// every candidate is checked against the point anyway.
+function cellKey(cx: number, cy: number): number {
+  return cx * 1_000_003 + cy;
+}
+
+function appendTo<K, V>(map: Map<K, V[]>, key: K, value: V) {
+  const values = map.get(key);
+  if (values === undefined) {
+    map.set(key, [value]);
+  } else {
+    values.push(value);
+  }
+}
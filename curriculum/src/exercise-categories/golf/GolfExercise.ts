@@ -90,7 +90,7 @@ export default class GolfExercise extends VisualExercise {
 
   fireFireworks(executionCtx: ExecutionContext) {
     this.fireworksFired = true;
-    fireFireworks(this.view, this.animations, executionCtx);
+    fireFireworks(this, executionCtx);
   }
 
   setupBallPosition(x: number, y: number) {
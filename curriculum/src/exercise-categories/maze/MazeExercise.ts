@@ -96,7 +96,7 @@ export default class MazeExercise extends VisualExercise {
     const top = this.characterRow * cellHeight + cellHeight / 2;
 
     // Add animation for movement
-    this.animations.push({
+    this.addAnimation({
       targets: `#${this.view.id} .character`,
       offset: executionCtx.getCurrentTimeInMs(),
       duration: 200,
@@ -119,7 +119,7 @@ export default class MazeExercise extends VisualExercise {
     this.direction = directions[(currentIndex + 1) % 4];
 
     // Add rotation animation
-    this.animations.push({
+    this.addAnimation({
       targets: `#${this.view.id} .character`,
       offset: executionCtx.getCurrentTimeInMs(),
       duration: 150,
@@ -141,7 +141,7 @@ export default class MazeExercise extends VisualExercise {
     this.direction = directions[(currentIndex + 1) % 4];
 
     // Add rotation animation
-    this.animations.push({
+    this.addAnimation({
       targets: `#${this.view.id} .character`,
       offset: executionCtx.getCurrentTimeInMs(),
       duration: 150,
@@ -314,7 +314,7 @@ export default class WordleExercise extends VisualExercise {
   private animateDrawGuess(executionCtx: ExecutionContext, rowIdx: number, word: string) {
     for (let col = 0; col < NUM_COLS; col++) {
       const char = (word[col] ?? "").toLowerCase();
-      this.animations.push({
+      this.addAnimation({
         targets: `#${this.view.id} .letter-${rowIdx}-${col}`,
         offset: executionCtx.getCurrentTimeInMs(),
         duration: 1,
@@ -331,7 +331,7 @@ export default class WordleExercise extends VisualExercise {
     states.forEach((state, col) => {
       if (col >= NUM_COLS) return;
       const backgroundColor = STATE_COLORS[state];
-      this.animations.push({
+      this.addAnimation({
         targets: `#${this.view.id} .letter-${rowIdx}-${col}`,
         offset: executionCtx.getCurrentTimeInMs(),
         duration: 1,
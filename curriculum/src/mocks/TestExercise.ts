@@ -29,7 +29,7 @@ export class TestExercise extends VisualExercise {
   move(executionCtx: ExecutionContext) {
     this.position += 20;
 
-    this.animations.push({
+    this.addAnimation({
       targets: `#${this.view.id} .character`,
       offset: executionCtx.getCurrentTimeInMs(),
       duration: 100,
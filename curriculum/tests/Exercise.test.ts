@@ -1,5 +1,9 @@
-import { describe, it, expect } from "vitest";
+import { describe, it, expect, vi } from "vitest";
+import type { ExecutionContext } from "@jiki/interpreters";
 import { TestExercise } from "../src/mocks/TestExercise";
+import { VisualExercise } from "../src/VisualExercise";
+import MazeSolveBasicExercise from "../src/exercises/maze-solve-basic/Exercise";
+import GolfShotCheckerExercise from "../src/exercises/golf-shot-checker/Exercise";
 
 describe("Exercise", () => {
   describe("getView", () => {
@@ -29,4 +33,52 @@ describe("Exercise", () => {
       expect(view.innerHTML).toContain("position: absolute");
     });
   });
+
+  describe("createHeadless", () => {
+    it("should not attach the view to the document", () => {
+      const exercise = VisualExercise.createHeadless(TestExercise);
+
+      expect(exercise.headless).toBe(true);
+      expect(exercise.getView().isConnected).toBe(false);
+      expect(new TestExercise().getView().isConnected).toBe(true);
+    });
+
+    it("should not record animations", () => {
+      const exercise = VisualExercise.createHeadless(TestExercise);
+      exercise.addAnimation({ targets: ".character", offset: 0, transformations: { opacity: 1 } });
+
+      expect(exercise.animations).toEqual([]);
+    });
+
+    it("should not record animations from exercise functions or effects", () => {
+      const ctx = {
+        getCurrentTimeInMs: vi.fn(() => 0),
+        fastForward: vi.fn(),
+        logicError: vi.fn()
+      } as unknown as ExecutionContext;
+
+      const maze = VisualExercise.createHeadless(MazeSolveBasicExercise);
+      maze.setupMaze(
+        [
+          [2, 0, 3],
+          [1, 1, 1]
+        ],
+        0,
+        0,
+        "right"
+      );
+      maze.move(ctx);
+      maze.turnLeft(ctx);
+      maze.turnRight(ctx);
+
+      const golf = VisualExercise.createHeadless(GolfShotCheckerExercise);
+      golf.rollRight(ctx);
+      golf.fireFireworks(ctx);
+
+      expect(maze.characterCol).toBe(1);
+      expect(golf.fireworksFired).toBe(true);
+      expect(maze.animations).toEqual([]);
+      expect(golf.animations).toEqual([]);
+    });
+  });
 });
@@ -0,0 +1,99 @@
+import { describe, it, expect } from "vitest";
+import { ShapeIndex } from "../../../src/exercise-categories/draw/shapeIndex";
+import type { Shape } from "../../../src/exercise-categories/draw/shapes";
+import { Circle, Rectangle, Triangle } from "../../../src/exercise-categories/draw/shapes";
+
+// Helper to create mock SVG elements
+function createMockSVGElement(): SVGElement {
+  return document.createElementNS("http://www.w3.org/2000/svg", "circle") as SVGElement;
+}
+
+const circle = (cx: number, cy: number, radius: number) =>
+  new Circle(cx, cy, radius, "#333333", "#ff0000", createMockSVGElement());
+const rectangle = (x: number, y: number, width: number, height: number, fillColor = "#ff0000") =>
+  new Rectangle(x, y, width, height, "#333333", fillColor, createMockSVGElement());
+const triangle = (points: [number, number, number, number, number, number], fillColor = "#ff0000") =>
+  new Triangle(...points, "#333333", fillColor, createMockSVGElement());
+
+// The original full-grid rasterisation, to check the incremental bitmap against.
+function bruteForceCoverage(shapes: Shape[]) {
+  let covered = 0;
+  for (let x = 0; x < 100; x++) {
+    for (let y = 0; y < 100; y++) {
+      if (shapes.some((s) => s instanceof Circle && (x - s.cx) ** 2 + (y - s.cy) ** 2 <= s.radius ** 2)) {
+        covered++;
+      }
+    }
+  }
+  return covered / 100;
+}
+
+describe("ShapeIndex", () => {
+  it("Should pick up shapes appended after it was built", () => {
+    const shapes: Shape[] = [circle(10, 10, 5)];
+    expect(ShapeIndex.for(shapes).getCircleAt(20, 20, 5)).toBeUndefined();
+
+    const added = circle(20, 20, 5);
+    shapes.push(added);
+
+    expect(ShapeIndex.for(shapes).getCircleAt(20, 20, 5)).toBe(added);
+  });
+
+  it("Should rebuild when the shapes array is emptied", () => {
+    const shapes: Shape[] = [circle(10, 10, 5)];
+    expect(ShapeIndex.for(shapes).getCircleAt(10, 10, 5)).toBeDefined();
+
+    shapes.length = 0;
+
+    expect(ShapeIndex.for(shapes).getCircleAt(10, 10, 5)).toBeUndefined();
+    expect(ShapeIndex.for(shapes).coveragePercentage()).toBe(0);
+  });
+
+  it("Should return the first shape drawn with a given geometry", () => {
+    const first = circle(10, 10, 5);
+    const shapes: Shape[] = [first, circle(10, 10, 5)];
+
+    expect(ShapeIndex.for(shapes).getCircleAt(10, 10, 5)).toBe(first);
+  });
+
+  it("Should match triangles regardless of vertex order", () => {
+    const t = triangle([0, 0, 10, 0, 5, 10]);
+    const index = ShapeIndex.for([t]);
+
+    expect(index.getTriangleAt(5, 10, 0, 0, 10, 0)).toBe(t);
+    expect(index.getTriangleAt(0, 0, 10, 0, 5, 11)).toBeUndefined();
+  });
+
+  it("Should never match NaN geometry", () => {
+    const index = ShapeIndex.for([circle(NaN, 10, 5)]);
+
+    expect(index.getCircleAt(NaN, 10, 5)).toBeUndefined();
+  });
+
+  it("Should track the draw range of each triangle colour", () => {
+    const shapes: Shape[] = [
+      triangle([0, 0, 1, 0, 0, 1], "#000000"),
+      circle(5, 5, 1),
+      triangle([0, 0, 2, 0, 0, 2], "#ffffff"),
+      triangle([0, 0, 3, 0, 0, 3], "#000000")
+    ];
+
+    expect(ShapeIndex.for(shapes).triangleColorRange("#000000")).toEqual({ first: 0, last: 3 });
+    expect(ShapeIndex.for(shapes).triangleColorRange("#ffffff")).toEqual({ first: 2, last: 2 });
+  });
+
+  it("Should find rectangles covering a point, including on their edges", () => {
+    const index = ShapeIndex.for([rectangle(10, 10, 20, 5), rectangle(0, 0, 1e9, 1e9, "#0000ff")]);
+
+    expect(index.hasRectangleCoveringPoint(30, 15, "#ff0000")).toBe(true);
+    expect(index.hasRectangleCoveringPoint(31, 15, "#ff0000")).toBe(false);
+    expect(index.hasRectangleCoveringPoint(12, 12, "#00ff00")).toBe(false);
+    expect(index.hasRectangleCoveringPoint(500, 500, "#0000ff")).toBe(true);
+  });
+
+  it("Should compute the same coverage as rasterising every circle over the grid", () => {
+    const shapes: Shape[] = [circle(0, 0, 30), circle(50.5, 50.5, 12.3), circle(99, 20, 7), circle(-20, 50, 25)];
+
+    expect(ShapeIndex.for(shapes).coveragePercentage()).toBeCloseTo(bruteForceCoverage(shapes));
+  });
+});
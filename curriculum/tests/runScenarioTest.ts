@@ -1,7 +1,7 @@
 import { jikiscript, javascript, python } from "@jiki/interpreters";
 import type { InterpretResult } from "@jiki/interpreters";
 import type { IOExercise } from "../src/IOExercise";
-import type { VisualExercise } from "../src/VisualExercise";
+import { VisualExercise } from "../src/VisualExercise";
 import type {
   VisualScenario,
   IOScenario,
@@ -48,8 +48,8 @@ export function runVisualScenarioTest(
   language: Language = "jikiscript",
   interpreterOptions?: InterpreterOptions
 ): ScenarioTestResult {
-  // Create fresh exercise instance
-  const exercise = new ExerciseClass();
+  // Create fresh exercise instance. Views are never rendered here, so it's headless.
+  const exercise = VisualExercise.createHeadless(ExerciseClass);
 
   // Resolve random seed: true means generate a fresh seed each run
   const resolvedSeed = scenario.randomSeed === true ? Math.floor(Math.random() * 2 ** 32) : scenario.randomSeed;
@@ -102,7 +102,7 @@ export function runVisualScenarioTest(
   const isolatedResults: TestExpect[] = [];
   if (scenario.isolatedChecks && scenario.isolatedChecks.length > 0) {
     for (const check of scenario.isolatedChecks) {
-      const isoExercise = new ExerciseClass();
+      const isoExercise = VisualExercise.createHeadless(ExerciseClass);
       if (resolvedSeed !== undefined) {
         isoExercise.randomSeed = resolvedSeed;
       }
@@ -1,6 +1,7 @@
 import {
   Expression,
   CallExpression,
+  IdentifierExpression,
   AssignmentExpression,
   MemberExpression,
   ArrayExpression,
@@ -21,6 +22,8 @@ import {
   ForInStatement,
   FunctionDeclaration,
 } from "./statement";
+import type { Assertors } from "../shared/interfaces";
+import { ProgramIndex, walkNodes } from "../shared/programIndex";
 
 /**
  * Extract all CallExpression nodes from an AST tree
@@ -31,7 +34,7 @@ export function extractCallExpressions(tree: Statement[] | Expression[]): CallEx
 }
 
 /**
- * Generic recursive AST tree traversal to extract specific expression types
+ * Generic AST tree traversal to extract specific expression types
  * Traverses using the children() method that all Statement and Expression nodes implement
  *
  * @param tree - Array of Statement or Expression nodes to search
@@ -42,17 +45,13 @@ export function extractExpressions<T extends Expression>(
   tree: Statement[] | Expression[],
   type: new (...args: any[]) => T
 ): T[] {
-  // Filter null/undefined, then map to results and flatten
-  return (
-    tree
-      // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
-      .filter(obj => obj)
-      .map((elem: Statement | Expression) => {
-        const res = elem instanceof type ? [elem] : [];
-        return res.concat(extractExpressions<T>(elem.children(), type));
-      })
-      .flat()
-  );
+  const results: T[] = [];
+  walkNodes(tree, node => {
+    if (node instanceof type) {
+      results.push(node);
+    }
+  });
+  return results;
 }
 
 import camelCase from "lodash/camelCase";
@@ -191,18 +190,20 @@ export function findMatchingStatements(statements: Statement[], type: string, ar
   if (args === undefined) {
     return matches;
   }
-  return matches.filter(stmt => {
-    const stmtArgs = statementArguments(stmt);
-    if (stmtArgs.length !== args.length) {
-      return false;
+  return matches.filter(stmt => statementMatchesArguments(stmt, args));
+}
+
+function statementMatchesArguments(stmt: Statement, args: Array<unknown>): boolean {
+  const stmtArgs = statementArguments(stmt);
+  if (stmtArgs.length !== args.length) {
+    return false;
+  }
+  return args.every((expected, i) => {
+    if (expected === undefined) {
+      return true;
     }
-    return args.every((expected, i) => {
-      if (expected === undefined) {
-        return true;
-      }
-      const arg = stmtArgs[i];
-      return arg instanceof LiteralExpression && arg.value === expected;
-    });
+    const arg = stmtArgs[i];
+    return arg instanceof LiteralExpression && arg.value === expected;
   });
 }
 
@@ -271,10 +272,13 @@ export function countArrayExpressions(statements: Statement[]): number {
  * Covers binary/logical operators (e.g. "&&", "+", "===") and unary operators (e.g. "!", "-").
  */
 export function extractOperators(tree: Statement[] | Expression[]): string[] {
-  const binary = extractExpressions(tree, BinaryExpression).map(expr => expr.operator.lexeme);
-  const logical = extractExpressions(tree, LogicalExpression).map(expr => expr.operator.lexeme);
-  const unary = extractExpressions(tree, UnaryExpression).map(expr => expr.operator.lexeme);
-  return [...binary, ...logical, ...unary];
+  const operators: string[] = [];
+  walkNodes(tree, node => {
+    if (node instanceof BinaryExpression || node instanceof LogicalExpression || node instanceof UnaryExpression) {
+      operators.push(node.operator.lexeme);
+    }
+  });
+  return operators;
 }
 
 export function extractCallExpressionsExcludingFunctionBody(
@@ -302,3 +306,99 @@ export function extractCallExpressionsWithinFunctionBody(statements: Statement[]
   }
   return extractCallExpressions(fn.body);
 }
+
+function calleeName(call: CallExpression): string | undefined {
+  return call.callee instanceof IdentifierExpression ? call.callee.name.lexeme : undefined;
+}
+
+function isNumberLiteral(expr: Expression): boolean {
+  return expr instanceof LiteralExpression && typeof expr.value === "number";
+}
+
+/**
+ * The code-check assertors for a parsed program. Every check is answered from
+ * the program's ProgramIndex, so the tree is walked once per program rather
+ * than once per check, scenario and isolated run.
+ */
+export function buildAssertors(statements: Statement[], sourceCode: string): Assertors {
+  const index = ProgramIndex.for(statements);
+  const callsTo = (funcName: string) =>
+    index.groupNodesOf("callsByCallee", CallExpression, calleeName).get(snakeToCamel(funcName)) ?? [];
+  const variableAssignments = () => index.memo("variableAssignments", () => extractVariableAssignments(statements));
+  const functionDeclarations = () => index.memo("functionDeclarations", () => extractFunctionDeclarations(statements));
+  const methodNames = () => index.memo("methodNames", () => extractMethodCalls(statements).map(mc => mc.methodName));
+  const checkedAssignments = ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
+    const formattedInclude = include?.map(snakeToCamel);
+    const formattedExclude = exclude?.map(snakeToCamel);
+    return variableAssignments().filter(({ name }) => {
+      if (formattedExclude?.includes(name)) {
+        return false;
+      }
+      return !formattedInclude || formattedInclude.includes(name);
+    });
+  };
+
+  return {
+    assertAllArgumentsAreVariables: () => {
+      return index.nodesOf(CallExpression).every(expr => !expr.args.some(arg => arg instanceof LiteralExpression));
+    },
+    assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => {
+      return callsTo(funcName).every(expr => {
+        return expr.args.every((arg, i) => !flags[i] || !(arg instanceof LiteralExpression));
+      });
+    },
+    assertNoLiteralNumberAssignments: (opts: { include?: string[]; exclude?: string[] }) => {
+      return checkedAssignments(opts).every(({ value }) => !isNumberLiteral(value));
+    },
+    assertNoLiteralNumbersInAssignments: (opts: { include?: string[]; exclude?: string[] }) => {
+      return checkedAssignments(opts).every(
+        ({ value }) => !extractExpressions([value], LiteralExpression).some(isNumberLiteral)
+      );
+    },
+    countLinesOfCode: () => countLinesOfCode(sourceCode),
+    assertMaxLinesOfCode: (limit: number) => countLinesOfCode(sourceCode) <= limit,
+    assertFunctionDefined: (name: string) => {
+      const formatted = snakeToCamel(name);
+      return functionDeclarations().some(fd => fd.name.lexeme === formatted);
+    },
+    countFunctionDefinitions: () => functionDeclarations().length,
+    assertMethodCalled: (methodName: string) => methodNames().includes(snakeToCamel(methodName)),
+    countMethodCalls: () => methodNames().length,
+    countArrayLiterals: () => index.nodesOf(ArrayExpression).length,
+    assertFunctionCalledOutsideOwnDefinition: (funcName: string) => {
+      const formatted = snakeToCamel(funcName);
+      return index.memo(`calledOutsideOwnDefinition:${formatted}`, () =>
+        extractCallExpressionsExcludingFunctionBody(statements, formatted).some(call => calleeName(call) === formatted)
+      );
+    },
+    assertFunctionCallsAnotherFunction: (funcName: string) => {
+      const formatted = snakeToCamel(funcName);
+      const fn = functionDeclarations().find(fd => fd.name.lexeme === formatted);
+      if (!fn) {
+        return false;
+      }
+      const definedNames = index.memo(
+        "functionNames",
+        () => new Set(functionDeclarations().map(fd => fd.name.lexeme))
+      );
+      return ProgramIndex.for(fn.body)
+        .nodesOf(CallExpression)
+        .some(call => {
+          const callee = calleeName(call);
+          return callee !== undefined && callee !== formatted && definedNames.has(callee);
+        });
+    },
+    numFunctionCallsInCode: (funcName: string) => callsTo(funcName).length,
+    assertOperatorUsed: (operator: string) =>
+      index.memo("operators", () => new Set(extractOperators(statements))).has(operator),
+    assertStatement: (type: string, opts?: { args?: Array<unknown>; count?: number }) => {
+      const candidates = index.memo(`statements:${type}`, () => extractStatementsByType(statements, type));
+      const args = opts?.args;
+      const matches =
+        args === undefined ? candidates : candidates.filter(stmt => statementMatchesArguments(stmt, args));
+      return opts?.count !== undefined ? matches.length === opts.count : matches.length >= 1;
+    },
+    assertMaxLoopNestingDepth: (depth: 1 | 2) =>
+      index.memo("maxLoopNestingDepth", () => maxLoopNestingDepth(statements)) <= depth,
+  };
+}
@@ -5,6 +5,8 @@ import { RuntimeError } from "./executor";
 import { InterpreterInternalError } from "./error";
 import type { Translator } from "../shared/i18n";
 
+let nextEnvironmentId = 0;
+
 interface VariableMetadata {
   value: JikiObject;
   isConst: boolean;
@@ -12,7 +14,7 @@ interface VariableMetadata {
 
 export class Environment {
   private readonly variables: Map<string, VariableMetadata> = new Map();
-  public readonly id: string;
+  public readonly id: number; // Useful for debugging
   private readonly languageFeatures: LanguageFeatures;
   // The per-run translate function, shared down the scope chain: a child scope
   // inherits its enclosing scope's, and the root receives it from the executor.
@@ -23,7 +25,7 @@ export class Environment {
     private readonly enclosing: Environment | null = null,
     translate?: Translator
   ) {
-    this.id = Math.random().toString(36).substring(7);
+    this.id = ++nextEnvironmentId;
     this.languageFeatures = languageFeatures;
     const resolved = translate ?? enclosing?.translate;
     if (resolved === undefined) {
@@ -60,63 +62,57 @@ export class Environment {
   }
 
   public isDefinedInEnclosingScope(name: string): boolean {
-    if (this.enclosing === null) {
-      return false;
-    }
-
-    // Check if the variable is defined in any enclosing scope
-    if (this.enclosing.variables.has(name)) {
-      return true;
-    }
-
-    return this.enclosing.isDefinedInEnclosingScope(name);
+    return this.enclosing !== null && this.enclosing.getDefiningEnvironment(name) !== null;
   }
 
   public get(name: string): JikiObject | undefined {
-    const metadata = this.variables.get(name);
-    if (metadata) {
-      return metadata.value;
-    }
-
-    if (this.enclosing !== null) {
-      return this.enclosing.get(name);
-    }
-
-    return undefined;
+    return this.lookup(name)?.value;
   }
 
   public update(name: string, value: JikiObject, location: Location): boolean {
-    const metadata = this.variables.get(name);
-    if (metadata) {
-      // Check if variable is const
-      if (metadata.isConst) {
-        const message = this.translate(`error.runtime.AssignmentToConstant`, { name });
-        throw new RuntimeError(message, location, "AssignmentToConstant", { name });
-      }
-      this.variables.set(name, { ...metadata, value });
-      return true;
+    const metadata = this.lookup(name);
+    if (metadata === undefined) {
+      // Variable not found in any scope
+      return false;
     }
 
-    if (this.enclosing !== null) {
-      return this.enclosing.update(name, value, location);
+    // Check if variable is const
+    if (metadata.isConst) {
+      const message = this.translate(`error.runtime.AssignmentToConstant`, { name });
+      throw new RuntimeError(message, location, "AssignmentToConstant", { name });
     }
-
-    // Variable not found in any scope
-    return false;
+    // The metadata record is private to this scope, so it's updated in place.
+    metadata.value = value;
+    return true;
   }
 
   // Returns the nearest enclosing environment (including self) that defines `name`,
   // or null if the name isn't defined anywhere in the chain.
   public getDefiningEnvironment(name: string): Environment | null {
-    if (this.variables.has(name)) {
-      return this;
-    }
-    if (this.enclosing !== null) {
-      return this.enclosing.getDefiningEnvironment(name);
+    let current: Environment | null = this;
+    while (current !== null) {
+      if (current.variables.has(name)) {
+        return current;
+      }
+      current = current.enclosing;
     }
     return null;
   }
 
+  // Every loop iteration and block opens a scope, so lookups from deep inside
+  // nested loops walk a long chain. Walk it iteratively with a single probe per scope.
+  private lookup(name: string): VariableMetadata | undefined {
+    let current: Environment | null = this;
+    while (current !== null) {
+      const metadata = current.variables.get(name);
+      if (metadata !== undefined) {
+        return metadata;
+      }
+      current = current.enclosing;
+    }
+    return undefined;
+  }
+
   public getAllVariables(): Record<string, JikiObject> {
     const result: Record<string, JikiObject> = {};
 
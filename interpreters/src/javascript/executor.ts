@@ -41,12 +41,19 @@ import type { JikiObject } from "./jikiObjects";
 import { JikiObject as JikiObjectBase } from "../shared/jikiObject";
 import { buildTranslator } from "./translator";
 import type { Translator } from "../shared/i18n";
-import { timeToMs, type Frame, type FrameExecutionStatus } from "../shared/frames";
+import {
+  ExecutionFrame,
+  LoopIterationFrame,
+  timeToMs,
+  type Frame,
+  type FrameDescriber,
+  type FrameExecutionStatus,
+} from "../shared/frames";
+import { VariableSnapshotLog, augmentFrameForTests } from "../shared/variableSnapshots";
 import { type ExecutionContext as SharedExecutionContext } from "../shared/interfaces";
 import { createBaseExecutionContext } from "../shared/executionContext";
 import type { EvaluationContext } from "./interpreter";
 import { describeFrame } from "./frameDescribers";
-import cloneDeep from "lodash.clonedeep";
 import { JSCallable, ReturnValue } from "./functions";
 
 // Import individual executors
@@ -83,21 +90,8 @@ import { StdlibError } from "./stdlib";
 import { consoleMethods } from "./stdlib/console";
 import { mathMethods } from "./stdlib/math";
 import { objectMethods } from "./stdlib/object";
-import {
-  extractCallExpressions,
-  extractExpressions,
-  extractVariableAssignments,
-  snakeToCamel as formatIdentifier,
-  countLinesOfCode,
-  extractFunctionDeclarations,
-  extractMethodCalls,
-  countArrayExpressions,
-  extractCallExpressionsExcludingFunctionBody,
-  extractCallExpressionsWithinFunctionBody,
-  extractOperators,
-  findMatchingStatements,
-  maxLoopNestingDepth,
-} from "./assertion-helpers";
+import { buildAssertors } from "./assertion-helpers";
+import { ExecutionBudget } from "../shared/executionBudget";
 import { createRandomFn } from "../shared/random";
 
 // Execution context for JavaScript stdlib
@@ -148,6 +142,7 @@ export type RuntimeErrorType =
   | "MethodNotYetAvailable"
   | "PropertyNotYetAvailable"
   | "MaxIterationsReached"
+  | "MaxExecutionTimeExceeded"
   | "RepeatCountMustBeNumber"
   | "RepeatCountMustBeNonNegative"
   | "RepeatCountTooHigh"
@@ -206,10 +201,12 @@ export interface ExecutorResult {
 
 export class Executor {
   private readonly frames: Frame[] = [];
+  private readonly variableSnapshots = new VariableSnapshotLog();
   public time: number = 0;
   private readonly timePerFrame: number = 1;
   private totalLoopIterations = 0;
   private readonly maxTotalLoopIterations: number;
+  private readonly budget: ExecutionBudget;
   public readonly logLines: Array<{ time: number; timeInMs: number; output: string }> = [];
   public readonly functionCallLog: Array<{ name: string; args: any[]; return: any }> = [];
   public _exerciseFinished: boolean = false;
@@ -220,6 +217,11 @@ export class Executor {
   public readonly translate: Translator;
   private readonly protectedNames: Set<string> = new Set();
   public readonly secretConstantNames: Set<string> = new Set();
+  private readonly describer: FrameDescriber = frame =>
+    describeFrame(frame, {
+      functionDescriptions: {}, // JavaScript doesn't have external functions yet
+      t: this.translate,
+    });
 
   constructor(
     private readonly sourceCode: string,
@@ -236,6 +238,7 @@ export class Executor {
       ...context.languageFeatures,
     };
     this.maxTotalLoopIterations = this.languageFeatures.maxTotalLoopIterations ?? 1000;
+    this.budget = new ExecutionBudget(this.languageFeatures.maxWallClockTimeMs);
     this.environment = new Environment(this.languageFeatures, null, this.translate);
     this.globalEnvironment = this.environment;
 
@@ -393,100 +396,7 @@ export class Executor {
       success: !this.frames.find(f => f.status === "ERROR"),
       functionCallLog: this.functionCallLog,
 
-      assertors: {
-        assertAllArgumentsAreVariables: () => {
-          return extractCallExpressions(statements).every((expr: CallExpression) => {
-            return expr.args.every((arg: Expression) => {
-              return !(arg instanceof LiteralExpression);
-            });
-          });
-        },
-        assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => {
-          const formatted = formatIdentifier(funcName);
-          return extractCallExpressions(statements)
-            .filter(
-              (expr: CallExpression) =>
-                expr.callee instanceof IdentifierExpression && expr.callee.name.lexeme === formatted
-            )
-            .every((expr: CallExpression) => {
-              return expr.args.every((arg: Expression, i: number) => {
-                if (!flags[i]) {
-                  return true;
-                }
-                return !(arg instanceof LiteralExpression);
-              });
-            });
-        },
-        assertNoLiteralNumberAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-          const formattedInclude = include?.map(formatIdentifier);
-          const formattedExclude = exclude?.map(formatIdentifier);
-          return extractVariableAssignments(statements).every(({ name, value }) => {
-            if (formattedExclude?.includes(name)) {
-              return true;
-            }
-            if (formattedInclude && !formattedInclude.includes(name)) {
-              return true;
-            }
-            return !(value instanceof LiteralExpression && typeof value.value === "number");
-          });
-        },
-        assertNoLiteralNumbersInAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-          const formattedInclude = include?.map(formatIdentifier);
-          const formattedExclude = exclude?.map(formatIdentifier);
-          return extractVariableAssignments(statements).every(({ name, value }) => {
-            if (formattedExclude?.includes(name)) {
-              return true;
-            }
-            if (formattedInclude && !formattedInclude.includes(name)) {
-              return true;
-            }
-            return extractExpressions([value], LiteralExpression).filter(l => typeof l.value === "number").length === 0;
-          });
-        },
-        countLinesOfCode: () => countLinesOfCode(this.sourceCode),
-        assertMaxLinesOfCode: (limit: number) => countLinesOfCode(this.sourceCode) <= limit,
-        assertFunctionDefined: (name: string) => {
-          const formatted = formatIdentifier(name);
-          return extractFunctionDeclarations(statements).some(fd => fd.name.lexeme === formatted);
-        },
-        countFunctionDefinitions: () => extractFunctionDeclarations(statements).length,
-        assertMethodCalled: (methodName: string) => {
-          const formatted = formatIdentifier(methodName);
-          return extractMethodCalls(statements).some(mc => mc.methodName === formatted);
-        },
-        countMethodCalls: () => extractMethodCalls(statements).length,
-        countArrayLiterals: () => countArrayExpressions(statements),
-        assertFunctionCalledOutsideOwnDefinition: (funcName: string) => {
-          const formatted = formatIdentifier(funcName);
-          const callsOutside = extractCallExpressionsExcludingFunctionBody(statements, formatted);
-          return callsOutside.some(
-            call => call.callee instanceof IdentifierExpression && call.callee.name.lexeme === formatted
-          );
-        },
-        assertFunctionCallsAnotherFunction: (funcName: string) => {
-          const formatted = formatIdentifier(funcName);
-          const definedNames = new Set(extractFunctionDeclarations(statements).map(fd => fd.name.lexeme));
-          const calls = extractCallExpressionsWithinFunctionBody(statements, formatted);
-          return calls.some(
-            call =>
-              call.callee instanceof IdentifierExpression &&
-              call.callee.name.lexeme !== formatted &&
-              definedNames.has(call.callee.name.lexeme)
-          );
-        },
-        numFunctionCallsInCode: (funcName: string) => {
-          const formatted = formatIdentifier(funcName);
-          return extractCallExpressions(statements).filter(
-            expr => expr.callee instanceof IdentifierExpression && expr.callee.name.lexeme === formatted
-          ).length;
-        },
-        assertOperatorUsed: (operator: string) => extractOperators(statements).includes(operator),
-        assertStatement: (type: string, opts?: { args?: Array<unknown>; count?: number }) => {
-          const matches = findMatchingStatements(statements, type, opts?.args);
-          return opts?.count !== undefined ? matches.length === opts.count : matches.length >= 1;
-        },
-        assertMaxLoopNestingDepth: (depth: 1 | 2) => maxLoopNestingDepth(statements) <= depth,
-      },
+      assertors: buildAssertors(statements, this.sourceCode),
     };
   }
 
@@ -548,6 +458,10 @@ export class Executor {
       return;
     }
 
+    if (this.budget.exhausted()) {
+      this.error("MaxExecutionTimeExceeded", statement.location);
+    }
+
     // Safety check: ensure this node type is allowed
     this.assertNodeAllowed(statement);
 
@@ -735,30 +649,40 @@ export class Executor {
     error?: RuntimeError,
     context?: Statement | Expression
   ): void {
-    const frame: Frame = {
-      code: location.toCode(this.sourceCode),
-      line: location.line,
-      status,
-      result: result || undefined,
-      error,
-      time: this.time,
-      timeInMs: timeToMs(this.time),
-      generateDescription: () =>
-        describeFrame(frame, {
-          functionDescriptions: {}, // JavaScript doesn't have external functions yet
-          t: this.translate,
-        }),
-      context: context,
-    };
+    const frame: Frame = new ExecutionFrame(location, this.sourceCode, status, this.time, this.describer);
+    frame.result = result || undefined;
+    frame.error = error;
+    frame.context = context;
+    this.recordFrame(frame);
+  }
 
+  /**
+   * Record the frame a loop starts each iteration with. `template` holds the
+   * result fields every iteration of this run of the loop shares and `fields`
+   * this iteration's own; the result is only put together if it's read.
+   */
+  public addLoopIterationFrame<T extends EvaluationResult>(
+    statement: Statement,
+    template: Partial<T>,
+    fields: Partial<T>
+  ): void {
+    const frame: Frame = new LoopIterationFrame(
+      statement.location,
+      this.sourceCode,
+      this.time,
+      this.describer,
+      template,
+      fields
+    );
+    frame.context = statement;
+    this.recordFrame(frame);
+  }
+
+  private recordFrame(frame: Frame): void {
     // In testing mode (but not benchmarks), augment frame with test-only fields
     if (process.env.NODE_ENV === "test" && process.env.RUNNING_BENCHMARKS !== "true") {
-      (frame as any).variables = cloneDeep(this.getVariables());
-      // Generate description immediately for testing
-      (frame as any).description = describeFrame(frame, {
-        functionDescriptions: {}, // JavaScript doesn't have external functions yet
-        t: this.translate,
-      });
+      const snapshotIndex = this.variableSnapshots.record(this.getVariables());
+      augmentFrameForTests(frame, this.variableSnapshots, snapshotIndex, () => frame.generateDescription());
     }
 
     this.frames.push(frame);
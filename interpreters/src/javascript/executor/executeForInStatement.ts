@@ -1,5 +1,6 @@
 import type { Executor } from "../executor";
 import type { ForInStatement } from "../statement";
+import type { EvaluationResultForInStatement } from "../evaluation-result";
 import { Environment } from "../environment";
 import { JSDictionary, JSString } from "../jikiObjects";
 
@@ -46,6 +47,8 @@ export function executeForInStatement(executor: Executor, statement: ForInStatem
   try {
     executor.environment = loopEnvironment;
 
+    const template = { type: "ForInStatement" as const, variable: statement.variable.lexeme, object: objectResult };
+
     // Execute the loop with break/continue handling
     executor.executeLoop(() => {
       let iteration = 0;
@@ -62,15 +65,10 @@ export function executeForInStatement(executor: Executor, statement: ForInStatem
         executor.environment.define(statement.variable.lexeme, keyValue, statement.variable.location);
 
         // Generate a frame for this iteration
-        executor.executeFrame(statement, () => {
-          return {
-            type: "ForInStatement" as const,
-            variable: statement.variable.lexeme,
-            object: objectResult,
-            currentKey: keyValue,
-            iteration,
-            immutableJikiObject: keyValue.clone(),
-          };
+        executor.addLoopIterationFrame<EvaluationResultForInStatement>(statement, template, {
+          currentKey: keyValue,
+          iteration,
+          immutableJikiObject: keyValue.clone(),
         });
 
         // Execute the loop body with continue handling
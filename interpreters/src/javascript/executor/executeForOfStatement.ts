@@ -1,7 +1,8 @@
 import type { Executor } from "../executor";
 import type { ForOfStatement } from "../statement";
+import type { EvaluationResultForOfStatement } from "../evaluation-result";
 import { Environment } from "../environment";
-import { JSArray, JSString } from "../jikiObjects";
+import { JSArray, JSString, type JikiObject } from "../jikiObjects";
 
 export function executeForOfStatement(executor: Executor, statement: ForOfStatement): void {
   // Evaluate the iterable expression. This does NOT generate its own frame:
@@ -22,11 +23,16 @@ export function executeForOfStatement(executor: Executor, statement: ForOfStatem
     return;
   }
 
-  // Get the array of elements to iterate over
+  // Get the array of elements to iterate over. Arrays are read through the live
+  // object on every iteration (rather than a captured array) so that writes made
+  // by the loop body are seen, as they are in native JavaScript.
   const elements = iterable.value;
+  const elementCount = () => (iterable instanceof JSArray ? iterable.length : elements.length);
+  const elementAt = (index: number) =>
+    (iterable instanceof JSArray ? iterable.getElement(index) : elements[index]) as JikiObject | string;
 
   // If the iterable is empty, generate a single frame showing the for...of setup
-  if (elements.length === 0) {
+  if (elementCount() === 0) {
     executor.executeFrame(statement, () => {
       return {
         type: "ForOfStatement" as const,
@@ -46,11 +52,14 @@ export function executeForOfStatement(executor: Executor, statement: ForOfStatem
   try {
     executor.environment = loopEnvironment;
 
+    const template = { type: "ForOfStatement" as const, variable: statement.variable.lexeme, iterable: iterableResult };
+
     // Execute the loop with break/continue handling
     executor.executeLoop(() => {
       let iteration = 0;
 
-      for (const element of elements) {
+      for (let index = 0; index < elementCount(); index++) {
+        const element = elementAt(index);
         iteration++;
 
         // Guard against infinite loops
@@ -63,15 +72,10 @@ export function executeForOfStatement(executor: Executor, statement: ForOfStatem
         executor.environment.define(statement.variable.lexeme, elementValue, statement.variable.location);
 
         // Generate a frame for this iteration
-        executor.executeFrame(statement, () => {
-          return {
-            type: "ForOfStatement" as const,
-            variable: statement.variable.lexeme,
-            iterable: iterableResult,
-            currentElement: elementValue,
-            iteration,
-            immutableJikiObject: elementValue.clone(),
-          };
+        executor.addLoopIterationFrame<EvaluationResultForOfStatement>(statement, template, {
+          currentElement: elementValue,
+          iteration,
+          immutableJikiObject: elementValue.clone(),
         });
 
         // Execute the loop body with continue handling
@@ -70,19 +70,14 @@ function executeLoop(
   try {
     executor.environment = loopEnvironment;
 
+    const template = { type: "RepeatStatement" as const, count: countResult };
     executor.executeLoop(() => {
       let iteration = 0;
       while (count === null || iteration < count) {
         iteration++;
         executor.guardInfiniteLoop(statement.keyword.location);
 
-        executor.executeFrame<EvaluationResultRepeatStatement>(statement, () => {
-          return {
-            type: "RepeatStatement",
-            count: countResult,
-            iteration,
-          };
-        });
+        executor.addLoopIterationFrame<EvaluationResultRepeatStatement>(statement, template, { iteration });
 
         executor.executeLoopIteration(() => {
           executor.executeStatement(statement.body);
@@ -44,6 +44,9 @@ export interface LanguageFeatures {
   requireSemicolons?: boolean;
   enforceFormatting?: boolean;
   maxTotalLoopIterations?: number;
+  // Wall-clock limit on a run, in milliseconds (see shared/executionBudget.ts).
+  // Unlike maxTotalLoopIterations it also stops deep recursion and slow calls.
+  maxWallClockTimeMs?: number;
   repeatDelay?: number;
   /**
    * Enable native JavaScript behavior for edge cases that don't make pedagogical sense.
@@ -1,30 +1,16 @@
 import { Parser } from "./parser";
 import { Executor } from "./executor";
 import { buildTranslator } from "./translator";
-import { InterpreterInternalError, type SyntaxError as JSSyntaxError } from "./error";
+import { InterpreterInternalError, type LintError, type SyntaxError as JSSyntaxError } from "./error";
 import type { CompilationResult } from "../shared/errors";
 import type { LanguageFeatures } from "./interfaces";
 import type { ExternalFunction, InterpretResult } from "../shared/interfaces";
 import type { JikiObject } from "./jikiObjects";
 import type { JSClass } from "./jsObjects/JSClass";
-import {
-  extractCallExpressions,
-  extractExpressions,
-  extractVariableAssignments,
-  snakeToCamel as formatIdentifier,
-  countLinesOfCode,
-  extractFunctionDeclarations,
-  extractMethodCalls,
-  countArrayExpressions,
-  extractCallExpressionsExcludingFunctionBody,
-  extractCallExpressionsWithinFunctionBody,
-  extractOperators,
-  findMatchingStatements,
-  maxLoopNestingDepth,
-} from "./assertion-helpers";
-import type { CallExpression } from "./expression";
-import { LiteralExpression, IdentifierExpression, type Expression } from "./expression";
-import type { Messages } from "../shared/i18n";
+import { buildAssertors } from "./assertion-helpers";
+import type { Messages, Translator } from "../shared/i18n";
+import type { Statement } from "./statement";
+import { ProgramCache, programCacheKey } from "../shared/programCache";
 
 // Evaluation context that includes external functions
 export interface EvaluationContext {
@@ -48,15 +34,36 @@ export type EvaluateFunctionResult = InterpretResult & {
   jikiObject?: JikiObject;
 };
 
+interface ParsedProgram {
+  statements: Statement[];
+  lintErrors: LintError[];
+}
+
+// Parsed programs, shared by every run of the same code. Lint messages are
+// translated, so the locale is part of the key.
+const programCache = new ProgramCache<ParsedProgram>(32);
+
+function parseProgram(sourceCode: string, context: EvaluationContext, translate: Translator): ParsedProgram {
+  const key = programCacheKey(sourceCode, context.languageFeatures ?? null, context.localeMessages);
+  return programCache.getOrParse(key, () => {
+    const parser = new Parser(context, translate);
+    const statements = parser.parse(sourceCode);
+    return { statements, lintErrors: parser.lintErrors };
+  });
+}
+
+export function clearProgramCache(): void {
+  programCache.clear();
+}
+
 /**
  * Compiles JavaScript source code without executing it.
  * Returns { success: true } on successful compilation or { success: false, error } on parse/syntax errors.
  */
 export function compile(sourceCode: string, context: EvaluationContext = {}): CompilationResult {
   try {
-    const parser = new Parser(context, buildTranslator(context.localeMessages));
-    parser.parse(sourceCode);
-    return { success: true, lintErrors: parser.lintErrors };
+    const { lintErrors } = parseProgram(sourceCode, context, buildTranslator(context.localeMessages));
+    return { success: true, lintErrors: [...lintErrors] };
   } catch (error: unknown) {
     return { success: false, error: error as JSSyntaxError, lintErrors: [] };
   }
@@ -69,9 +76,9 @@ export function interpret(sourceCode: string, context: EvaluationContext = {}):
     const translate = buildTranslator(context.localeMessages);
 
     // Parse the source code (compilation step)
-    const parser = new Parser(context, translate);
-    const statements = parser.parse(sourceCode);
-    const lintErrors = parser.lintErrors;
+    const program = parseProgram(sourceCode, context, translate);
+    const statements = program.statements;
+    const lintErrors = [...program.lintErrors];
 
     // Execute statements
     const executor = new Executor(sourceCode, context, translate);
@@ -153,17 +160,16 @@ export function evaluateFunction(
   const translate = buildTranslator(context.localeMessages);
 
   // Parse the student's source code - let parse errors throw (matches JikiScript behavior)
-  const parser = new Parser(context, translate);
-  const statements = parser.parse(sourceCode);
-  const lintErrors = parser.lintErrors;
+  const program = parseProgram(sourceCode, context, translate);
+  const statements = program.statements;
+  const lintErrors = [...program.lintErrors];
 
   // Generate the function call code
   const callingCode = `${functionName}(${args.map(arg => JSON.stringify(arg)).join(", ")})`;
 
   // Parse the calling code without node restrictions - this is infrastructure code, not student code
   const callingContext = { ...context, languageFeatures: { ...context.languageFeatures, allowedNodes: null } };
-  const callingParser = new Parser(callingContext, translate);
-  const callingStatements = callingParser.parse(callingCode);
+  const { statements: callingStatements } = parseProgram(callingCode, callingContext, translate);
 
   if (callingStatements.length !== 1) {
     throw new Error(`Expected exactly one statement for function call, got ${callingStatements.length}`);
@@ -194,99 +200,6 @@ export function evaluateFunction(
       statements: statements, // Return the original student code statements
       sourceCode: sourceCode,
     },
-    assertors: {
-      assertAllArgumentsAreVariables: () => {
-        return extractCallExpressions(statements).every((expr: CallExpression) => {
-          return expr.args.every((arg: Expression) => {
-            return !(arg instanceof LiteralExpression);
-          });
-        });
-      },
-      assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => {
-        const formatted = formatIdentifier(funcName);
-        return extractCallExpressions(statements)
-          .filter(
-            (expr: CallExpression) =>
-              expr.callee instanceof IdentifierExpression && expr.callee.name.lexeme === formatted
-          )
-          .every((expr: CallExpression) => {
-            return expr.args.every((arg: Expression, i: number) => {
-              if (!flags[i]) {
-                return true;
-              }
-              return !(arg instanceof LiteralExpression);
-            });
-          });
-      },
-      assertNoLiteralNumberAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-        const formattedInclude = include?.map(formatIdentifier);
-        const formattedExclude = exclude?.map(formatIdentifier);
-        return extractVariableAssignments(statements).every(({ name, value }) => {
-          if (formattedExclude?.includes(name)) {
-            return true;
-          }
-          if (formattedInclude && !formattedInclude.includes(name)) {
-            return true;
-          }
-          return !(value instanceof LiteralExpression && typeof value.value === "number");
-        });
-      },
-      assertNoLiteralNumbersInAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-        const formattedInclude = include?.map(formatIdentifier);
-        const formattedExclude = exclude?.map(formatIdentifier);
-        return extractVariableAssignments(statements).every(({ name, value }) => {
-          if (formattedExclude?.includes(name)) {
-            return true;
-          }
-          if (formattedInclude && !formattedInclude.includes(name)) {
-            return true;
-          }
-          return extractExpressions([value], LiteralExpression).filter(l => typeof l.value === "number").length === 0;
-        });
-      },
-      countLinesOfCode: () => countLinesOfCode(sourceCode),
-      assertMaxLinesOfCode: (limit: number) => countLinesOfCode(sourceCode) <= limit,
-      assertFunctionDefined: (name: string) => {
-        const formatted = formatIdentifier(name);
-        return extractFunctionDeclarations(statements).some(fd => fd.name.lexeme === formatted);
-      },
-      countFunctionDefinitions: () => extractFunctionDeclarations(statements).length,
-      assertMethodCalled: (methodName: string) => {
-        const formatted = formatIdentifier(methodName);
-        return extractMethodCalls(statements).some(mc => mc.methodName === formatted);
-      },
-      countMethodCalls: () => extractMethodCalls(statements).length,
-      countArrayLiterals: () => countArrayExpressions(statements),
-      assertFunctionCalledOutsideOwnDefinition: (funcName: string) => {
-        const formatted = formatIdentifier(funcName);
-        const callsOutside = extractCallExpressionsExcludingFunctionBody(statements, formatted);
-        return callsOutside.some(
-          call => call.callee instanceof IdentifierExpression && call.callee.name.lexeme === formatted
-        );
-      },
-      assertFunctionCallsAnotherFunction: (funcName: string) => {
-        const formatted = formatIdentifier(funcName);
-        const definedNames = new Set(extractFunctionDeclarations(statements).map(fd => fd.name.lexeme));
-        const calls = extractCallExpressionsWithinFunctionBody(statements, formatted);
-        return calls.some(
-          call =>
-            call.callee instanceof IdentifierExpression &&
-            call.callee.name.lexeme !== formatted &&
-            definedNames.has(call.callee.name.lexeme)
-        );
-      },
-      numFunctionCallsInCode: (funcName: string) => {
-        const formatted = formatIdentifier(funcName);
-        return extractCallExpressions(statements).filter(
-          expr => expr.callee instanceof IdentifierExpression && expr.callee.name.lexeme === formatted
-        ).length;
-      },
-      assertOperatorUsed: (operator: string) => extractOperators(statements).includes(operator),
-      assertStatement: (type: string, opts?: { args?: Array<unknown>; count?: number }) => {
-        const matches = findMatchingStatements(statements, type, opts?.args);
-        return opts?.count !== undefined ? matches.length === opts.count : matches.length >= 1;
-      },
-      assertMaxLoopNestingDepth: (depth: 1 | 2) => maxLoopNestingDepth(statements) <= depth,
-    },
+    assertors: buildAssertors(statements, sourceCode),
   };
 }
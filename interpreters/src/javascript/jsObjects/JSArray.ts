@@ -1,28 +1,48 @@
 import { JikiObject } from "../../shared/jikiObject";
 import { JSString } from "./JSString";
+import { CopyOnWriteArray } from "../../shared/copyOnWrite";
 
 export class JSArray extends JikiObject {
-  public readonly elements: JikiObject[];
+  private readonly store: CopyOnWriteArray;
 
-  constructor(elements: JikiObject[]) {
+  constructor(elements: JikiObject[] | CopyOnWriteArray) {
     super("list");
-    this.elements = elements;
+    this.store = elements instanceof CopyOnWriteArray ? elements : new CopyOnWriteArray(elements);
+  }
+
+  // Read-only view of the elements. Mutate through the methods below so that
+  // snapshots sharing the backing store are left untouched.
+  public get elements(): JikiObject[] {
+    return this.store.elements;
   }
 
   public get length(): number {
-    return this.elements.length;
+    return this.store.length;
   }
 
   public getElement(index: number): JikiObject | undefined {
-    return this.elements[index];
+    return this.store.get(index);
   }
 
   public setElement(index: number, value: JikiObject): void {
-    this.elements[index] = value;
+    this.store.set(index, value);
+  }
+
+  public push(...items: JikiObject[]): number {
+    return this.store.push(...items);
+  }
+
+  public pop(): JikiObject | undefined {
+    return this.store.pop();
+  }
+
+  // In-place mutation of the elements. Pass any elements the mutation inserts.
+  public mutate<R>(fn: (elements: JikiObject[]) => R, inserted?: readonly JikiObject[]): R {
+    return this.store.mutate(fn, inserted);
   }
 
   public get value(): JikiObject[] {
-    return this.elements;
+    return this.store.elements;
   }
 
   public toString(): string {
@@ -49,13 +69,7 @@ export class JSArray extends JikiObject {
   }
 
   public clone(): JSArray {
-    // Deep clone - handle sparse arrays correctly
-    const clonedElements: JikiObject[] = [];
-    for (let i = 0; i < this.elements.length; i++) {
-      if (i in this.elements) {
-        clonedElements[i] = this.elements[i].clone();
-      }
-    }
-    return new JSArray(clonedElements);
+    // Shares the backing store until either side next writes (deep clones nested containers)
+    return new JSArray(this.store.snapshot(elem => elem.clone()));
   }
 }
@@ -17,4 +17,8 @@ export class JSBoolean extends JikiObject {
     // Booleans are immutable, so return self
     return this;
   }
+
+  public get isImmutable(): boolean {
+    return true;
+  }
 }
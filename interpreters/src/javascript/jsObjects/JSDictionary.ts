@@ -1,12 +1,13 @@
 import { JikiObject } from "../../shared/jikiObject";
 import { JSString } from "./JSString";
+import { CopyOnWriteMap } from "../../shared/copyOnWrite";
 
 export class JSDictionary extends JikiObject {
-  private readonly map: Map<string, JikiObject>;
+  private readonly map: CopyOnWriteMap<string, JikiObject>;
 
-  constructor(map: Map<string, JikiObject>) {
+  constructor(map: Map<string, JikiObject> | CopyOnWriteMap<string, JikiObject>) {
     super("dictionary");
-    this.map = map;
+    this.map = map instanceof CopyOnWriteMap ? map : new CopyOnWriteMap(map);
   }
 
   public getProperty(key: string): JikiObject | undefined {
@@ -18,7 +19,7 @@ export class JSDictionary extends JikiObject {
   }
 
   public get value(): Map<string, JikiObject> {
-    return this.map;
+    return this.map.entries;
   }
 
   public toString(): string {
@@ -27,7 +28,7 @@ export class JSDictionary extends JikiObject {
     }
 
     const entries: string[] = [];
-    for (const [key, value] of this.map.entries()) {
+    for (const [key, value] of this.map.entries) {
       const keyStr = /^[a-zA-Z_$][a-zA-Z0-9_$]*$/.test(key) ? key : JSON.stringify(key);
       const valueStr = value instanceof JSString ? JSON.stringify(value.value) : value.toString();
       entries.push(`${keyStr}: ${valueStr}`);
@@ -37,11 +38,7 @@ export class JSDictionary extends JikiObject {
   }
 
   public clone(): JSDictionary {
-    // Deep clone - recursively clone all values
-    const clonedMap = new Map<string, JikiObject>();
-    for (const [key, value] of this.map.entries()) {
-      clonedMap.set(key, value.clone());
-    }
-    return new JSDictionary(clonedMap);
+    // Shares the backing store until either side next writes (deep clones nested containers)
+    return new JSDictionary(this.map.snapshot(value => value.clone()));
   }
 }
@@ -1,8 +1,9 @@
 import { JikiObject } from "../../shared/jikiObject";
+import { CopyOnWriteMap } from "../../shared/copyOnWrite";
 import type { JSClass, JSMethod, JSGetter, JSSetter } from "./JSClass";
 
 export class JSInstance extends JikiObject {
-  protected fields: Record<string, JikiObject> = {};
+  protected fields: CopyOnWriteMap<string, JikiObject> = new CopyOnWriteMap(new Map<string, JikiObject>());
 
   constructor(private readonly jsClass: JSClass) {
     super("instance");
@@ -31,27 +32,23 @@ export class JSInstance extends JikiObject {
     return this.jsClass.getSetter(name);
   }
   public getField(name: string): JikiObject {
-    return this.fields[name];
+    return this.fields.get(name) as JikiObject;
   }
   public getUnwrappedField(name: string): any {
-    const field = this.fields[name];
-    // Fields may not exist at runtime despite Record type - checking for undefined is valid
-    // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
+    const field = this.fields.get(name);
     if (field === undefined) {
       return field;
     }
     return field.value;
   }
   public setField(name: string, value: JikiObject): void {
-    this.fields[name] = value;
+    this.fields.set(name, value);
   }
   public clone(): JSInstance {
     // Create a new instance of the same class
     const clonedInstance = new JSInstance(this.jsClass);
-    // Deep clone all fields
-    for (const [name, value] of Object.entries(this.fields)) {
-      clonedInstance.fields[name] = value.clone();
-    }
+    // Share the fields until either side next writes (deep clones nested containers)
+    clonedInstance.fields = this.fields.snapshot(value => value.clone());
     return clonedInstance;
   }
 }
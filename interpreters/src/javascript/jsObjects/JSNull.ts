@@ -17,4 +17,8 @@ export class JSNull extends JikiObject {
     // Null is immutable, so return self
     return this;
   }
+
+  public get isImmutable(): boolean {
+    return true;
+  }
 }
@@ -52,4 +52,8 @@ export class JSNumber extends JikiObject {
     // Numbers are immutable, so return self
     return this;
   }
+
+  public get isImmutable(): boolean {
+    return true;
+  }
 }
@@ -21,4 +21,8 @@ export class JSString extends JikiObject {
     // Strings are immutable, so return self
     return this;
   }
+
+  public get isImmutable(): boolean {
+    return true;
+  }
 }
@@ -17,4 +17,8 @@ export class JSUndefined extends JikiObject {
     // Undefined is immutable, so return self
     return this;
   }
+
+  public get isImmutable(): boolean {
+    return true;
+  }
 }
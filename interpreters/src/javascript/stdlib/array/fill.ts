@@ -30,7 +30,7 @@ export const fill: Method = {
 
     // Use native JavaScript fill() to fill the array in place
     // This handles negative indices, out of bounds, etc. automatically
-    array.elements.fill(value, start, end);
+    array.mutate(elements => elements.fill(value, start, end), [value]);
 
     // Return the filled array
     return array;
@@ -12,8 +12,7 @@ export const pop: Method = {
     // Validate no arguments
     guardNoArgs(args, "pop");
 
-    // Use native JavaScript pop() method
-    const element = array.elements.pop();
+    const element = array.pop();
 
     return element ?? new JSUndefined();
   },
@@ -17,8 +17,7 @@ export const push: Method = {
       ctx.logicError("There's no point in calling push with no inputs");
     }
 
-    // Use native JavaScript push() method
-    const newLength = array.elements.push(...args);
+    const newLength = array.push(...args);
 
     return new JSNumber(newLength);
   },
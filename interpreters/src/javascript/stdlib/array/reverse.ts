@@ -12,7 +12,7 @@ export const reverse: Method = {
     guardArgRange(args, 0, 0, "reverse");
 
     // Use native JavaScript reverse() to reverse the array in place
-    array.elements.reverse();
+    array.mutate(elements => elements.reverse());
 
     // Return the reversed array
     return array;
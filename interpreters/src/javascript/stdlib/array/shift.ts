@@ -13,7 +13,7 @@ export const shift: Method = {
     guardNoArgs(args, "shift");
 
     // Use native JavaScript shift() method
-    const element = array.elements.shift();
+    const element = array.mutate(elements => elements.shift());
 
     return element ?? new JSUndefined();
   },
@@ -13,17 +13,19 @@ export const sort: Method = {
 
     if (args.length === 0) {
       // Default sort: convert elements to strings and sort lexicographically
-      array.elements.sort((a, b) => {
-        const aStr = a.toString();
-        const bStr = b.toString();
-        if (aStr < bStr) {
-          return -1;
-        }
-        if (aStr > bStr) {
-          return 1;
-        }
-        return 0;
-      });
+      array.mutate(elements =>
+        elements.sort((a, b) => {
+          const aStr = a.toString();
+          const bStr = b.toString();
+          if (aStr < bStr) {
+            return -1;
+          }
+          if (aStr > bStr) {
+            return 1;
+          }
+          return 0;
+        })
+      );
     } else {
       // Custom comparator function provided
       // Note: This requires function support which may not be implemented yet
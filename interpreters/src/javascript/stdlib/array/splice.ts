@@ -28,7 +28,10 @@ export const splice: Method = {
 
     // Use native JavaScript splice() to mutate the array
     // This handles negative indices, out of bounds, etc. automatically
-    const deletedElements = array.elements.splice(start, deleteCount, ...itemsToInsert);
+    const deletedElements = array.mutate(
+      elements => elements.splice(start, deleteCount, ...itemsToInsert),
+      itemsToInsert
+    );
 
     // Return new JSArray with deleted elements
     return new JSArrayClass(deletedElements);
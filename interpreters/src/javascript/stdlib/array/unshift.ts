@@ -18,7 +18,7 @@ export const unshift: Method = {
     }
 
     // Use native JavaScript unshift() method
-    const newLength = array.elements.unshift(...args);
+    const newLength = array.mutate(elements => elements.unshift(...args), args);
 
     return new JSNumber(newLength);
   },
@@ -0,0 +1,61 @@
+import {
+  BinaryExpression,
+  Expression,
+  GroupingExpression,
+  LiteralExpression,
+  LogicalExpression,
+  UnaryExpression,
+} from "./expression";
+import type { Statement } from "./statement";
+
+// Expressions that are pure functions of their operands: given constant
+// operands they always produce the same result (or the same error).
+const FOLDABLE = [BinaryExpression, LogicalExpression, UnaryExpression, GroupingExpression];
+
+/**
+ * Marks every constant subexpression of a program: literals, and arithmetic,
+ * comparisons, logic and grouping over constants.
+ *
+ * The executor evaluates a marked expression normally the first time, then
+ * keeps the result on the node and hands back that same result every time
+ * after. So literal maths and conditions like `if 1 < 2` inside a `repeat`
+ * are evaluated once rather than on every iteration. The result tree is the
+ * same shape as before, so frames and their descriptions don't change.
+ * Results are only kept once evaluation succeeds, so an expression that errors
+ * (e.g. `"a" + 1`) still errors, in the current locale, every time it runs.
+ *
+ * The marks (and kept results) are idempotent annotations, which makes them
+ * safe on the shared ASTs in the program cache.
+ */
+export function foldConstants(statements: Statement[]): Statement[] {
+  for (const statement of statements) {
+    markConstants(statement);
+  }
+  return statements;
+}
+
+function markConstants(node: Statement | Expression | null | undefined): boolean {
+  // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
+  if (!node || typeof node.children !== "function") {
+    return false;
+  }
+
+  // Every child is visited, even once this node is known not to be constant,
+  // so constant subtrees inside it are marked too.
+  let childrenConstant = true;
+  for (const child of node.children()) {
+    if (!markConstants(child)) {
+      childrenConstant = false;
+    }
+  }
+
+  if (!(node instanceof Expression)) {
+    return false;
+  }
+  const isConstant =
+    node instanceof LiteralExpression || (childrenConstant && FOLDABLE.some(type => node instanceof type));
+  if (isConstant) {
+    node.isConstant = true;
+  }
+  return isConstant;
+}
@@ -4,24 +4,19 @@ import type { Token } from "./token";
 import { isString } from "./checks";
 import * as Jiki from "./jikiObjects";
 
+let nextEnvironmentId = 0;
+
 export class Environment {
   private readonly values: Map<string, any> = new Map();
-  public readonly id; // Useful for debugging
+  public readonly id: number; // Useful for debugging
 
   constructor(private readonly enclosing: Environment | null = null) {
-    this.id = Math.random().toString(36).substring(7);
+    this.id = ++nextEnvironmentId;
   }
 
   public inScope(name: Token | string): boolean {
     const nameString = isString(name) ? name : name.lexeme;
-
-    if (this.values.has(nameString)) {
-      return true;
-    }
-    if (this.enclosing !== null) {
-      return this.enclosing.inScope(nameString);
-    }
-    return false;
+    return this.definingEnvironment(nameString) !== null;
   }
 
   public define(name: string, value: Jiki.JikiObject | Jiki.Class | UserDefinedFunction): void {
@@ -33,31 +28,23 @@ export class Environment {
   }
 
   public get(name: Token): any {
-    if (this.values.has(name.lexeme)) {
-      return this.values.get(name.lexeme);
-    }
-
-    // Try the enclosing environment(s), but handle the error here so we can
-    // make use of the didYouMean function
-    try {
-      if (this.enclosing !== null) {
-        return this.enclosing.get(name);
-      }
-    } catch {
-      // Silently ignore error and return undefined
-    }
+    return this.definingEnvironment(name.lexeme)?.values.get(name.lexeme);
   }
 
   public updateVariable(name: Token, value: any): void {
-    if (this.values.has(name.lexeme)) {
-      this.values.set(name.lexeme, value);
-      return;
-    }
+    this.definingEnvironment(name.lexeme)?.values.set(name.lexeme, value);
+  }
 
-    if (this.enclosing?.get(name)) {
-      this.enclosing.updateVariable(name, value);
-      return;
+  // Walk the chain iteratively rather than recursing through each scope.
+  private definingEnvironment(name: string): Environment | null {
+    let current: Environment | null = this;
+    while (current !== null) {
+      if (current.values.has(name)) {
+        return current;
+      }
+      current = current.enclosing;
     }
+    return null;
   }
 
   public variables(): Record<string, any> {
@@ -20,8 +20,8 @@ import type {
   ClassLookupExpression,
   AccessorExpression,
   ThisExpression,
+  LiteralExpression,
 } from "./expression";
-import { LiteralExpression } from "./expression";
 import { Location, Span } from "./location";
 import type {
   BlockStatement,
@@ -69,31 +69,26 @@ import type {
   EvaluationResultThisExpression,
 } from "./evaluation-result";
 import { translate } from "./translator";
-import cloneDeep from "lodash.clonedeep";
 import type { CallableCustomFunction } from "./interpreter";
 import type { InterpretResult } from "../shared/interfaces";
 import type { LanguageFeatures } from "./interpreter";
 
-import { timeToMs, type Frame, type FrameExecutionStatus, type TestAugmentedFrame } from "../shared/frames";
+import {
+  ExecutionFrame,
+  LoopIterationFrame,
+  timeToMs,
+  type Frame,
+  type FrameDescriber,
+  type FrameExecutionStatus,
+} from "../shared/frames";
+import { VariableSnapshotLog, augmentFrameForTests } from "../shared/variableSnapshots";
 import { type ExecutionContext as SharedExecutionContext } from "../shared/interfaces";
 import { createBaseExecutionContext } from "../shared/executionContext";
 import { describeFrame } from "./frameDescribers";
 import { executeFunctionCallExpression } from "./executor/executeFunctionCallExpression";
 import { executeIfStatement } from "./executor/executeIfStatement";
 import didYouMean from "didyoumean";
-import {
-  extractExpressions,
-  extractFunctionCallExpressions,
-  extractVariableAssignments,
-  formatJikiObject,
-  formatIdentifier,
-  countLinesOfCode,
-  extractFunctionStatements,
-  extractMethodCallExpressions,
-  countListExpressions,
-  extractFunctionCallExpressionsExcludingBody,
-  extractOperators,
-} from "./helpers";
+import { buildAssertors, formatJikiObject } from "./helpers";
 import { executeBinaryExpression } from "./executor/executeBinaryExpression";
 import * as Jiki from "./jikiObjects";
 import { executeMethodCallExpression } from "./executor/executeMethodCallExpression";
@@ -122,6 +117,7 @@ import { executeMethodCallStatement } from "./executor/executeMethodCallStatemen
 import { executeFunctionLookupExpression } from "./executor/executeFunctionLookupExpression";
 import { executeClassLookupExpression } from "./executor/executeClassLookupExpression";
 import { executeChangePropertyStatement } from "./executor/executeChangePropertyStatement";
+import { ExecutionBudget } from "../shared/executionBudget";
 import { createRandomFn } from "../shared/random";
 
 export type ExecutionContext = SharedExecutionContext & {
@@ -140,9 +136,17 @@ export interface ExternalFunction {
   arity?: Arity;
 }
 
+// Reads a list by index on every step so that elements pushed mid-loop are seen
+function* liveElements(list: Jiki.List): Generator<Jiki.JikiObject> {
+  for (let i = 0; i < list.length; i++) {
+    yield list.getElement(i) as Jiki.JikiObject;
+  }
+}
+
 export class Executor {
   [key: string]: any; // Allow dynamic method access
   private readonly frames: Frame[] = [];
+  private readonly variableSnapshots = new VariableSnapshotLog();
   public readonly logLines: Array<{ time: number; timeInMs: number; output: string }> = [];
   public time: number = 0;
   private readonly timePerFrame: number;
@@ -150,11 +154,16 @@ export class Executor {
   private readonly maxTotalLoopIterations: number = 0;
   public customFunctionDefinitionMode: boolean;
   private readonly addSuccessFrames: boolean;
+  private readonly budget: ExecutionBudget;
 
   private readonly globals = new Environment();
   public environment = this.globals;
 
   private readonly externalFunctionDescriptions: Record<string, string> = {};
+  private readonly describer: FrameDescriber = frame =>
+    describeFrame(frame, {
+      functionDescriptions: this.externalFunctionDescriptions,
+    });
 
   // This tracks variables for each statement, so we can output
   // the changes in the frame descriptions
@@ -209,6 +218,7 @@ export class Executor {
     this.customFunctionDefinitionMode = this.languageFeatures.customFunctionDefinitionMode;
 
     this.addSuccessFrames = this.languageFeatures.addSuccessFrames;
+    this.budget = new ExecutionBudget(this.languageFeatures.maxWallClockTimeMs);
   }
 
   // Environment wrapper methods
@@ -306,83 +316,7 @@ export class Executor {
         sourceCode: this.sourceCode,
       },
 
-      assertors: {
-        assertAllArgumentsAreVariables: () => {
-          return extractFunctionCallExpressions(statements).every((expr: FunctionCallExpression) => {
-            return expr.args.every((arg: Expression) => {
-              return !(arg instanceof LiteralExpression);
-            });
-          });
-        },
-        assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => {
-          const formatted = formatIdentifier(funcName);
-          return extractFunctionCallExpressions(statements)
-            .filter((expr: FunctionCallExpression) => expr.callee.name.lexeme === formatted)
-            .every((expr: FunctionCallExpression) => {
-              return expr.args.every((arg: Expression, i: number) => {
-                if (!flags[i]) {
-                  return true;
-                }
-                return !(arg instanceof LiteralExpression);
-              });
-            });
-        },
-        assertNoLiteralNumberAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-          const formattedInclude = include?.map(formatIdentifier);
-          const formattedExclude = exclude?.map(formatIdentifier);
-          return extractVariableAssignments(statements).every(({ name, value }) => {
-            if (formattedExclude?.includes(name)) {
-              return true;
-            }
-            if (formattedInclude && !formattedInclude.includes(name)) {
-              return true;
-            }
-            return !(value instanceof LiteralExpression && typeof value.value === "number");
-          });
-        },
-        assertNoLiteralNumbersInAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-          const formattedInclude = include?.map(formatIdentifier);
-          const formattedExclude = exclude?.map(formatIdentifier);
-          return extractVariableAssignments(statements).every(({ name, value }) => {
-            if (formattedExclude?.includes(name)) {
-              return true;
-            }
-            if (formattedInclude && !formattedInclude.includes(name)) {
-              return true;
-            }
-            return extractExpressions([value], LiteralExpression).filter(l => typeof l.value === "number").length === 0;
-          });
-        },
-        countLinesOfCode: () => countLinesOfCode(this.sourceCode),
-        assertMaxLinesOfCode: (limit: number) => countLinesOfCode(this.sourceCode) <= limit,
-        assertFunctionDefined: (name: string) => {
-          const formatted = formatIdentifier(name);
-          return extractFunctionStatements(statements).some(fs => fs.name.lexeme === formatted);
-        },
-        countFunctionDefinitions: () => extractFunctionStatements(statements).length,
-        assertMethodCalled: (methodName: string) => {
-          const formatted = formatIdentifier(methodName);
-          return extractMethodCallExpressions(statements).some(mc => mc.methodName.lexeme === formatted);
-        },
-        countMethodCalls: () => extractMethodCallExpressions(statements).length,
-        countArrayLiterals: () => countListExpressions(statements),
-        assertFunctionCalledOutsideOwnDefinition: (funcName: string) => {
-          const formatted = formatIdentifier(funcName);
-          const callsOutside = extractFunctionCallExpressionsExcludingBody(statements, formatted);
-          return callsOutside.some(call => call.callee.name.lexeme === formatted);
-        },
-        numFunctionCallsInCode: (funcName: string) => {
-          const formatted = formatIdentifier(funcName);
-          return extractFunctionCallExpressions(statements).filter(expr => expr.callee.name.lexeme === formatted)
-            .length;
-        },
-        // TODO: JS-only for now. Implement for Jikiscript when needed.
-        assertFunctionCallsAnotherFunction: () => false,
-        assertOperatorUsed: (operator: string) => extractOperators(statements).includes(operator),
-        // TODO: JS-only for now. Implement statement matching for Jikiscript when needed.
-        assertStatement: () => false,
-        assertMaxLoopNestingDepth: () => true,
-      },
+      assertors: buildAssertors(statements, this.sourceCode),
     };
   }
 
@@ -671,9 +605,13 @@ export class Executor {
       });
     }
 
+    const template = { type: "ForeachStatement" as const, elementName: statement.elementName.lexeme, iterable };
     this.executeLoop(() => {
       let iteration = 0;
-      for (let temporaryVariableValue of iterable.jikiObject.value) {
+      // Lists are read through the live object so that pushes made by the loop body are seen
+      const elements =
+        iterable.jikiObject instanceof Jiki.List ? liveElements(iterable.jikiObject) : iterable.jikiObject.value;
+      for (let temporaryVariableValue of elements) {
         iteration++;
         this.guardInfiniteLoop(statement.location);
 
@@ -701,15 +639,10 @@ export class Executor {
         temporaryVariableNames.push(temporaryVariableName);
         this.environment.define(temporaryVariableName, temporaryVariableValue);
 
-        this.executeFrame<EvaluationResultForeachStatement>(statement, () => {
-          return {
-            type: "ForeachStatement",
-            elementName: statement.elementName.lexeme,
-            index: iteration,
-            iterable,
-            temporaryVariableValue,
-            secondTemporaryVariableValue,
-          };
+        this.addLoopIterationFrame<EvaluationResultForeachStatement>(statement, template, {
+          index: iteration,
+          temporaryVariableValue,
+          secondTemporaryVariableValue,
         });
 
         this.executeLoopIteration(statement.body, iteration, temporaryVariableNames, counterVariableName);
@@ -801,6 +734,7 @@ export class Executor {
       });
     }
 
+    const template = { type: "RepeatStatement" as const, count: countResult };
     this.executeLoop(() => {
       let iteration = 0;
       while (iteration < count.value) {
@@ -811,13 +745,7 @@ export class Executor {
           this.environment.define(counterVariableName, new Jiki.Number(iteration));
         }
 
-        this.executeFrame<EvaluationResultRepeatStatement>(statement, () => {
-          return {
-            type: "RepeatStatement",
-            count: countResult,
-            iteration,
-          };
-        });
+        this.addLoopIterationFrame<EvaluationResultRepeatStatement>(statement, template, { iteration });
 
         this.executeLoopIteration(statement.body, iteration, [], counterVariableName);
 
@@ -1103,7 +1031,7 @@ export class Executor {
 
   public executeStatement(statement: Statement): void {
     try {
-      if (this.time > this.languageFeatures.maxTotalExecutionTime) {
+      if (this.time > this.languageFeatures.maxTotalExecutionTime || this.budget.exhausted()) {
         const location = new Location(
           statement.location.line,
           new Span(statement.location.relative.begin, statement.location.relative.begin + 1),
@@ -1123,10 +1051,18 @@ export class Executor {
   }
 
   public evaluate(expression: Expression): EvaluationResultExpression {
+    // Constant expressions (see constantFolding.ts) are evaluated once per AST.
+    if (expression.foldedResult !== undefined) {
+      return expression.foldedResult;
+    }
+
     const method = `visit${expression.type}`;
     const evaluationResult = this[method](expression);
     this.guardNull(evaluationResult.jikiObject, expression.location);
     this.guardNoneJikiObject(evaluationResult.jikiObject, expression.location);
+    if (expression.isConstant) {
+      expression.foldedResult = evaluationResult;
+    }
     return evaluationResult;
   }
 
@@ -1288,29 +1224,46 @@ export class Executor {
     error?: RuntimeError,
     context?: Statement | Expression
   ): void {
-    const frame: Frame = {
-      code: location.toCode(this.sourceCode),
-      line: location.line,
-      status,
-      result,
-      error,
-      // The interpeter time is in microseconds.
-      // The timeInMs is in milliseconds for animations.
-      time: this.time,
-      timeInMs: timeToMs(this.time),
-      generateDescription: () =>
-        describeFrame(frame, {
-          functionDescriptions: this.externalFunctionDescriptions,
-        }),
-      context: context,
-    };
+    // The interpeter time is in microseconds.
+    // The frame's timeInMs is in milliseconds for animations.
+    const frame: Frame = new ExecutionFrame(location, this.sourceCode, status, this.time, this.describer);
+    frame.result = result;
+    frame.error = error;
+    frame.context = context;
+    this.recordFrame(frame);
+  }
+
+  /**
+   * Record the frame a loop starts each iteration with. `template` holds the
+   * result fields every iteration of this run of the loop shares and `fields`
+   * this iteration's own; the result is only put together if it's read.
+   */
+  public addLoopIterationFrame<T extends EvaluationResult>(
+    statement: Statement,
+    template: Partial<T>,
+    fields: Partial<T>
+  ): void {
+    if (!this.addSuccessFrames) {
+      return;
+    }
+
+    const frame: Frame = new LoopIterationFrame(
+      statement.location,
+      this.sourceCode,
+      this.time,
+      this.describer,
+      template,
+      fields
+    );
+    frame.context = statement;
+    this.recordFrame(frame);
+  }
+
+  private recordFrame(frame: Frame): void {
     // In testing mode (but not benchmarks), augment frame with test-only fields
     if (process.env.NODE_ENV === "test" && process.env.RUNNING_BENCHMARKS !== "true") {
-      (frame as TestAugmentedFrame).variables = cloneDeep(this.environment.variables());
-      // Generate description immediately for testing
-      (frame as TestAugmentedFrame).description = describeFrame(frame, {
-        functionDescriptions: this.externalFunctionDescriptions,
-      });
+      const snapshotIndex = this.variableSnapshots.record(this.environment.variables());
+      augmentFrameForTests(frame, this.variableSnapshots, snapshotIndex, () => frame.generateDescription());
     }
 
     this.frames.push(frame);
@@ -1,8 +1,13 @@
 import type { Token } from "./token";
 import type { Location } from "./location";
 import type { SomethingWithLocation } from "./interpreter";
+import type { EvaluationResultExpression } from "./evaluation-result";
 
 export abstract class Expression implements SomethingWithLocation {
+  // Set by foldConstants: a constant expression's result is evaluated once and reused.
+  public isConstant?: boolean;
+  public foldedResult?: EvaluationResultExpression;
+
   constructor(public type: String) {}
   abstract location: Location;
   abstract children(): Expression[];
@@ -6,11 +6,14 @@ import type { Expression } from "./expression";
 import {
   FunctionCallExpression,
   MethodCallExpression,
+  LiteralExpression,
   ListExpression,
   BinaryExpression,
   LogicalExpression,
   UnaryExpression,
 } from "./expression";
+import type { Assertors } from "../shared/interfaces";
+import { ProgramIndex, walkNodes } from "../shared/programIndex";
 
 export function formatIdentifier(name: string): string {
   return name;
@@ -51,18 +54,13 @@ export function extractExpressions<T extends Expression>(
   tree: Statement[] | Expression[],
   type: new (...args: any[]) => T
 ): T[] {
-  // Remove null and undefined then map to the subtrees and
-  // eventually to the call expressions.
-  return (
-    tree
-      // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
-      .filter(obj => obj)
-      .map((elem: Statement | Expression) => {
-        const res = elem instanceof type ? [elem] : [];
-        return res.concat(extractExpressions<T>(elem.children(), type));
-      })
-      .flat()
-  );
+  const results: T[] = [];
+  walkNodes(tree, node => {
+    if (node instanceof type) {
+      results.push(node);
+    }
+  });
+  return results;
 }
 
 export function extractVariableAssignments(
@@ -121,10 +119,13 @@ export function countListExpressions(tree: (Statement | Expression)[]): number {
  * and unary operators (e.g. "!", "-").
  */
 export function extractOperators(tree: (Statement | Expression)[]): string[] {
-  const binary = extractExpressions(tree, BinaryExpression).map(expr => expr.operator.lexeme);
-  const logical = extractExpressions(tree, LogicalExpression).map(expr => expr.operator.lexeme);
-  const unary = extractExpressions(tree, UnaryExpression).map(expr => expr.operator.lexeme);
-  return [...binary, ...logical, ...unary];
+  const operators: string[] = [];
+  walkNodes(tree, node => {
+    if (node instanceof BinaryExpression || node instanceof LogicalExpression || node instanceof UnaryExpression) {
+      operators.push(node.operator.lexeme);
+    }
+  });
+  return operators;
 }
 
 export function extractFunctionCallExpressionsExcludingBody(
@@ -147,3 +148,80 @@ export function extractFunctionCallExpressionsExcludingBody(
   }
   return results;
 }
+
+function isNumberLiteral(expr: Expression): boolean {
+  return expr instanceof LiteralExpression && typeof expr.value === "number";
+}
+
+/**
+ * The code-check assertors for a parsed program. Every check is answered from
+ * the program's ProgramIndex, so the tree is walked once per program rather
+ * than once per check, scenario and isolated run.
+ */
+export function buildAssertors(statements: Statement[], sourceCode: string): Assertors {
+  const index = ProgramIndex.for(statements);
+  const callsTo = (funcName: string) =>
+    index
+      .groupNodesOf("callsByCallee", FunctionCallExpression, call => call.callee.name.lexeme)
+      .get(formatIdentifier(funcName)) ?? [];
+  const variableAssignments = () => index.memo("variableAssignments", () => extractVariableAssignments(statements));
+  const functionNames = () =>
+    index.memo("functionNames", () => extractFunctionStatements(statements).map(fs => fs.name.lexeme));
+  const checkedAssignments = ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
+    const formattedInclude = include?.map(formatIdentifier);
+    const formattedExclude = exclude?.map(formatIdentifier);
+    return variableAssignments().filter(({ name }) => {
+      if (formattedExclude?.includes(name)) {
+        return false;
+      }
+      return !formattedInclude || formattedInclude.includes(name);
+    });
+  };
+
+  return {
+    assertAllArgumentsAreVariables: () => {
+      return index
+        .nodesOf(FunctionCallExpression)
+        .every(expr => !expr.args.some(arg => arg instanceof LiteralExpression));
+    },
+    assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => {
+      return callsTo(funcName).every(expr => {
+        return expr.args.every((arg, i) => !flags[i] || !(arg instanceof LiteralExpression));
+      });
+    },
+    assertNoLiteralNumberAssignments: (opts: { include?: string[]; exclude?: string[] }) => {
+      return checkedAssignments(opts).every(({ value }) => !isNumberLiteral(value));
+    },
+    assertNoLiteralNumbersInAssignments: (opts: { include?: string[]; exclude?: string[] }) => {
+      return checkedAssignments(opts).every(
+        ({ value }) => !extractExpressions([value], LiteralExpression).some(isNumberLiteral)
+      );
+    },
+    countLinesOfCode: () => countLinesOfCode(sourceCode),
+    assertMaxLinesOfCode: (limit: number) => countLinesOfCode(sourceCode) <= limit,
+    assertFunctionDefined: (name: string) => functionNames().includes(formatIdentifier(name)),
+    countFunctionDefinitions: () => functionNames().length,
+    assertMethodCalled: (methodName: string) => {
+      const formatted = formatIdentifier(methodName);
+      return index.nodesOf(MethodCallExpression).some(mc => mc.methodName.lexeme === formatted);
+    },
+    countMethodCalls: () => index.nodesOf(MethodCallExpression).length,
+    countArrayLiterals: () => index.nodesOf(ListExpression).length,
+    assertFunctionCalledOutsideOwnDefinition: (funcName: string) => {
+      const formatted = formatIdentifier(funcName);
+      return index.memo(`calledOutsideOwnDefinition:${formatted}`, () =>
+        extractFunctionCallExpressionsExcludingBody(statements, formatted).some(
+          call => call.callee.name.lexeme === formatted
+        )
+      );
+    },
+    numFunctionCallsInCode: (funcName: string) => callsTo(funcName).length,
+    // TODO: JS-only for now. Implement for Jikiscript when needed.
+    assertFunctionCallsAnotherFunction: () => false,
+    assertOperatorUsed: (operator: string) =>
+      index.memo("operators", () => new Set(extractOperators(statements))).has(operator),
+    // TODO: JS-only for now. Implement statement matching for Jikiscript when needed.
+    assertStatement: () => false,
+    assertMaxLoopNestingDepth: () => true,
+  };
+}
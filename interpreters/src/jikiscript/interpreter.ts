@@ -2,6 +2,7 @@ import { RuntimeError, type RuntimeErrorType, type StaticError } from "./error";
 import type { Expression } from "./expression";
 import { Location } from "./location";
 import { Parser } from "./parser";
+import { foldConstants } from "./constantFolding";
 import { Executor } from "./executor";
 import type { Statement } from "./statement";
 import type { TokenType } from "./token";
@@ -14,6 +15,15 @@ import type { Arity } from "./functions";
 import * as Jiki from "./jikiObjects";
 import { StdlibFunctionsForLibrary, filteredStdLibFunctions } from "./stdlib";
 import { createRandomFn } from "../shared/random";
+import { ProgramCache, programCacheKey } from "../shared/programCache";
+
+// Parsed programs, shared by every run of the same code (and by the calling
+// statements IO exercises generate for each scenario).
+const programCache = new ProgramCache<Statement[]>(32);
+
+export function clearProgramCache(): void {
+  programCache.clear();
+}
 
 export interface FrameContext {
   result: any;
@@ -41,6 +51,7 @@ export interface LanguageFeatures {
   repeatDelay: number;
   maxTotalLoopIterations: number;
   maxTotalExecutionTime: number;
+  maxWallClockTimeMs?: number; // Real time, unlike maxTotalExecutionTime (see shared/executionBudget.ts)
   allowGlobals: boolean;
   customFunctionDefinitionMode: boolean;
   addSuccessFrames: boolean;
@@ -54,6 +65,7 @@ export interface InputLanguageFeatures {
   repeatDelay?: number;
   maxTotalLoopIterations?: number;
   maxTotalExecutionTime?: number;
+  maxWallClockTimeMs?: number;
   allowGlobals?: boolean;
   customFunctionDefinitionMode?: boolean;
   addSuccessFrames?: boolean;
@@ -164,8 +176,6 @@ export function evaluateExpression(
 }
 
 export class Interpreter {
-  private readonly parser: Parser;
-
   private readonly languageFeatures: LanguageFeatures;
   private readonly externalFunctions: ExternalFunction[] = [];
   private readonly customFunctions: CallableCustomFunction[] = [];
@@ -204,11 +214,13 @@ export class Interpreter {
       const filteredStdlib = filteredStdLibFunctions(this.languageFeatures.allowedStdlibFunctions);
       this.externalFunctions = [...filteredStdlib, ...this.externalFunctions];
     }
+  }
 
-    this.parser = new Parser(
-      this.externalFunctions.map(f => f.name),
-      this.languageFeatures,
-      this.wrapTopLevelStatements
+  private parse(sourceCode: string, wrapTopLevelStatements: boolean): Statement[] {
+    const functionNames = this.externalFunctions.map(f => f.name);
+    const key = programCacheKey(sourceCode, [functionNames, this.languageFeatures, wrapTopLevelStatements]);
+    return programCache.getOrParse(key, () =>
+      foldConstants(new Parser(functionNames, this.languageFeatures, wrapTopLevelStatements).parse(sourceCode))
     );
   }
 
@@ -260,7 +272,7 @@ export class Interpreter {
 
   public compile(): CompilationResult {
     try {
-      this.statements = this.parser.parse(this.sourceCode);
+      this.statements = this.parse(this.sourceCode, this.wrapTopLevelStatements);
       return { success: true, lintErrors: [] };
     } catch (error: unknown) {
       return { success: false, error: error as StaticError, lintErrors: [] };
@@ -282,13 +294,8 @@ export class Interpreter {
   public evaluateFunction(name: string, ...args: any[]): EvaluateFunctionResult {
     const callingCode = `${name}(${args.map(arg => JSON.stringify(arg)).join(", ")})`;
 
-    // Create a new parser with wrapTopLevelStatements set to false
-    // and use it to generate the calling statements.
-    const callingStatements = new Parser(
-      this.externalFunctions.map(f => f.name),
-      this.languageFeatures,
-      false
-    ).parse(callingCode);
+    // Parse with wrapTopLevelStatements set to false to generate the calling statements.
+    const callingStatements = this.parse(callingCode, false);
 
     if (callingStatements.length !== 1) {
       this.error("RuntimeErrorCouldNotEvaluateFunctionCall", Location.unknown, {
@@ -318,13 +325,8 @@ export class Interpreter {
   }
 
   public evaluateExpression(expression: string, ..._args: any[]): EvaluateFunctionResult {
-    // Create a new parser with wrapTopLevelStatements set to false
-    // and use it to generate the calling statements.
-    const callingStatements = new Parser(
-      this.externalFunctions.map(f => f.name),
-      this.languageFeatures,
-      false
-    ).parse(expression);
+    // Parse with wrapTopLevelStatements set to false to generate the calling statements.
+    const callingStatements = this.parse(expression, false);
 
     if (callingStatements.length !== 1) {
       this.error("RuntimeErrorCouldNotEvaluateFunctionCall", Location.unknown, {
@@ -4,6 +4,7 @@ import type { Arity } from "./functions";
 import { UserDefinedMethod } from "./functions";
 import { UnsetPropertyError } from "./executor/executeInstantiationExpression";
 import { JikiObject as BaseJikiObject } from "../shared/jikiObject";
+import { CopyOnWriteArray, CopyOnWriteMap } from "../shared/copyOnWrite";
 
 type ObjectType = "number" | "string" | "boolean" | "list" | "dictionary" | "instance";
 
@@ -169,7 +170,7 @@ export class Class {
 }
 
 export class Instance extends JikiObject {
-  protected fields: Record<string, JikiObject> = {};
+  protected fields: CopyOnWriteMap<string, JikiObject> = new CopyOnWriteMap(new Map<string, JikiObject>());
 
   constructor(private readonly jikiClass: Class) {
     super("instance");
@@ -201,21 +202,19 @@ export class Instance extends JikiObject {
     return this.jikiClass.getSetter(name);
   }
   public getField(name: string): JikiObject {
-    return this.fields[name];
+    return this.fields.get(name) as JikiObject;
   }
   public getUnwrappedField(name: string): any {
-    return unwrapJikiObject(this.fields[name]);
+    return unwrapJikiObject(this.fields.get(name));
   }
   public setField(name: string, value: JikiObject): void {
-    this.fields[name] = value;
+    this.fields.set(name, value);
   }
   public clone(): Instance {
     // Create a new instance of the same class
     const clonedInstance = new Instance(this.jikiClass);
-    // Deep clone all fields
-    for (const [name, value] of Object.entries(this.fields)) {
-      clonedInstance.fields[name] = value.clone();
-    }
+    // Share the fields until either side next writes (deep clones nested containers)
+    clonedInstance.fields = this.fields.snapshot(value => value.clone());
     return clonedInstance;
   }
 }
@@ -237,6 +236,11 @@ export abstract class Literal extends Primitive {
   constructor(type: ObjectType, value: any) {
     super(type, value);
   }
+
+  // Numbers, strings and booleans are all immutable
+  public get isImmutable(): boolean {
+    return true;
+  }
 }
 
 export class Number extends Literal {
@@ -281,49 +285,53 @@ export const True = new Boolean(true);
 export const False = new Boolean(false);
 
 export class List extends JikiObject {
-  private readonly elements: JikiObject[];
+  private readonly store: CopyOnWriteArray<JikiObject>;
 
-  constructor(elements: JikiObject[]) {
+  constructor(elements: JikiObject[] | CopyOnWriteArray<JikiObject>) {
     super("list");
-    this.elements = elements;
+    this.store = elements instanceof CopyOnWriteArray ? elements : new CopyOnWriteArray(elements);
   }
 
   public get length(): number {
-    return this.elements.length;
+    return this.store.length;
   }
 
   public getElement(index: number): JikiObject | undefined {
-    return this.elements[index];
+    return this.store.get(index);
   }
 
   public setElement(index: number, value: JikiObject): void {
-    this.elements[index] = value;
+    this.store.set(index, value);
+  }
+
+  public push(element: JikiObject): void {
+    this.store.push(element);
   }
 
   public get value(): JikiObject[] {
-    return this.elements;
+    return this.store.elements;
   }
   public toArg(): List {
-    return new List(this.elements.map((item: JikiObject) => item.toArg()));
+    return new List(this.value.map((item: JikiObject) => item.toArg()));
   }
   public toString() {
-    if (this.elements.length === 0) {
+    if (this.store.length === 0) {
       return "[]";
     }
-    return `[ ${this.elements.map((item: JikiObject) => item.toString()).join(", ")} ]`;
+    return `[ ${this.value.map((item: JikiObject) => item.toString()).join(", ")} ]`;
   }
   public clone(): List {
-    // Deep clone - recursively clone all elements
-    return new List(this.elements.map((item: JikiObject) => item.clone()));
+    // Shares the backing store until either side next writes (deep clones nested containers)
+    return new List(this.store.snapshot(item => item.clone()));
   }
 }
 
 export class Dictionary extends JikiObject {
-  private readonly map: Map<string, JikiObject>;
+  private readonly map: CopyOnWriteMap<string, JikiObject>;
 
-  constructor(map: Map<string, JikiObject>) {
+  constructor(map: Map<string, JikiObject> | CopyOnWriteMap<string, JikiObject>) {
     super("dictionary");
-    this.map = map;
+    this.map = map instanceof CopyOnWriteMap ? map : new CopyOnWriteMap(map);
   }
 
   public getProperty(key: string): JikiObject | undefined {
@@ -335,24 +343,24 @@ export class Dictionary extends JikiObject {
   }
 
   public get value(): Map<string, JikiObject> {
-    return this.map;
+    return this.map.entries;
   }
   public toArg(): Dictionary {
-    return new Dictionary(new Map([...this.map.entries()].map(([key, value]) => [key, value.toArg()])));
+    return new Dictionary(new Map([...this.value.entries()].map(([key, value]) => [key, value.toArg()])));
   }
   public toString() {
     if (this.map.size === 0) {
       return "{}";
     }
     const stringified = Object.fromEntries(
-      [...this.map.entries()].map(([key, value]) => [key, unwrapJikiObject(value)])
+      [...this.value.entries()].map(([key, value]) => [key, unwrapJikiObject(value)])
     );
 
     return JSON.stringify(stringified, null, 1).replace(/\n\s*/g, " ");
   }
   public clone(): Dictionary {
-    // Deep clone - recursively clone all values
-    return new Dictionary(new Map([...this.map.entries()].map(([key, value]) => [key, value.clone()])));
+    // Shares the backing store until either side next writes (deep clones nested containers)
+    return new Dictionary(this.map.snapshot(value => value.clone()));
   }
 }
 
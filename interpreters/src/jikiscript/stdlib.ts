@@ -132,7 +132,7 @@ function concatenate(_: ExecutionContext, ...strings: Jiki.JikiString[]): Jiki.J
 function push(_: ExecutionContext, list: Jiki.List, element: Jiki.JikiObject): Jiki.List {
   verifyType(list, Jiki.List, "list", 1);
 
-  list.value.push(element);
+  list.push(element);
   return list;
 }
 
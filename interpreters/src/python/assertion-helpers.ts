@@ -1,6 +1,8 @@
 import type { Expression } from "./expression";
 import {
   CallExpression,
+  IdentifierExpression,
+  LiteralExpression,
   SubscriptExpression,
   AttributeExpression,
   ListExpression,
@@ -17,6 +19,8 @@ import {
   WhileStatement,
   FunctionDeclaration,
 } from "./statement";
+import type { Assertors } from "../shared/interfaces";
+import { ProgramIndex, walkNodes } from "../shared/programIndex";
 
 export function formatIdentifier(name: string): string {
   return name;
@@ -31,7 +35,7 @@ export function extractCallExpressions(tree: Statement[] | Expression[]): CallEx
 }
 
 /**
- * Generic recursive AST tree traversal to extract specific expression types
+ * Generic AST tree traversal to extract specific expression types
  * Traverses using the children() method that all Statement and Expression nodes implement
  *
  * @param tree - Array of Statement or Expression nodes to search
@@ -42,17 +46,13 @@ export function extractExpressions<T extends Expression>(
   tree: Statement[] | Expression[],
   type: new (...args: any[]) => T
 ): T[] {
-  // Filter null/undefined, then map to results and flatten
-  return (
-    tree
-      // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
-      .filter(obj => obj)
-      .map((elem: Statement | Expression) => {
-        const res = elem instanceof type ? [elem] : [];
-        return res.concat(extractExpressions<T>(elem.children(), type));
-      })
-      .flat()
-  );
+  const results: T[] = [];
+  walkNodes(tree, node => {
+    if (node instanceof type) {
+      results.push(node);
+    }
+  });
+  return results;
 }
 
 export function extractVariableAssignments(statements: Statement[]): Array<{ name: string; value: Expression }> {
@@ -176,3 +176,76 @@ export function extractCallExpressionsDeepExcluding(
   }
   return results;
 }
+
+function calleeName(call: CallExpression): string | undefined {
+  return call.callee instanceof IdentifierExpression ? call.callee.name.lexeme : undefined;
+}
+
+function isNumberLiteral(expr: Expression): boolean {
+  return expr instanceof LiteralExpression && typeof expr.value === "number";
+}
+
+/**
+ * The code-check assertors for a parsed program. Every check is answered from
+ * the program's ProgramIndex, so the tree is walked once per program rather
+ * than once per check, scenario and isolated run.
+ */
+export function buildAssertors(statements: Statement[], sourceCode: string): Assertors {
+  const index = ProgramIndex.for(statements);
+  const callsTo = (funcName: string) =>
+    index.groupNodesOf("callsByCallee", CallExpression, calleeName).get(formatIdentifier(funcName)) ?? [];
+  const variableAssignments = () => index.memo("variableAssignments", () => extractVariableAssignments(statements));
+  const functionNames = () =>
+    index.memo("functionNames", () => extractFunctionDeclarations(statements).map(fd => fd.name.lexeme));
+  const methodNames = () => index.memo("methodNames", () => extractMethodCalls(statements).map(mc => mc.methodName));
+  const checkedAssignments = ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
+    const formattedInclude = include?.map(formatIdentifier);
+    const formattedExclude = exclude?.map(formatIdentifier);
+    return variableAssignments().filter(({ name }) => {
+      if (formattedExclude?.includes(name)) {
+        return false;
+      }
+      return !formattedInclude || formattedInclude.includes(name);
+    });
+  };
+
+  return {
+    assertAllArgumentsAreVariables: () => {
+      return index.nodesOf(CallExpression).every(expr => !expr.args.some(arg => arg instanceof LiteralExpression));
+    },
+    assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => {
+      return callsTo(funcName).every(expr => {
+        return expr.args.every((arg, i) => !flags[i] || !(arg instanceof LiteralExpression));
+      });
+    },
+    assertNoLiteralNumberAssignments: (opts: { include?: string[]; exclude?: string[] }) => {
+      return checkedAssignments(opts).every(({ value }) => !isNumberLiteral(value));
+    },
+    assertNoLiteralNumbersInAssignments: (opts: { include?: string[]; exclude?: string[] }) => {
+      return checkedAssignments(opts).every(
+        ({ value }) => !extractExpressions([value], LiteralExpression).some(isNumberLiteral)
+      );
+    },
+    countLinesOfCode: () => countLinesOfCode(sourceCode),
+    assertMaxLinesOfCode: (limit: number) => countLinesOfCode(sourceCode) <= limit,
+    assertFunctionDefined: (name: string) => functionNames().includes(formatIdentifier(name)),
+    countFunctionDefinitions: () => functionNames().length,
+    assertMethodCalled: (methodName: string) => methodNames().includes(formatIdentifier(methodName)),
+    countMethodCalls: () => methodNames().length,
+    countArrayLiterals: () => index.memo("listCount", () => countListExpressions(statements)),
+    assertFunctionCalledOutsideOwnDefinition: (funcName: string) => {
+      const formatted = formatIdentifier(funcName);
+      return index.memo(`calledOutsideOwnDefinition:${formatted}`, () =>
+        extractCallExpressionsDeepExcluding(statements, formatted).some(call => calleeName(call) === formatted)
+      );
+    },
+    numFunctionCallsInCode: (funcName: string) => callsTo(funcName).length,
+    // TODO: JS-only for now. Implement for Python when needed.
+    assertFunctionCallsAnotherFunction: () => false,
+    assertOperatorUsed: (operator: string) =>
+      index.memo("operators", () => new Set(extractOperators(statements))).has(operator),
+    // TODO: JS-only for now. Implement statement matching for Python when needed.
+    assertStatement: () => false,
+    assertMaxLoopNestingDepth: () => true,
+  };
+}
@@ -1,38 +1,42 @@
 import type { JikiObject } from "./jikiObjects";
 
+let nextEnvironmentId = 0;
+
 export class Environment {
   private readonly values: Map<string, JikiObject> = new Map();
-  public readonly id: string;
+  public readonly id: number; // Useful for debugging
 
   constructor(private readonly enclosing: Environment | null = null) {
-    this.id = Math.random().toString(36).substring(7);
+    this.id = ++nextEnvironmentId;
   }
 
   public define(name: string, value: JikiObject): void {
     this.values.set(name, value);
   }
 
+  // Function calls enclose the caller's environment, so the chain grows with
+  // recursion depth. Walk it iteratively with a single probe per scope.
   public get(name: string): JikiObject | undefined {
-    if (this.values.has(name)) {
-      return this.values.get(name);
-    }
-
-    if (this.enclosing !== null) {
-      return this.enclosing.get(name);
+    let current: Environment | null = this;
+    while (current !== null) {
+      const value = current.values.get(name);
+      if (value !== undefined) {
+        return value;
+      }
+      current = current.enclosing;
     }
 
     return undefined;
   }
 
   public update(name: string, value: JikiObject): void {
-    if (this.values.has(name)) {
-      this.values.set(name, value);
-      return;
-    }
-
-    if (this.enclosing !== null) {
-      this.enclosing.update(name, value);
-      return;
+    let current: Environment | null = this;
+    while (current !== null) {
+      if (current.values.has(name)) {
+        current.values.set(name, value);
+        return;
+      }
+      current = current.enclosing;
     }
 
     // Variable not found in any scope
@@ -2,24 +2,21 @@ import { Environment } from "./environment";
 // import { SyntaxError } from "./error";
 import { LogicError } from "./error";
 import { translate } from "./translator";
-import type { Expression } from "./expression";
-import {
-  LiteralExpression,
+import type {
+  Expression,
   BinaryExpression,
   LogicalExpression,
   UnaryExpression,
   GroupingExpression,
-  IdentifierExpression,
   ListExpression,
   SubscriptExpression,
-  CallExpression,
   AttributeExpression,
   FStringExpression,
 } from "./expression";
-import type { Location } from "../shared/location";
-import type { Statement } from "./statement";
-import {
-  ExpressionStatement,
+import type { LiteralExpression, IdentifierExpression, CallExpression } from "./expression";
+import { Location } from "../shared/location";
+import type {
+  Statement,
   AssignmentStatement,
   IfStatement,
   BlockStatement,
@@ -30,22 +27,36 @@ import {
   ContinueStatement,
   FunctionDeclaration,
   ReturnStatement,
+  ExpressionStatement,
 } from "./statement";
-import type { EvaluationResult, EvaluationResultExpression } from "./evaluation-result";
+import type {
+  EvaluationResult,
+  EvaluationResultCallExpression,
+  EvaluationResultExpression,
+} from "./evaluation-result";
 import type { JikiObject } from "./jikiObjects";
-import { timeToMs, type Frame, type FrameExecutionStatus, type TestAugmentedFrame } from "../shared/frames";
+import {
+  ExecutionFrame,
+  LoopIterationFrame,
+  timeToMs,
+  type Frame,
+  type FrameDescriber,
+  type FrameExecutionStatus,
+} from "../shared/frames";
+import { VariableSnapshotLog, augmentFrameForTests } from "../shared/variableSnapshots";
 import { type ExecutionContext as SharedExecutionContext } from "../shared/interfaces";
 import { createBaseExecutionContext } from "../shared/executionContext";
 import type { LanguageFeatures, NodeType } from "./interfaces";
 import type { EvaluationContext } from "./interpreter";
-import cloneDeep from "lodash.clonedeep";
 import type { PythonFrame } from "./frameDescribers";
 import { describeFrame } from "./frameDescribers";
 import { PyCallable, ReturnValue } from "./functions";
 import { builtinFunctions } from "./stdlib";
 import { randomMethods } from "./stdlib/random";
-import { PyStdLibFunction, PyBuiltinModule, unwrapPyObject } from "./jikiObjects";
+import { PyStdLibFunction, PyBuiltinModule, createPyObject, unwrapPyObject } from "./jikiObjects";
+import { ExecutionBudget } from "../shared/executionBudget";
 import { createRandomFn } from "../shared/random";
+import { Opcode, buildNodeAllowance, lowerNode } from "./opcodes";
 
 // Import individual executors
 import { executeLiteralExpression } from "./executor/executeLiteralExpression";
@@ -69,23 +80,12 @@ import { executeWhileStatement } from "./executor/executeWhileStatement";
 import { executeRepeatStatement } from "./executor/executeRepeatStatement";
 import { executeBreakStatement } from "./executor/executeBreakStatement";
 import { executeContinueStatement } from "./executor/executeContinueStatement";
-import { executeCallExpression } from "./executor/executeCallExpression";
+import { executeCallExpression, assertCallable, invokeCallable } from "./executor/executeCallExpression";
 import { executeFunctionDeclaration } from "./executor/executeFunctionDeclaration";
 import { executeReturnStatement } from "./executor/executeReturnStatement";
 import { executeAttributeExpression } from "./executor/executeAttributeExpression";
 import { executeFStringExpression } from "./executor/executeFStringExpression";
-import {
-  extractCallExpressions,
-  extractExpressions,
-  extractVariableAssignments,
-  formatIdentifier,
-  countLinesOfCode,
-  extractFunctionDeclarations,
-  extractMethodCalls,
-  countListExpressions,
-  extractCallExpressionsDeepExcluding,
-  extractOperators,
-} from "./assertion-helpers";
+import { buildAssertors } from "./assertion-helpers";
 
 // Execution context for Python stdlib (future use)
 export type ExecutionContext = SharedExecutionContext & {
@@ -114,6 +114,7 @@ export type RuntimeErrorType =
   | "MethodNotYetImplemented"
   | "MethodNotYetAvailable"
   | "MaxIterationsReached"
+  | "MaxExecutionTimeExceeded"
   | "FunctionAlreadyDefined";
 
 export class RuntimeError extends Error {
@@ -158,6 +159,7 @@ export interface ExecutorResult {
 
 export class Executor {
   private readonly frames: Frame[] = [];
+  private readonly variableSnapshots = new VariableSnapshotLog();
   public readonly logLines: Array<{ time: number; timeInMs: number; output: string }> = [];
   public readonly functionCallLog: Array<{ name: string; args: any[]; return: any }> = [];
   public _exerciseFinished: boolean = false;
@@ -165,10 +167,13 @@ export class Executor {
   private readonly timePerFrame: number = 1;
   private totalLoopIterations = 0;
   private readonly maxTotalLoopIterations: number;
+  private readonly budget: ExecutionBudget;
   public environment: Environment;
   public languageFeatures: LanguageFeatures;
   public randomFn: () => number;
   private readonly protectedNames: Set<string> = new Set();
+  private readonly nodeAllowance: Uint8Array | null;
+  private readonly describer: FrameDescriber = frame => describeFrame(frame);
 
   constructor(
     private readonly sourceCode: string,
@@ -183,6 +188,8 @@ export class Executor {
       ...context.languageFeatures,
     };
     this.maxTotalLoopIterations = this.languageFeatures.maxTotalLoopIterations ?? 1000;
+    this.budget = new ExecutionBudget(this.languageFeatures.maxWallClockTimeMs);
+    this.nodeAllowance = buildNodeAllowance(this.languageFeatures.allowedNodes);
 
     // Register builtin functions (like print) as PyStdLibFunction objects
     for (const [name, builtin] of Object.entries(builtinFunctions)) {
@@ -223,19 +230,16 @@ export class Executor {
     }
   }
 
-  private assertNodeAllowed(node: Statement | Expression): void {
-    // Get the node type name from the constructor
-    const nodeType = node.type as NodeType;
-
-    // If allowedNodes is null or undefined, all nodes are allowed
-    if (this.languageFeatures.allowedNodes === null || this.languageFeatures.allowedNodes === undefined) {
+  private assertNodeAllowed(node: Statement | Expression, opcode: number): void {
+    // A null table means allowedNodes is null or undefined, so all nodes are allowed
+    if (this.nodeAllowance === null) {
       return;
     }
 
     // Check if this node type is in the allowed list
-    if (!this.languageFeatures.allowedNodes.includes(nodeType)) {
+    if (this.nodeAllowance[opcode] === 0) {
       this.error("NodeNotAllowed", node.location, {
-        nodeType,
+        nodeType: node.type as NodeType,
       });
     }
   }
@@ -265,89 +269,7 @@ export class Executor {
       success: !this.frames.find(f => f.status === "ERROR"),
       functionCallLog: this.functionCallLog,
 
-      assertors: {
-        assertAllArgumentsAreVariables: () => {
-          return extractCallExpressions(statements).every((expr: CallExpression) => {
-            return expr.args.every((arg: Expression) => {
-              return !(arg instanceof LiteralExpression);
-            });
-          });
-        },
-        assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => {
-          const formatted = formatIdentifier(funcName);
-          return extractCallExpressions(statements)
-            .filter(
-              (expr: CallExpression) =>
-                expr.callee instanceof IdentifierExpression && expr.callee.name.lexeme === formatted
-            )
-            .every((expr: CallExpression) => {
-              return expr.args.every((arg: Expression, i: number) => {
-                if (!flags[i]) {
-                  return true;
-                }
-                return !(arg instanceof LiteralExpression);
-              });
-            });
-        },
-        assertNoLiteralNumberAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-          const formattedInclude = include?.map(formatIdentifier);
-          const formattedExclude = exclude?.map(formatIdentifier);
-          return extractVariableAssignments(statements).every(({ name, value }) => {
-            if (formattedExclude?.includes(name)) {
-              return true;
-            }
-            if (formattedInclude && !formattedInclude.includes(name)) {
-              return true;
-            }
-            return !(value instanceof LiteralExpression && typeof value.value === "number");
-          });
-        },
-        assertNoLiteralNumbersInAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-          const formattedInclude = include?.map(formatIdentifier);
-          const formattedExclude = exclude?.map(formatIdentifier);
-          return extractVariableAssignments(statements).every(({ name, value }) => {
-            if (formattedExclude?.includes(name)) {
-              return true;
-            }
-            if (formattedInclude && !formattedInclude.includes(name)) {
-              return true;
-            }
-            return extractExpressions([value], LiteralExpression).filter(l => typeof l.value === "number").length === 0;
-          });
-        },
-        countLinesOfCode: () => countLinesOfCode(this.sourceCode),
-        assertMaxLinesOfCode: (limit: number) => countLinesOfCode(this.sourceCode) <= limit,
-        assertFunctionDefined: (name: string) => {
-          const formatted = formatIdentifier(name);
-          return extractFunctionDeclarations(statements).some(fd => fd.name.lexeme === formatted);
-        },
-        countFunctionDefinitions: () => extractFunctionDeclarations(statements).length,
-        assertMethodCalled: (methodName: string) => {
-          const formatted = formatIdentifier(methodName);
-          return extractMethodCalls(statements).some(mc => mc.methodName === formatted);
-        },
-        countMethodCalls: () => extractMethodCalls(statements).length,
-        countArrayLiterals: () => countListExpressions(statements),
-        assertFunctionCalledOutsideOwnDefinition: (funcName: string) => {
-          const formatted = formatIdentifier(funcName);
-          const callsOutside = extractCallExpressionsDeepExcluding(statements, formatted);
-          return callsOutside.some(
-            call => call.callee instanceof IdentifierExpression && call.callee.name.lexeme === formatted
-          );
-        },
-        numFunctionCallsInCode: (funcName: string) => {
-          const formatted = formatIdentifier(funcName);
-          return extractCallExpressions(statements).filter(
-            expr => expr.callee instanceof IdentifierExpression && expr.callee.name.lexeme === formatted
-          ).length;
-        },
-        // TODO: JS-only for now. Implement for Python when needed.
-        assertFunctionCallsAnotherFunction: () => false,
-        assertOperatorUsed: (operator: string) => extractOperators(statements).includes(operator),
-        // TODO: JS-only for now. Implement statement matching for Python when needed.
-        assertStatement: () => false,
-        assertMaxLoopNestingDepth: () => true,
-      },
+      assertors: buildAssertors(statements, this.sourceCode),
     };
   }
 
@@ -382,40 +304,62 @@ export class Executor {
   }
 
   public executeStatement(statement: Statement): EvaluationResult | null {
+    const opcode = statement.opcode ?? lowerNode(statement);
+
+    if (this.budget.exhausted()) {
+      this.error("MaxExecutionTimeExceeded", statement.location);
+    }
+
     // Safety check: ensure this node type is allowed
-    this.assertNodeAllowed(statement);
+    this.assertNodeAllowed(statement, opcode);
 
     let result: EvaluationResult | null = null;
 
     try {
-      if (statement instanceof ExpressionStatement) {
-        result = this.executeFrame(statement, () => executeExpressionStatement(this, statement));
-      } else if (statement instanceof AssignmentStatement) {
-        result = this.executeFrame(statement, () => executeAssignmentStatement(this, statement));
-      } else if (statement instanceof IfStatement) {
-        result = executeIfStatement(this, statement);
-      } else if (statement instanceof BlockStatement) {
-        result = executeBlockStatement(this, statement);
-      } else if (statement instanceof ForInStatement) {
-        result = executeForInStatement(this, statement);
-      } else if (statement instanceof WhileStatement) {
-        result = executeWhileStatement(this, statement);
-      } else if (statement instanceof RepeatStatement) {
-        result = executeRepeatStatement(this, statement);
-      } else if (statement instanceof BreakStatement) {
-        executeBreakStatement(this, statement);
-        result = null;
-      } else if (statement instanceof ContinueStatement) {
-        executeContinueStatement(this, statement);
-        result = null;
-      } else if (statement instanceof FunctionDeclaration) {
-        // Function declarations don't generate frames, just define the function
-        executeFunctionDeclaration(this, statement);
-        result = null;
-      } else if (statement instanceof ReturnStatement) {
-        // Return statements generate frames and throw ReturnValue
-        executeReturnStatement(this, statement);
-        result = null;
+      switch (opcode) {
+        case Opcode.ExpressionStatement:
+          result = this.executeFrame(statement, () =>
+            executeExpressionStatement(this, statement as ExpressionStatement)
+          );
+          break;
+        case Opcode.AssignmentStatement:
+          result = this.executeFrame(statement, () =>
+            executeAssignmentStatement(this, statement as AssignmentStatement)
+          );
+          break;
+        case Opcode.IfStatement:
+          result = executeIfStatement(this, statement as IfStatement);
+          break;
+        case Opcode.BlockStatement:
+          result = executeBlockStatement(this, statement as BlockStatement);
+          break;
+        case Opcode.ForInStatement:
+          result = executeForInStatement(this, statement as ForInStatement);
+          break;
+        case Opcode.WhileStatement:
+          result = executeWhileStatement(this, statement as WhileStatement);
+          break;
+        case Opcode.RepeatStatement:
+          result = executeRepeatStatement(this, statement as RepeatStatement);
+          break;
+        case Opcode.BreakStatement:
+          executeBreakStatement(this, statement as BreakStatement);
+          result = null;
+          break;
+        case Opcode.ContinueStatement:
+          executeContinueStatement(this, statement as ContinueStatement);
+          result = null;
+          break;
+        case Opcode.FunctionDeclaration:
+          // Function declarations don't generate frames, just define the function
+          executeFunctionDeclaration(this, statement as FunctionDeclaration);
+          result = null;
+          break;
+        case Opcode.ReturnStatement:
+          // Return statements generate frames and throw ReturnValue
+          executeReturnStatement(this, statement as ReturnStatement);
+          result = null;
+          break;
       }
     } catch (e: unknown) {
       if (e instanceof LogicError) {
@@ -428,51 +372,34 @@ export class Executor {
   }
 
   public evaluate(expression: Expression): EvaluationResultExpression {
-    // Safety check: ensure this node type is allowed
-    this.assertNodeAllowed(expression);
-
-    if (expression instanceof LiteralExpression) {
-      return executeLiteralExpression(this, expression);
-    }
-
-    if (expression instanceof BinaryExpression) {
-      return executeBinaryExpression(this, expression);
-    }
-
-    if (expression instanceof LogicalExpression) {
-      return executeLogicalExpression(this, expression);
-    }
-
-    if (expression instanceof UnaryExpression) {
-      return executeUnaryExpression(this, expression);
-    }
-
-    if (expression instanceof GroupingExpression) {
-      return executeGroupingExpression(this, expression);
-    }
+    const opcode = expression.opcode ?? lowerNode(expression);
 
-    if (expression instanceof IdentifierExpression) {
-      return executeIdentifierExpression(this, expression);
-    }
-
-    if (expression instanceof ListExpression) {
-      return executeListExpression(this, expression);
-    }
-
-    if (expression instanceof SubscriptExpression) {
-      return executeSubscriptExpression(this, expression);
-    }
-
-    if (expression instanceof CallExpression) {
-      return executeCallExpression(this, expression);
-    }
-
-    if (expression instanceof AttributeExpression) {
-      return executeAttributeExpression(this, expression);
-    }
-
-    if (expression instanceof FStringExpression) {
-      return executeFStringExpression(this, expression);
+    // Safety check: ensure this node type is allowed
+    this.assertNodeAllowed(expression, opcode);
+
+    switch (opcode) {
+      case Opcode.LiteralExpression:
+        return executeLiteralExpression(this, expression as LiteralExpression);
+      case Opcode.BinaryExpression:
+        return executeBinaryExpression(this, expression as BinaryExpression);
+      case Opcode.LogicalExpression:
+        return executeLogicalExpression(this, expression as LogicalExpression);
+      case Opcode.UnaryExpression:
+        return executeUnaryExpression(this, expression as UnaryExpression);
+      case Opcode.GroupingExpression:
+        return executeGroupingExpression(this, expression as GroupingExpression);
+      case Opcode.IdentifierExpression:
+        return executeIdentifierExpression(this, expression as IdentifierExpression);
+      case Opcode.ListExpression:
+        return executeListExpression(this, expression as ListExpression);
+      case Opcode.SubscriptExpression:
+        return executeSubscriptExpression(this, expression as SubscriptExpression);
+      case Opcode.CallExpression:
+        return executeCallExpression(this, expression as CallExpression);
+      case Opcode.AttributeExpression:
+        return executeAttributeExpression(this, expression as AttributeExpression);
+      case Opcode.FStringExpression:
+        return executeFStringExpression(this, expression as FStringExpression);
     }
 
     this.error("UnsupportedOperation", expression.location, {
@@ -495,23 +422,40 @@ export class Executor {
     error?: RuntimeError,
     context?: Statement | Expression
   ): void {
-    const frame: PythonFrame = {
-      code: location.toCode(this.sourceCode),
-      line: location.line,
-      status,
-      result: result || undefined,
-      error,
-      time: this.time,
-      timeInMs: timeToMs(this.time),
-      generateDescription: () => describeFrame(frame),
-      context: context,
-    };
+    const frame: PythonFrame = new ExecutionFrame(location, this.sourceCode, status, this.time, this.describer);
+    frame.result = result || undefined;
+    frame.error = error;
+    frame.context = context;
+    this.recordFrame(frame);
+  }
+
+  /**
+   * Record the frame a loop starts each iteration with. `template` holds the
+   * result fields every iteration of this run of the loop shares and `fields`
+   * this iteration's own; the result is only put together if it's read.
+   */
+  public addLoopIterationFrame<T extends EvaluationResult>(
+    statement: Statement,
+    template: Partial<T>,
+    fields: Partial<T>
+  ): void {
+    const frame: PythonFrame = new LoopIterationFrame(
+      statement.location,
+      this.sourceCode,
+      this.time,
+      this.describer,
+      template,
+      fields
+    );
+    frame.context = statement;
+    this.recordFrame(frame);
+  }
 
+  private recordFrame(frame: PythonFrame): void {
     // In testing mode (but not benchmarks), augment frame with test-only fields
     if (process.env.NODE_ENV === "test" && process.env.RUNNING_BENCHMARKS !== "true") {
-      (frame as TestAugmentedFrame).variables = cloneDeep(this.getVariables());
-      // Generate description immediately for testing
-      (frame as TestAugmentedFrame).description = describeFrame(frame);
+      const snapshotIndex = this.variableSnapshots.record(this.getVariables());
+      augmentFrameForTests(frame, this.variableSnapshots, snapshotIndex, () => frame.generateDescription());
     }
 
     this.frames.push(frame);
@@ -594,13 +538,25 @@ export class Executor {
   }
 
   /**
-   * Evaluates a single expression statement (must be a function call).
-   * Used for IO exercises to call student-defined functions and capture return values.
+   * Calls a function defined by the executed program with native argument
+   * values, converted with createPyObject. Used for IO exercises to call
+   * student-defined functions and capture return values.
    *
-   * @param statement - Must be an ExpressionStatement containing a CallExpression
+   * The call is made directly rather than by formatting and parsing a calling
+   * snippet, so arguments reach the function exactly as given (strings with
+   * quotes, booleans, None) and no throwaway program goes through the parser.
+   * Errors raised by the call itself (unknown function, wrong number of
+   * arguments) have no source of their own, so they're reported at
+   * Location.unknown; errors inside the function keep their real location.
+   *
+   * @param functionName - Name of the function to call
+   * @param args - Native argument values
    * @returns Object with the function's return value, frames, and execution metadata
    */
-  public evaluateSingleExpression(statement: Statement): {
+  public evaluateFunctionCall(
+    functionName: string,
+    args: any[]
+  ): {
     value: any;
     jikiObject?: JikiObject;
     frames: Frame[];
@@ -609,106 +565,50 @@ export class Executor {
     error: null;
     meta: {
       functionCallLog: Array<{ name: string; args: any[]; return: any }>;
-      statements: Statement[];
       sourceCode: string;
     };
   } {
-    try {
-      // Validate that this is an ExpressionStatement with a CallExpression
-      if (!(statement instanceof ExpressionStatement)) {
-        throw new RuntimeError(
-          "evaluateSingleExpression requires an ExpressionStatement",
-          statement.location,
-          "LogicErrorInExecution",
-          { statement }
-        );
-      }
-
-      if (!(statement.expression instanceof CallExpression)) {
-        throw new RuntimeError(
-          "evaluateSingleExpression requires a CallExpression",
-          statement.location,
-          "LogicErrorInExecution",
-          { expression: statement.expression }
-        );
-      }
+    const location = Location.unknown;
+    const result = (success: boolean, callResult?: EvaluationResultCallExpression) => ({
+      value: callResult ? unwrapPyObject(callResult.jikiObject) : undefined,
+      jikiObject: callResult?.jikiObject,
+      frames: this.frames,
+      logLines: this.logLines,
+      success,
+      error: null,
+      meta: {
+        functionCallLog: this.functionCallLog,
+        sourceCode: this.sourceCode,
+      },
+    });
 
-      // Execute the call expression within execution context
+    try {
       // Frames are generated naturally during execution, don't add extra frame
-      let callResult: any;
+      let callResult: EvaluationResultCallExpression | undefined;
       const success = this.withExecutionContext(() => {
-        callResult = executeCallExpression(this, statement.expression as CallExpression);
+        const callee = this.environment.get(functionName);
+        if (callee === undefined) {
+          this.error("UndefinedVariable", location, { name: functionName });
+        }
+        const callable = assertCallable(this, callee, location);
+        const argResults: EvaluationResultExpression[] = args.map(arg => {
+          const jikiObject = createPyObject(arg);
+          return { type: "LiteralExpression", jikiObject, immutableJikiObject: jikiObject.clone() };
+        });
+        callResult = invokeCallable(this, callable, argResults, location);
       });
 
-      if (!success) {
-        return {
-          value: undefined,
-          frames: this.frames,
-          logLines: this.logLines,
-          success: false,
-          error: null,
-          meta: {
-            functionCallLog: this.functionCallLog,
-            statements: [statement],
-            sourceCode: this.sourceCode,
-          },
-        };
-      }
-
-      return {
-        value: callResult ? unwrapPyObject(callResult.jikiObject) : undefined,
-        jikiObject: callResult?.jikiObject,
-        frames: this.frames,
-        logLines: this.logLines,
-        success: true,
-        error: null,
-        meta: {
-          functionCallLog: this.functionCallLog,
-          statements: [statement],
-          sourceCode: this.sourceCode,
-        },
-      };
+      return result(success, success ? callResult : undefined);
     } catch (error) {
       if (error instanceof RuntimeError) {
-        // Only errors raised by the synthetic calling code (which lives on line 1)
-        // get remapped. Errors from the student's own code keep their real location.
-        if (error.location.line === 1) {
-          // Remap to the statement location to avoid garbage code extraction.
-          const newError = new RuntimeError(error.message, statement.location, error.type, error.context);
-          this.addErrorFrame(statement.location, newError, statement);
-        } else {
-          this.addErrorFrame(error.location, error, statement);
-        }
-
-        return {
-          value: undefined,
-          frames: this.frames,
-          logLines: this.logLines,
-          success: false,
-          error: null,
-          meta: {
-            functionCallLog: this.functionCallLog,
-            statements: [statement],
-            sourceCode: this.sourceCode,
-          },
-        };
+        this.addErrorFrame(error.location, error);
+        return result(false);
       }
 
       // Handle break/continue outside loop
       if (error instanceof BreakFlowControlError || error instanceof ContinueFlowControlError) {
         // These should already have been handled and added error frames
-        return {
-          value: undefined,
-          frames: this.frames,
-          logLines: this.logLines,
-          success: false,
-          error: null,
-          meta: {
-            functionCallLog: this.functionCallLog,
-            statements: [statement],
-            sourceCode: this.sourceCode,
-          },
-        };
+        return result(false);
       }
 
       throw error;
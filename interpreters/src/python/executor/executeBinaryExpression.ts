@@ -236,7 +236,7 @@ function handleGreaterOperation(
 ): JikiObject {
   const left = leftResult.jikiObject.value;
   const right = rightResult.jikiObject.value;
-  return new PyBoolean(left > right);
+  return PyBoolean.of(left > right);
 }
 
 function handleGreaterEqualOperation(
@@ -245,7 +245,7 @@ function handleGreaterEqualOperation(
 ): JikiObject {
   const left = leftResult.jikiObject.value;
   const right = rightResult.jikiObject.value;
-  return new PyBoolean(left >= right);
+  return PyBoolean.of(left >= right);
 }
 
 function handleLessOperation(
@@ -254,7 +254,7 @@ function handleLessOperation(
 ): JikiObject {
   const left = leftResult.jikiObject.value;
   const right = rightResult.jikiObject.value;
-  return new PyBoolean(left < right);
+  return PyBoolean.of(left < right);
 }
 
 function handleLessEqualOperation(
@@ -263,7 +263,7 @@ function handleLessEqualOperation(
 ): JikiObject {
   const left = leftResult.jikiObject.value;
   const right = rightResult.jikiObject.value;
-  return new PyBoolean(left <= right);
+  return PyBoolean.of(left <= right);
 }
 
 function handleEqualOperation(
@@ -272,7 +272,7 @@ function handleEqualOperation(
 ): JikiObject {
   const left = leftResult.jikiObject.value;
   const right = rightResult.jikiObject.value;
-  return new PyBoolean(left === right);
+  return PyBoolean.of(left === right);
 }
 
 function handleNotEqualOperation(
@@ -281,7 +281,7 @@ function handleNotEqualOperation(
 ): JikiObject {
   const left = leftResult.jikiObject.value;
   const right = rightResult.jikiObject.value;
-  return new PyBoolean(left !== right);
+  return PyBoolean.of(left !== right);
 }
 
 function verifyNumbersForArithmetic(
@@ -5,6 +5,7 @@ import type { EvaluationResultExpression, EvaluationResultCallExpression } from
 import { createPyObject, PyStdLibFunction, PyNone } from "../jikiObjects";
 import type { JikiObject } from "../jikiObjects";
 import type { Arity } from "../../shared/interfaces";
+import type { Location } from "../../shared/location";
 import { isCallable, type PyCallable, PyUserDefinedFunction, ReturnValue } from "../functions";
 import { LogicError } from "../error";
 import { Environment } from "../environment";
@@ -14,9 +15,22 @@ import { translate } from "../translator";
 export function executeCallExpression(executor: Executor, expression: CallExpression): EvaluationResultCallExpression {
   // Evaluate the callee
   const calleeResult = executor.evaluate(expression.callee);
-  const calleeValue = calleeResult.jikiObject;
+  const callable = assertCallable(executor, calleeResult.jikiObject, expression.location);
 
-  // Check if the value is callable
+  // Evaluate arguments, keeping the full results for describers
+  const argResults: EvaluationResultExpression[] = [];
+  for (const arg of expression.args) {
+    argResults.push(executor.evaluate(arg));
+  }
+
+  return invokeCallable(executor, callable, argResults, expression.location);
+}
+
+export function assertCallable(
+  executor: Executor,
+  calleeValue: JikiObject,
+  location: Location
+): PyCallable | PyStdLibFunction {
   if (!isCallable(calleeValue)) {
     // Get proper type name for error message
     let typeName = calleeValue.type;
@@ -25,25 +39,30 @@ export function executeCallExpression(executor: Executor, expression: CallExpres
     } else if ("pythonTypeName" in calleeValue && typeof calleeValue.pythonTypeName === "function") {
       typeName = calleeValue.pythonTypeName();
     }
-    executor.error("TypeError", expression.location, {
+    executor.error("TypeError", location, {
       message: `'${typeName}' object is not callable`,
     });
   }
 
   // Handle both PyCallable and PyStdLibFunction
-  const callable = calleeValue as PyCallable | PyStdLibFunction;
+  return calleeValue as PyCallable | PyStdLibFunction;
+}
 
-  // Evaluate arguments and store both the results and JikiObjects
-  const argResults: EvaluationResultExpression[] = [];
-  const argJikiObjects: JikiObject[] = [];
-  for (const arg of expression.args) {
-    const argResult = executor.evaluate(arg);
-    argResults.push(argResult);
-    argJikiObjects.push(argResult.jikiObject);
-  }
+/**
+ * Calls `callable` with already-evaluated arguments. Errors raised by the call
+ * itself (wrong number of arguments, a failing external or stdlib function)
+ * are reported at `location`.
+ */
+export function invokeCallable(
+  executor: Executor,
+  callable: PyCallable | PyStdLibFunction,
+  argResults: EvaluationResultExpression[],
+  location: Location
+): EvaluationResultCallExpression {
+  const argJikiObjects = argResults.map(argResult => argResult.jikiObject);
 
   // Check arity
-  checkArity(executor, callable.arity, argJikiObjects.length, expression, callable.name);
+  checkArity(executor, callable.arity, argJikiObjects.length, location, callable.name);
 
   // Handle user-defined functions
   if (callable instanceof PyUserDefinedFunction) {
@@ -54,7 +73,7 @@ export function executeCallExpression(executor: Executor, expression: CallExpres
 
   // Handle PyStdLibFunction (stdlib methods)
   if (callable instanceof PyStdLibFunction) {
-    const result = executeStdLibFunction(executor, callable, argJikiObjects, argResults, expression);
+    const result = executeStdLibFunction(executor, callable, argJikiObjects, argResults, location);
     executor.addFunctionCallToLog(callable.name, argJikiObjects, result.jikiObject);
     return result;
   }
@@ -82,11 +101,11 @@ export function executeCallExpression(executor: Executor, expression: CallExpres
   } catch (error) {
     // Handle LogicError from custom functions
     if (error instanceof LogicError) {
-      executor.error("LogicErrorInExecution", expression.location, { message: error.message });
+      executor.error("LogicErrorInExecution", location, { message: error.message });
     }
     // Handle any other errors from the external function
     if (error instanceof Error) {
-      executor.error("FunctionExecutionError", expression.location, {
+      executor.error("FunctionExecutionError", location, {
         function: callable.name,
         message: error.message,
       });
@@ -99,7 +118,7 @@ function checkArity(
   executor: Executor,
   arity: Arity,
   argCount: number,
-  expression: CallExpression,
+  location: Location,
   functionName: string
 ): void {
   const [minArity, maxArity] = typeof arity === "number" ? [arity, arity] : arity;
@@ -118,7 +137,7 @@ function checkArity(
     const inputs = argCount === 1 ? "input" : "inputs";
     const gotMessage = argCount === 0 ? "no" : `${argCount}`;
 
-    executor.error("InvalidNumberOfArguments", expression.location, {
+    executor.error("InvalidNumberOfArguments", location, {
       function: functionName,
       expected: arityMessage,
       slots,
@@ -179,7 +198,7 @@ function executeStdLibFunction(
   callable: PyStdLibFunction,
   argJikiObjects: JikiObject[],
   argResults: EvaluationResultExpression[],
-  expression: CallExpression
+  location: Location
 ): EvaluationResultCallExpression {
   try {
     // PyStdLibFunction expects JikiObjects, not raw values
@@ -197,7 +216,7 @@ function executeStdLibFunction(
     if (error instanceof StdlibError) {
       // error.message is a translation key (e.g., "StdlibArgTypeMismatch")
       const message = translate(`error.stdlib.${error.message}`, error.context);
-      throw new RuntimeError(message, expression.location, error.errorType, error.context);
+      throw new RuntimeError(message, location, error.errorType, error.context);
     }
     // Re-throw other errors
     throw error;
@@ -28,7 +28,7 @@ export function executeForInStatement(executor: Executor, statement: ForInStatem
     items = iterable.value;
   } else if (iterable instanceof PyString) {
     // Convert string to array of character PyStrings
-    items = iterable.value.split("").map(char => new PyString(char));
+    items = iterable.value.split("").map(char => PyString.of(char));
   } else {
     // Get the proper Python type name
     const typeName =
@@ -59,14 +59,22 @@ export function executeForInStatement(executor: Executor, statement: ForInStatem
     };
   });
 
+  // Lists are read through the live object on every iteration (rather than a
+  // captured array) so that writes made by the loop body are seen, as in Python.
+  const itemCount = () => (iterable instanceof PyList ? iterable.length : items.length);
+  const itemAt = (index: number) =>
+    (iterable instanceof PyList ? iterable.getElement(index) : items[index]) as JikiObject;
+
   // If the iterable is empty, we're done
-  if (items.length === 0) {
+  if (itemCount() === 0) {
     return null;
   }
 
   // Execute the loop
+  const template = { type: "ForInStatement" as const, variableName, iterable: iterableResult };
   let iteration = 0;
-  for (const item of items) {
+  for (let index = 0; index < itemCount(); index++) {
+    const item = itemAt(index);
     iteration++;
 
     // Guard against infinite loops
@@ -76,16 +84,11 @@ export function executeForInStatement(executor: Executor, statement: ForInStatem
     executor.environment.define(variableName, item);
 
     // Create a frame for this iteration
-    executor.executeFrame<EvaluationResultForInStatement>(statement, () => {
-      return {
-        type: "ForInStatement",
-        variableName,
-        iterable: iterableResult,
-        currentValue: item,
-        iteration,
-        jikiObject: item,
-        immutableJikiObject: item.clone(),
-      };
+    executor.addLoopIterationFrame<EvaluationResultForInStatement>(statement, template, {
+      currentValue: item,
+      iteration,
+      jikiObject: item,
+      immutableJikiObject: item.clone(),
     });
 
     // Execute the body statements
@@ -60,7 +60,7 @@ export function executeSubscriptExpression(
     type: "SubscriptExpression",
     object: objectResult,
     index: indexResult,
-    jikiObject: element || new PyNone(),
-    immutableJikiObject: element ? element.clone() : new PyNone(),
+    jikiObject: element || PyNone.instance,
+    immutableJikiObject: element ? element.clone() : PyNone.instance,
   };
 }
@@ -38,7 +38,7 @@ function handleUnaryOperation(
       }
 
       // Apply Python's truthiness rules
-      return new PyBoolean(!isTruthy(rightObject));
+      return PyBoolean.of(!isTruthy(rightObject));
     default:
       executor.error("InvalidUnaryExpression", expression.location, {
         operator: expression.operator.type,
@@ -1,4 +1,4 @@
-export { interpret, compile, evaluateFunction } from "./interpreter";
+export { interpret, compile, evaluateFunction, clearProgramCache } from "./interpreter";
 export { formatIdentifier } from "./assertion-helpers";
 export type { InterpretResult } from "../shared/interfaces";
 export type { EvaluationContext, EvaluateFunctionResult } from "./interpreter";
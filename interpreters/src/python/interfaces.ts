@@ -31,6 +31,9 @@ export interface LanguageFeatures {
   allowTruthiness?: boolean;
   allowTypeCoercion?: boolean;
   maxTotalLoopIterations?: number;
+  // Wall-clock limit on a run, in milliseconds (see shared/executionBudget.ts).
+  // Unlike maxTotalLoopIterations it also stops deep recursion and slow calls.
+  maxWallClockTimeMs?: number;
   // AST node-level restrictions
   // null/undefined = all nodes allowed (default behavior)
   // [] = no nodes allowed
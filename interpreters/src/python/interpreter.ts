@@ -1,25 +1,15 @@
 import { Parser } from "./parser";
 import { Executor } from "./executor";
+import { lowerProgram } from "./opcodes";
 import type { SyntaxError as PySyntaxError } from "./error";
 import type { CompilationResult } from "../shared/errors";
 import type { LanguageFeatures } from "./interfaces";
 import type { ExternalFunction, InterpretResult } from "../shared/interfaces";
 import type { JikiObject } from "./jikiObjects";
-import {
-  extractCallExpressions,
-  extractExpressions,
-  extractVariableAssignments,
-  formatIdentifier,
-  countLinesOfCode,
-  extractFunctionDeclarations,
-  extractMethodCalls,
-  countListExpressions,
-  extractCallExpressionsDeepExcluding,
-  extractOperators,
-} from "./assertion-helpers";
-import type { CallExpression } from "./expression";
-import { LiteralExpression, IdentifierExpression, type Expression } from "./expression";
+import { buildAssertors } from "./assertion-helpers";
 import type { Messages } from "../shared/i18n";
+import type { Statement } from "./statement";
+import { ProgramCache, programCacheKey } from "../shared/programCache";
 
 // Evaluation context that includes external functions
 export interface EvaluationContext {
@@ -38,14 +28,30 @@ export type EvaluateFunctionResult = InterpretResult & {
   jikiObject?: JikiObject;
 };
 
+// Parsed and lowered programs, shared by every run of the same code.
+const programCache = new ProgramCache<Statement[]>(32);
+
+function parseProgram(sourceCode: string, context: EvaluationContext): Statement[] {
+  // Python's diagnostics aren't localized yet, so the locale doesn't affect parsing.
+  const key = programCacheKey(sourceCode, context.languageFeatures ?? null);
+  return programCache.getOrParse(key, () => {
+    const statements = new Parser(context).parse(sourceCode);
+    lowerProgram(statements);
+    return statements;
+  });
+}
+
+export function clearProgramCache(): void {
+  programCache.clear();
+}
+
 /**
  * Compiles Python source code without executing it.
  * Returns { success: true } on successful compilation or { success: false, error } on parse/syntax errors.
  */
 export function compile(sourceCode: string, context: EvaluationContext = {}): CompilationResult {
   try {
-    const parser = new Parser(context);
-    parser.parse(sourceCode);
+    parseProgram(sourceCode, context);
     return { success: true, lintErrors: [] };
   } catch (error: unknown) {
     return { success: false, error: error as PySyntaxError, lintErrors: [] };
@@ -55,8 +61,7 @@ export function compile(sourceCode: string, context: EvaluationContext = {}): Co
 export function interpret(sourceCode: string, context: EvaluationContext = {}): InterpretResult {
   try {
     // Parse the source code (compilation step)
-    const parser = new Parser(context);
-    const statements = parser.parse(sourceCode);
+    const statements = parseProgram(sourceCode, context);
 
     // Execute statements
     const executor = new Executor(sourceCode, context);
@@ -129,42 +134,19 @@ export function evaluateFunction(
   ...args: any[]
 ): EvaluateFunctionResult {
   // Parse the student's source code - let parse errors throw (matches JikiScript behavior)
-  const parser = new Parser(context);
-  const statements = parser.parse(sourceCode);
-
-  // Generate the function call code
-  // Python uses repr() style for strings and other values
-  const formattedArgs = args.map(arg => {
-    if (typeof arg === "string") {
-      return `"${arg}"`;
-    } else if (Array.isArray(arg)) {
-      return JSON.stringify(arg);
-    } else if (typeof arg === "object" && arg !== null) {
-      return JSON.stringify(arg);
-    }
-    return String(arg);
-  });
-  const callingCode = `${functionName}(${formattedArgs.join(", ")})`;
-
-  // Parse the calling code - let parse errors throw
-  const callingParser = new Parser(context);
-  const callingStatements = callingParser.parse(callingCode);
-
-  if (callingStatements.length !== 1) {
-    throw new Error(`Expected exactly one statement for function call, got ${callingStatements.length}`);
-  }
+  const statements = parseProgram(sourceCode, context);
 
   // Create executor and execute in two phases:
   // 1. Execute student code (defines functions)
-  // 2. Execute function call (calls the function)
+  // 2. Call the function directly with the given values
   // Runtime errors are captured in frames, not thrown
   const executor = new Executor(sourceCode, context);
 
   // Phase 1: Execute student code to define functions
   executor.execute(statements);
 
-  // Phase 2: Evaluate the function call
-  const callResult = executor.evaluateSingleExpression(callingStatements[0]);
+  // Phase 2: Call the function
+  const callResult = executor.evaluateFunctionCall(functionName, args);
 
   return {
     value: callResult.value,
@@ -179,88 +161,6 @@ export function evaluateFunction(
       statements: statements, // Return the original student code statements
       sourceCode: sourceCode,
     },
-    assertors: {
-      assertAllArgumentsAreVariables: () => {
-        return extractCallExpressions(statements).every((expr: CallExpression) => {
-          return expr.args.every((arg: Expression) => {
-            return !(arg instanceof LiteralExpression);
-          });
-        });
-      },
-      assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => {
-        const formatted = formatIdentifier(funcName);
-        return extractCallExpressions(statements)
-          .filter(
-            (expr: CallExpression) =>
-              expr.callee instanceof IdentifierExpression && expr.callee.name.lexeme === formatted
-          )
-          .every((expr: CallExpression) => {
-            return expr.args.every((arg: Expression, i: number) => {
-              if (!flags[i]) {
-                return true;
-              }
-              return !(arg instanceof LiteralExpression);
-            });
-          });
-      },
-      assertNoLiteralNumberAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-        const formattedInclude = include?.map(formatIdentifier);
-        const formattedExclude = exclude?.map(formatIdentifier);
-        return extractVariableAssignments(statements).every(({ name, value }) => {
-          if (formattedExclude?.includes(name)) {
-            return true;
-          }
-          if (formattedInclude && !formattedInclude.includes(name)) {
-            return true;
-          }
-          return !(value instanceof LiteralExpression && typeof value.value === "number");
-        });
-      },
-      assertNoLiteralNumbersInAssignments: ({ include, exclude }: { include?: string[]; exclude?: string[] }) => {
-        const formattedInclude = include?.map(formatIdentifier);
-        const formattedExclude = exclude?.map(formatIdentifier);
-        return extractVariableAssignments(statements).every(({ name, value }) => {
-          if (formattedExclude?.includes(name)) {
-            return true;
-          }
-          if (formattedInclude && !formattedInclude.includes(name)) {
-            return true;
-          }
-          return extractExpressions([value], LiteralExpression).filter(l => typeof l.value === "number").length === 0;
-        });
-      },
-      countLinesOfCode: () => countLinesOfCode(sourceCode),
-      assertMaxLinesOfCode: (limit: number) => countLinesOfCode(sourceCode) <= limit,
-      assertFunctionDefined: (name: string) => {
-        const formatted = formatIdentifier(name);
-        return extractFunctionDeclarations(statements).some(fd => fd.name.lexeme === formatted);
-      },
-      countFunctionDefinitions: () => extractFunctionDeclarations(statements).length,
-      assertMethodCalled: (methodName: string) => {
-        const formatted = formatIdentifier(methodName);
-        return extractMethodCalls(statements).some(mc => mc.methodName === formatted);
-      },
-      countMethodCalls: () => extractMethodCalls(statements).length,
-      countArrayLiterals: () => countListExpressions(statements),
-      assertFunctionCalledOutsideOwnDefinition: (funcName: string) => {
-        const formatted = formatIdentifier(funcName);
-        const callsOutside = extractCallExpressionsDeepExcluding(statements, formatted);
-        return callsOutside.some(
-          call => call.callee instanceof IdentifierExpression && call.callee.name.lexeme === formatted
-        );
-      },
-      numFunctionCallsInCode: (funcName: string) => {
-        const formatted = formatIdentifier(funcName);
-        return extractCallExpressions(statements).filter(
-          expr => expr.callee instanceof IdentifierExpression && expr.callee.name.lexeme === formatted
-        ).length;
-      },
-      // TODO: JS-only for now. Implement for Python when needed.
-      assertFunctionCallsAnotherFunction: () => false,
-      assertOperatorUsed: (operator: string) => extractOperators(statements).includes(operator),
-      // TODO: JS-only for now. Implement statement matching for Python when needed.
-      assertStatement: () => false,
-      assertMaxLoopNestingDepth: () => true,
-    },
+    assertors: buildAssertors(statements, sourceCode),
   };
 }
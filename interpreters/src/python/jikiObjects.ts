@@ -1,14 +1,37 @@
 // Python objects system extending shared base
 import { JikiObject } from "../shared/jikiObject";
+import { CopyOnWriteArray } from "../shared/copyOnWrite";
 export { JikiObject } from "../shared/jikiObject";
 export { PyStdLibFunction } from "./jikiObjects/PyStdLibFunction";
 export { PyBuiltinModule } from "./jikiObjects/PyBuiltinModule";
 
+// Like CPython, small integers and short strings are interned: they're created
+// constantly by arithmetic, comparisons and iteration, and are all immutable,
+// so sharing one instance per value saves an allocation every time.
+const SMALL_INT_MIN = -5;
+const SMALL_INT_MAX = 256;
+const MAX_INTERNED_STRING_LENGTH = 1;
+
 export class PyNumber extends JikiObject {
+  private static smallInts: PyNumber[] | undefined;
+
   constructor(public readonly _value: number) {
     super("number");
   }
 
+  // Returns the interned instance for small integers, a new PyNumber otherwise.
+  public static of(value: number): PyNumber {
+    // -0 is left alone so it keeps its sign
+    if (!Number.isInteger(value) || value < SMALL_INT_MIN || value > SMALL_INT_MAX || Object.is(value, -0)) {
+      return new PyNumber(value);
+    }
+    PyNumber.smallInts ??= Array.from(
+      { length: SMALL_INT_MAX - SMALL_INT_MIN + 1 },
+      (_, idx) => new PyNumber(idx + SMALL_INT_MIN)
+    );
+    return PyNumber.smallInts[value - SMALL_INT_MIN];
+  }
+
   public get value(): number {
     return this._value;
   }
@@ -22,6 +45,10 @@ export class PyNumber extends JikiObject {
     return this;
   }
 
+  public get isImmutable(): boolean {
+    return true;
+  }
+
   // Python-specific: Check if this is an integer
   public isInteger(): boolean {
     return Number.isInteger(this._value);
@@ -38,10 +65,25 @@ export class PyNumber extends JikiObject {
 }
 
 export class PyString extends JikiObject {
+  private static readonly interned = new Map<string, PyString>();
+
   constructor(public readonly _value: string) {
     super("string");
   }
 
+  // Returns the interned instance for empty and single-character strings, a new PyString otherwise.
+  public static of(value: string): PyString {
+    if (value.length > MAX_INTERNED_STRING_LENGTH) {
+      return new PyString(value);
+    }
+    let str = PyString.interned.get(value);
+    if (str === undefined) {
+      str = new PyString(value);
+      PyString.interned.set(value, str);
+    }
+    return str;
+  }
+
   public get value(): string {
     return this._value;
   }
@@ -55,6 +97,10 @@ export class PyString extends JikiObject {
     return this;
   }
 
+  public get isImmutable(): boolean {
+    return true;
+  }
+
   // Python-specific: Get string representation with quotes
   public repr(): string {
     return `"${this._value}"`;
@@ -66,10 +112,17 @@ export class PyString extends JikiObject {
 }
 
 export class PyBoolean extends JikiObject {
+  public static readonly True = new PyBoolean(true);
+  public static readonly False = new PyBoolean(false);
+
   constructor(public readonly _value: boolean) {
     super("boolean");
   }
 
+  public static of(value: boolean): PyBoolean {
+    return value ? PyBoolean.True : PyBoolean.False;
+  }
+
   public get value(): boolean {
     return this._value;
   }
@@ -84,12 +137,18 @@ export class PyBoolean extends JikiObject {
     return this;
   }
 
+  public get isImmutable(): boolean {
+    return true;
+  }
+
   public pythonTypeName(): string {
     return "bool";
   }
 }
 
 export class PyNone extends JikiObject {
+  public static readonly instance = new PyNone();
+
   constructor() {
     super("none");
   }
@@ -107,44 +166,49 @@ export class PyNone extends JikiObject {
     return this;
   }
 
+  public get isImmutable(): boolean {
+    return true;
+  }
+
   public pythonTypeName(): string {
     return "NoneType";
   }
 }
 
 export class PyList extends JikiObject {
-  private readonly elements: JikiObject[];
+  private readonly store: CopyOnWriteArray;
 
-  constructor(elements: JikiObject[]) {
+  constructor(elements: JikiObject[] | CopyOnWriteArray) {
     super("list");
-    this.elements = elements;
+    this.store = elements instanceof CopyOnWriteArray ? elements : new CopyOnWriteArray(elements);
   }
 
   public get length(): number {
-    return this.elements.length;
+    return this.store.length;
   }
 
   public getElement(index: number): JikiObject | undefined {
-    return this.elements[index];
+    return this.store.get(index);
   }
 
   public setElement(index: number, value: JikiObject): void {
-    this.elements[index] = value;
+    this.store.set(index, value);
   }
 
   public get value(): JikiObject[] {
-    return this.elements;
+    return this.store.elements;
   }
 
   public toString(): string {
-    if (this.elements.length === 0) {
+    const elements = this.value;
+    if (elements.length === 0) {
       return "[]";
     }
 
     // Handle sparse arrays - map over indices to show undefined for missing elements
     const elementStrings: string[] = [];
-    for (let i = 0; i < this.elements.length; i++) {
-      const elem = this.elements[i];
+    for (let i = 0; i < elements.length; i++) {
+      const elem = elements[i];
       // Sparse arrays can have undefined elements - checking is necessary
       // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
       if (elem === undefined) {
@@ -161,14 +225,8 @@ export class PyList extends JikiObject {
   }
 
   public clone(): PyList {
-    // Deep clone - handle sparse arrays correctly
-    const clonedElements: JikiObject[] = [];
-    for (let i = 0; i < this.elements.length; i++) {
-      if (i in this.elements) {
-        clonedElements[i] = this.elements[i].clone();
-      }
-    }
-    return new PyList(clonedElements);
+    // Shares the backing store until either side next writes (deep clones nested containers)
+    return new PyList(this.store.snapshot(elem => elem.clone()));
   }
 
   public pythonTypeName(): string {
@@ -179,13 +237,13 @@ export class PyList extends JikiObject {
 // Helper function to create PyObjects from Python values
 export function createPyObject(value: any): JikiObject {
   if (typeof value === "number") {
-    return new PyNumber(value);
+    return PyNumber.of(value);
   } else if (typeof value === "string") {
-    return new PyString(value);
+    return PyString.of(value);
   } else if (typeof value === "boolean") {
-    return new PyBoolean(value);
+    return PyBoolean.of(value);
   } else if (value === null || value === undefined) {
-    return new PyNone();
+    return PyNone.instance;
   } else if (Array.isArray(value)) {
     return new PyList(value.map(elem => createPyObject(elem)));
   }
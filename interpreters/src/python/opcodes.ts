@@ -0,0 +1,138 @@
+import type { Expression } from "./expression";
+import {
+  type Statement,
+  BlockStatement,
+  IfStatement,
+  ForInStatement,
+  WhileStatement,
+  RepeatStatement,
+  FunctionDeclaration,
+} from "./statement";
+
+/**
+ * Opcodes for every AST node the Python executor knows how to run.
+ *
+ * The parser produces an object graph that used to be dispatched with a long
+ * `instanceof` chain (and an `Array.includes` over `allowedNodes`) on every
+ * visit. Lowering stamps each node with a small integer once, up front, so the
+ * executor can dispatch with a single `switch` and check node allowance with a
+ * typed-array lookup. The frames produced are unchanged: lowering never alters
+ * the tree, it only annotates it.
+ *
+ * `Unknown` is reserved for node types without an executor (e.g. a node type
+ * added to the parser but not yet wired up here).
+ */
+export const Opcode = {
+  Unknown: 0,
+
+  // Statements
+  ExpressionStatement: 1,
+  PrintStatement: 2,
+  AssignmentStatement: 3,
+  BlockStatement: 4,
+  IfStatement: 5,
+  ForInStatement: 6,
+  WhileStatement: 7,
+  RepeatStatement: 8,
+  BreakStatement: 9,
+  ContinueStatement: 10,
+  FunctionDeclaration: 11,
+  ReturnStatement: 12,
+
+  // Expressions
+  LiteralExpression: 13,
+  BinaryExpression: 14,
+  LogicalExpression: 15,
+  UnaryExpression: 16,
+  GroupingExpression: 17,
+  IdentifierExpression: 18,
+  ListExpression: 19,
+  SubscriptExpression: 20,
+  CallExpression: 21,
+  AttributeExpression: 22,
+  FStringExpression: 23,
+} as const;
+
+const OPCODE_COUNT = 24;
+
+const opcodesByType: ReadonlyMap<string, number> = new Map(Object.entries(Opcode));
+
+function opcodeForType(type: string): number {
+  return opcodesByType.get(type) ?? Opcode.Unknown;
+}
+
+/**
+ * Stamp a single node with its opcode. Used lazily by the executor for nodes
+ * that were never lowered (e.g. statements built outside `interpret`).
+ */
+export function lowerNode(node: Statement | Expression): number {
+  const opcode = opcodeForType(node.type);
+  node.opcode = opcode;
+  return opcode;
+}
+
+/**
+ * Lower a whole parsed program in a single walk, stamping every statement and
+ * expression (including function bodies and nested blocks) with its opcode.
+ * Returns the number of nodes lowered.
+ */
+export function lowerProgram(statements: Statement[]): number {
+  let count = 0;
+  const stack: Array<Statement | Expression> = [...statements];
+
+  while (stack.length > 0) {
+    const node = stack.pop()!;
+    // eslint-disable-next-line @typescript-eslint/no-unnecessary-condition
+    if (!node || node.opcode !== undefined) {
+      continue;
+    }
+
+    lowerNode(node);
+    count++;
+
+    stack.push(...node.children());
+    for (const sub of subStatements(node)) {
+      stack.push(sub);
+    }
+  }
+
+  return count;
+}
+
+function subStatements(node: Statement | Expression): Statement[] {
+  if (node instanceof BlockStatement) {
+    return node.statements;
+  }
+  if (node instanceof IfStatement) {
+    return node.elseBranch ? [node.thenBranch, node.elseBranch] : [node.thenBranch];
+  }
+  if (
+    node instanceof ForInStatement ||
+    node instanceof WhileStatement ||
+    node instanceof RepeatStatement ||
+    node instanceof FunctionDeclaration
+  ) {
+    return node.body;
+  }
+  return [];
+}
+
+/**
+ * Pre-resolve an `allowedNodes` list into a per-opcode lookup table, so the
+ * executor's per-visit check is a single indexed read. Returns null when all
+ * nodes are allowed (null/undefined `allowedNodes`).
+ */
+export function buildNodeAllowance(allowedNodes: readonly string[] | null | undefined): Uint8Array | null {
+  if (allowedNodes === null || allowedNodes === undefined) {
+    return null;
+  }
+
+  const allowance = new Uint8Array(OPCODE_COUNT);
+  for (const nodeType of allowedNodes) {
+    const opcode = opcodeForType(nodeType);
+    if (opcode !== Opcode.Unknown) {
+      allowance[opcode] = 1;
+    }
+  }
+  return allowance;
+}
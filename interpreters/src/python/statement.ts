@@ -4,6 +4,8 @@ import type { Token } from "./token";
 import type { Location } from "../shared/location";
 
 export abstract class Statement {
+  // Stamped by lowerProgram() so the executor can dispatch without instanceof checks
+  public opcode?: number;
   constructor(public type: string) {}
   abstract location: Location;
   abstract children(): Expression[];
@@ -19,7 +19,7 @@ export const print: BuiltinFunction = {
     // Log the output with current execution time
     ctx.log(output);
     // Python's print() always returns None
-    return new PyNone();
+    return PyNone.instance;
   },
   description: "prints the given arguments to the output",
 };
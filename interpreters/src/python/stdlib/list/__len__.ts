@@ -13,7 +13,7 @@ export const __len__: Method = {
     // Validate no arguments
     guardNoArgs(args, "__len__");
 
-    return new PyNumber(list.length);
+    return PyNumber.of(list.length);
   },
   description: "returns the number of elements in the list",
 };
@@ -46,7 +46,7 @@ export const index: Method = {
       // In Python, index() uses equality comparison (==)
       // For now, we'll do simple value comparison
       if (element.type === searchValue.type && element.value === searchValue.value) {
-        return new PyNumber(i);
+        return PyNumber.of(i);
       }
     }
 
@@ -22,7 +22,7 @@ export const randint: Method = {
     }
 
     const result = Math.floor(ctx.random() * (max - min + 1)) + min;
-    return new PyNumber(result);
+    return PyNumber.of(result);
   },
   description: "returns a random integer between a and b (both inclusive)",
 };
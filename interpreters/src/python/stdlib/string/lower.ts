@@ -12,7 +12,7 @@ export const lower: Method = {
     // Validate no arguments
     guardNoArgs(args, "lower");
 
-    return new PyStringClass(str.value.toLowerCase());
+    return PyStringClass.of(str.value.toLowerCase());
   },
   description: "returns a string with all characters converted to lowercase",
 };
@@ -12,7 +12,7 @@ export const upper: Method = {
     // Validate no arguments
     guardNoArgs(args, "upper");
 
-    return new PyStringClass(str.value.toUpperCase());
+    return PyStringClass.of(str.value.toUpperCase());
   },
   description: "returns a string with all characters converted to uppercase",
 };
@@ -0,0 +1,206 @@
+import type { JikiObject } from "./jikiObject";
+
+/**
+ * Copy-on-write backing stores for the interpreters' container objects.
+ *
+ * Every evaluation result carries an `immutableJikiObject` snapshot built with
+ * `clone()`. Deep-copying a container for each of those made a loop that grows
+ * a list quadratic. Instead, a snapshot shares its backing store with the live
+ * object and the store is only copied when one of them next writes to it.
+ *
+ * Sharing is only safe while the elements are themselves immutable (numbers,
+ * strings, booleans, None/null/undefined): a nested list could otherwise be
+ * mutated underneath a snapshot. Once a container has held a mutable element it
+ * falls back to a deep clone, exactly as before. That flag is sticky — clearing
+ * it would mean rescanning the elements, which is the cost we're avoiding.
+ */
+
+function isMutable(value: JikiObject | undefined): boolean {
+  return value !== undefined && !value.isImmutable;
+}
+
+export class CopyOnWriteArray<T extends JikiObject = JikiObject> {
+  private store: T[];
+  private size: number;
+  private shared = false;
+  private holdsMutable: boolean;
+  // Memoised view for snapshots whose store has since been appended to.
+  private truncatedView: T[] | null = null;
+
+  constructor(elements: T[], size: number = elements.length, holdsMutable?: boolean) {
+    this.store = elements;
+    this.size = size;
+    this.holdsMutable = holdsMutable ?? elements.some(isMutable);
+  }
+
+  public get length(): number {
+    return this.size;
+  }
+
+  /**
+   * The current elements. The returned array must be treated as read-only:
+   * it may be shared with snapshots.
+   */
+  public get elements(): T[] {
+    if (this.size === this.store.length) {
+      return this.store;
+    }
+    this.truncatedView ??= this.store.slice(0, this.size);
+    return this.truncatedView;
+  }
+
+  public get(index: number): T | undefined {
+    return index < this.size ? this.store[index] : undefined;
+  }
+
+  public set(index: number, value: T): void {
+    this.writable()[index] = value;
+    this.size = this.store.length;
+    this.noteInserted(value);
+  }
+
+  /**
+   * Appends never disturb a snapshot: a snapshot remembers its own length, so
+   * as long as we're writing past the end of everyone's view we can push onto
+   * a shared store in place.
+   */
+  public push(...items: T[]): number {
+    if (this.size !== this.store.length) {
+      this.writable();
+    }
+    this.store.push(...items);
+    this.size = this.store.length;
+    this.truncatedView = null;
+    for (const item of items) {
+      this.noteInserted(item);
+    }
+    return this.size;
+  }
+
+  public pop(): T | undefined {
+    if (this.size === 0) {
+      return undefined;
+    }
+    // Shrinking our own view is enough; the store is left intact for snapshots.
+    if (this.shared) {
+      this.size--;
+      this.truncatedView = null;
+      return this.store[this.size];
+    }
+    const element = this.store.pop();
+    this.size = this.store.length;
+    return element;
+  }
+
+  /**
+   * Run an arbitrary in-place mutation against a store we own exclusively.
+   * Pass any elements the mutation inserts so mutability is tracked.
+   */
+  public mutate<R>(fn: (elements: T[]) => R, inserted: readonly T[] = []): R {
+    const result = fn(this.writable());
+    this.size = this.store.length;
+    for (const item of inserted) {
+      this.noteInserted(item);
+    }
+    return result;
+  }
+
+  /**
+   * An O(1) snapshot sharing this store, or — once the array has held a
+   * mutable element — a deep clone using `cloneElement`.
+   */
+  public snapshot(cloneElement: (element: T) => T): CopyOnWriteArray<T> {
+    if (this.holdsMutable) {
+      // Handle sparse arrays correctly
+      const cloned: T[] = [];
+      for (let i = 0; i < this.size; i++) {
+        if (i in this.store) {
+          cloned[i] = cloneElement(this.store[i]);
+        }
+      }
+      cloned.length = this.size;
+      return new CopyOnWriteArray(cloned, this.size, true);
+    }
+
+    this.shared = true;
+    const snapshot = new CopyOnWriteArray(this.store, this.size, false);
+    snapshot.shared = true;
+    return snapshot;
+  }
+
+  private writable(): T[] {
+    if (this.shared) {
+      this.store = this.store.slice(0, this.size);
+      this.shared = false;
+      this.truncatedView = null;
+    }
+    return this.store;
+  }
+
+  private noteInserted(value: T | undefined): void {
+    if (!this.holdsMutable && isMutable(value)) {
+      this.holdsMutable = true;
+    }
+  }
+}
+
+export class CopyOnWriteMap<K, V extends JikiObject = JikiObject> {
+  private store: Map<K, V>;
+  private shared = false;
+  private holdsMutable: boolean;
+
+  constructor(entries: Map<K, V>, holdsMutable?: boolean) {
+    this.store = entries;
+    this.holdsMutable = holdsMutable ?? [...entries.values()].some(isMutable);
+  }
+
+  public get size(): number {
+    return this.store.size;
+  }
+
+  /**
+   * The current entries. The returned map must be treated as read-only:
+   * it may be shared with snapshots.
+   */
+  public get entries(): Map<K, V> {
+    return this.store;
+  }
+
+  public get(key: K): V | undefined {
+    return this.store.get(key);
+  }
+
+  public has(key: K): boolean {
+    return this.store.has(key);
+  }
+
+  public set(key: K, value: V): void {
+    if (this.shared) {
+      this.store = new Map(this.store);
+      this.shared = false;
+    }
+    this.store.set(key, value);
+    if (!this.holdsMutable && isMutable(value)) {
+      this.holdsMutable = true;
+    }
+  }
+
+  /**
+   * An O(1) snapshot sharing this store, or — once the map has held a mutable
+   * value — a deep clone using `cloneValue`.
+   */
+  public snapshot(cloneValue: (value: V) => V): CopyOnWriteMap<K, V> {
+    if (this.holdsMutable) {
+      const cloned = new Map<K, V>();
+      for (const [key, value] of this.store) {
+        cloned.set(key, cloneValue(value));
+      }
+      return new CopyOnWriteMap(cloned, true);
+    }
+
+    this.shared = true;
+    const snapshot = new CopyOnWriteMap(this.store, false);
+    snapshot.shared = true;
+    return snapshot;
+  }
+}
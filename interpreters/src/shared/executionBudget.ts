@@ -0,0 +1,38 @@
+// How many steps pass between clock reads. A power of two, so the check is a mask.
+const CHECK_INTERVAL = 1024;
+
+/**
+ * A wall-clock limit on one run of the student's code.
+ *
+ * Loop limits catch runaway loops, but not deep recursion, slow stdlib calls or
+ * huge string and list operations, and the tab stays frozen however long those
+ * take. So an executor can also be given a real-time budget, which it counts
+ * down a step (a statement) at a time. Reading the clock costs more than many
+ * statements do, so it is only read every CHECK_INTERVAL steps: a run overshoots
+ * its budget by at most that many statements.
+ */
+export class ExecutionBudget {
+  private steps = 0;
+  private readonly deadline: number;
+
+  constructor(
+    maxWallClockTimeMs: number | undefined,
+    private readonly now: () => number = () => performance.now()
+  ) {
+    this.deadline = maxWallClockTimeMs === undefined ? Infinity : now() + maxWallClockTimeMs;
+  }
+
+  /**
+   * Count one step, returning true once the run has gone past its deadline.
+   */
+  public exhausted(): boolean {
+    if (this.deadline === Infinity) {
+      return false;
+    }
+    this.steps++;
+    if ((this.steps & (CHECK_INTERVAL - 1)) !== 0) {
+      return false;
+    }
+    return this.now() > this.deadline;
+  }
+}
@@ -50,6 +50,100 @@ export interface Frame {
   context?: any;
 }
 
+/**
+ * Builds a frame's description. Each executor creates one and shares it
+ * between all the frames it records.
+ */
+export type FrameDescriber = (frame: Frame) => string;
+
+const describeNothing: FrameDescriber = () => "";
+
+/**
+ * The frame every executor records for each step of a run.
+ *
+ * A long run records tens of thousands of frames, but `code` is only read for
+ * the few the student inspects. So rather than slicing the source (and
+ * converting the time) for every frame up front, a frame keeps its location
+ * and a reference to the source, and `code` and `timeInMs` are getters on the
+ * prototype, worked out when read. Likewise `generateDescription` is a method
+ * calling the executor's shared describer, rather than a closure per frame.
+ *
+ * `result` isn't declared here, so LoopIterationFrame can derive it. Executors
+ * assign it on every other frame.
+ */
+export class ExecutionFrame implements Frame {
+  public line: number;
+  public error?: any;
+  public context?: any;
+  public data?: Record<string, any>;
+
+  constructor(
+    private readonly location: { line: number; toCode(code: string): string },
+    private readonly sourceCode: string,
+    public status: FrameExecutionStatus,
+    public time: number,
+    private readonly describer: FrameDescriber = describeNothing
+  ) {
+    this.line = location.line;
+  }
+
+  public get code(): string {
+    return this.location.toCode(this.sourceCode);
+  }
+
+  public get timeInMs(): number {
+    return timeToMs(this.time);
+  }
+
+  public generateDescription(): string {
+    return this.describer(this);
+  }
+}
+
+/**
+ * The frame a loop records as each iteration starts.
+ *
+ * A loop's iteration frames only differ in a field or two (the iteration
+ * number, the current element), and a `repeat 1000 times` records a thousand
+ * of them. So each run of a loop builds one template of the fields its
+ * iterations share, and each iteration frame keeps just its own fields. The
+ * full result is put together the first time it's read (by a describer, or
+ * when the scrubber lands on the frame) and kept from then on, exactly as if
+ * it had been assigned.
+ *
+ * `result` is an own, configurable property, so assigning or deleting it works
+ * as on any other frame. The template and fields are only held by its accessor:
+ * once `result` is built, replaced or deleted, the frame no longer keeps them.
+ */
+export class LoopIterationFrame extends ExecutionFrame {
+  declare public result?: any;
+
+  constructor(
+    location: { line: number; toCode(code: string): string },
+    sourceCode: string,
+    time: number,
+    describer: FrameDescriber,
+    template: object,
+    fields: object
+  ) {
+    super(location, sourceCode, "SUCCESS", time, describer);
+
+    const store = (value: any) => {
+      Object.defineProperty(this, "result", { value, writable: true, configurable: true, enumerable: true });
+    };
+    Object.defineProperty(this, "result", {
+      configurable: true,
+      enumerable: true,
+      get() {
+        const result = { ...template, ...fields };
+        store(result);
+        return result;
+      },
+      set: store,
+    });
+  }
+}
+
 /**
  * Helper function to check if all frames succeeded
  */
@@ -11,8 +11,12 @@ import { createInstance } from "i18next";
  * `EvaluationContext.localeMessages`; the interpreter builds a translator from it.
  *
  * There is no global instance, no mutable active locale, and no `changeLanguage`
- * seam. Each `interpret`/`compile`/`evaluateFunction` run constructs a fresh,
- * isolated translator bound to its injected dict, so runs never interfere.
+ * seam. Each translator is bound to its injected dict, so runs never interfere.
+ * Translators are memoised against the dict's identity: the app fetches one dict
+ * per locale and passes that same object to every run, so a Run with many
+ * scenarios shares one i18next instance instead of initialising one (or several,
+ * in the JavaScript parser and scanner) per scenario. Injected dicts must
+ * therefore be treated as immutable once passed in.
  *
  * `fallbackLng: false` — there is no runtime fallback: a missing key surfaces as
  * the key (visible), never silent English. Completeness is enforced by a guard
@@ -75,9 +79,15 @@ function canonicalLocale(locale: string): string {
   }
 }
 
+const EMPTY_MESSAGES: Messages = {};
+
+// Per dict, the translators built from it, keyed by their resolved locale.
+const translators = new WeakMap<Messages, Map<string, Translator>>();
+
 /**
- * Build a translator bound to a single injected locale dict. Creates a fresh,
- * isolated i18next instance (no shared/global state). If `messages` is
+ * Get the translator bound to a single injected locale dict. The first call for
+ * a dict builds an isolated i18next instance (no shared/global state); later
+ * calls with the same dict and locale reuse it. If `messages` is
  * empty/undefined the translator is still constructable and gracefully returns
  * the key for any lookup.
  *
@@ -85,10 +95,25 @@ function canonicalLocale(locale: string): string {
  * explicitly to override it, which is mostly useful in tests that import a
  * catalog straight off disk.
  */
-export function createTranslator(messages: Messages = {}, locale?: string): Translator {
-  const { [LOCALE_KEY]: taggedLocale, ...translation } = messages;
+export function createTranslator(messages: Messages = EMPTY_MESSAGES, locale?: string): Translator {
+  const taggedLocale = messages[LOCALE_KEY];
   const lng = canonicalLocale(locale ?? (typeof taggedLocale === "string" ? taggedLocale : DEFAULT_LOCALE));
 
+  let byLocale = translators.get(messages);
+  if (byLocale === undefined) {
+    byLocale = new Map();
+    translators.set(messages, byLocale);
+  }
+  let translator = byLocale.get(lng);
+  if (translator === undefined) {
+    translator = buildTranslator(messages, lng);
+    byLocale.set(lng, translator);
+  }
+  return translator;
+}
+
+function buildTranslator(messages: Messages, lng: string): Translator {
+  const { [LOCALE_KEY]: _locale, ...translation } = messages;
   const instance = createInstance();
 
   void instance.init({
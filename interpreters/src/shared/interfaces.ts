@@ -76,23 +76,26 @@ export interface InterpretResult {
   error: InterpreterError | null;
   lintErrors: LintError[];
   meta: Meta;
-  assertors: {
-    assertAllArgumentsAreVariables: () => boolean;
-    assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => boolean;
-    assertNoLiteralNumberAssignments: (opts: { include?: string[]; exclude?: string[] }) => boolean;
-    assertNoLiteralNumbersInAssignments: (opts: { include?: string[]; exclude?: string[] }) => boolean;
-    countLinesOfCode: () => number;
-    assertMaxLinesOfCode: (limit: number) => boolean;
-    assertFunctionDefined: (name: string) => boolean;
-    countFunctionDefinitions: () => number;
-    assertMethodCalled: (methodName: string) => boolean;
-    countMethodCalls: () => number;
-    countArrayLiterals: () => number;
-    assertFunctionCalledOutsideOwnDefinition: (funcName: string) => boolean;
-    assertFunctionCallsAnotherFunction: (funcName: string) => boolean;
-    numFunctionCallsInCode: (funcName: string) => number;
-    assertOperatorUsed: (operator: string) => boolean;
-    assertStatement: (type: string, opts?: { args?: Array<unknown>; count?: number }) => boolean;
-    assertMaxLoopNestingDepth: (depth: 1 | 2) => boolean;
-  };
+  assertors: Assertors;
+}
+
+// Static code checks, answered from the parsed program (see ProgramIndex)
+export interface Assertors {
+  assertAllArgumentsAreVariables: () => boolean;
+  assertSomeArgumentsAreVariablesForFunction: (funcName: string, flags: boolean[]) => boolean;
+  assertNoLiteralNumberAssignments: (opts: { include?: string[]; exclude?: string[] }) => boolean;
+  assertNoLiteralNumbersInAssignments: (opts: { include?: string[]; exclude?: string[] }) => boolean;
+  countLinesOfCode: () => number;
+  assertMaxLinesOfCode: (limit: number) => boolean;
+  assertFunctionDefined: (name: string) => boolean;
+  countFunctionDefinitions: () => number;
+  assertMethodCalled: (methodName: string) => boolean;
+  countMethodCalls: () => number;
+  countArrayLiterals: () => number;
+  assertFunctionCalledOutsideOwnDefinition: (funcName: string) => boolean;
+  assertFunctionCallsAnotherFunction: (funcName: string) => boolean;
+  numFunctionCallsInCode: (funcName: string) => number;
+  assertOperatorUsed: (operator: string) => boolean;
+  assertStatement: (type: string, opts?: { args?: Array<unknown>; count?: number }) => boolean;
+  assertMaxLoopNestingDepth: (depth: 1 | 2) => boolean;
 }
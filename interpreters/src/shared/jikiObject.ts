@@ -1,13 +1,31 @@
+// Object ids are only needed when something asks for identity, which is rare
+// compared to how many objects arithmetic and comparisons create. So they're
+// assigned on first access, from a counter, and kept off the objects themselves.
+const objectIds = new WeakMap<JikiObject, string>();
+let nextObjectId = 1;
+
 export abstract class JikiObject {
-  public readonly objectId: string;
-  constructor(public readonly type: string) {
-    this.objectId = Math.random().toString(36).substring(7);
+  constructor(public readonly type: string) {}
+
+  public get objectId(): string {
+    let id = objectIds.get(this);
+    if (id === undefined) {
+      id = (nextObjectId++).toString(36);
+      objectIds.set(this, id);
+    }
+    return id;
   }
 
   public abstract toString(): string;
   public abstract get value(): any;
   public abstract clone(): JikiObject;
 
+  // Immutable values return themselves from clone(). Containers use this to
+  // decide whether a snapshot can share their backing store (see copyOnWrite.ts).
+  public get isImmutable(): boolean {
+    return false;
+  }
+
   // Display representation used in educational descriptions ("What happened").
   // Defaults to toString(); override where the display form differs from the
   // value/coercion form (e.g. strings are quoted for display but not when
@@ -0,0 +1,69 @@
+/**
+ * A small LRU cache of parsed programs.
+ *
+ * A test run interprets the same student code once per scenario (plus once
+ * per isolated check), and re-running unchanged code after a scrub or a tab
+ * switch does it all again. Parsing is deterministic for a given source, set of
+ * language features and locale, so each interpreter keeps one of these and
+ * only parses a program the first time it sees it.
+ *
+ * Only successful parses are cached: syntax errors are rethrown on every call.
+ * Cached ASTs are shared between runs, so executors must never mutate them
+ * (stamping idempotent annotations, like Python's opcodes, is fine).
+ */
+export class ProgramCache<T> {
+  private readonly entries = new Map<string, T>();
+
+  constructor(private readonly capacity: number) {}
+
+  public get size(): number {
+    return this.entries.size;
+  }
+
+  public getOrParse(key: string, parse: () => T): T {
+    const cached = this.entries.get(key);
+    if (cached !== undefined) {
+      // Re-insert to mark as most recently used (Maps iterate in insertion order)
+      this.entries.delete(key);
+      this.entries.set(key, cached);
+      return cached;
+    }
+
+    const parsed = parse();
+    this.entries.set(key, parsed);
+    if (this.entries.size > this.capacity) {
+      this.entries.delete(this.entries.keys().next().value!);
+    }
+    return parsed;
+  }
+
+  public clear(): void {
+    this.entries.clear();
+  }
+}
+
+// Locale message dicts are identified by reference: the app fetches one per
+// locale and passes the same object to every run.
+const localeIds = new WeakMap<object, number>();
+let nextLocaleId = 1;
+
+function localeId(localeMessages: object | undefined): number {
+  if (localeMessages === undefined) {
+    return 0;
+  }
+  let id = localeIds.get(localeMessages);
+  if (id === undefined) {
+    id = nextLocaleId++;
+    localeIds.set(localeMessages, id);
+  }
+  return id;
+}
+
+/**
+ * Build a cache key from everything that affects parsing. `options` must be
+ * JSON-serialisable (language features, external function names, etc.).
+ */
+export function programCacheKey(sourceCode: string, options: unknown, localeMessages?: object): string {
+  // The source goes last so the separator can't be confused with its contents.
+  return `${localeId(localeMessages)}\u0000${JSON.stringify(options) ?? ""}\u0000${sourceCode}`;
+}
@@ -0,0 +1,114 @@
+/**
+ * Anything with children() - every Statement and Expression in all three
+ * languages.
+ */
+export interface AstNode {
+  children(): readonly (AstNode | null | undefined)[];
+}
+
+type NodeType<T> = abstract new (...args: any[]) => T;
+
+/**
+ * Visit every node in `tree` in pre-order (each node before its children,
+ * siblings left to right), skipping null/undefined children. Uses an explicit
+ * stack, so nothing is allocated per level and deep trees can't overflow.
+ */
+export function walkNodes(tree: readonly (AstNode | null | undefined)[], visit: (node: AstNode) => void): void {
+  const stack: AstNode[] = [];
+  pushReversed(stack, tree);
+  while (stack.length > 0) {
+    const node = stack.pop()!;
+    visit(node);
+    pushReversed(stack, node.children());
+  }
+}
+
+function pushReversed(stack: AstNode[], nodes: readonly (AstNode | null | undefined)[]): void {
+  for (let i = nodes.length - 1; i >= 0; i--) {
+    const node = nodes[i];
+    if (node) {
+      stack.push(node);
+    }
+  }
+}
+
+/**
+ * A program's nodes, gathered in one walk and grouped by type on demand, plus
+ * memoised analyses built from them.
+ *
+ * Code checks ask lots of questions of the same program (is this function
+ * called, is this operator used, how deeply are loops nested...) and a test
+ * run asks them all again for every scenario. Parsed programs are cached and
+ * never mutated (see programCache.ts), so an index keyed by the statements
+ * array stays valid for as long as the array is alive, and each question only
+ * has to be worked out once.
+ */
+export class ProgramIndex {
+  private static readonly indexes = new WeakMap<readonly AstNode[], ProgramIndex>();
+
+  public static for(program: readonly AstNode[]): ProgramIndex {
+    let index = ProgramIndex.indexes.get(program);
+    if (index === undefined) {
+      index = new ProgramIndex(program);
+      ProgramIndex.indexes.set(program, index);
+    }
+    return index;
+  }
+
+  private readonly nodes: AstNode[] = [];
+  private readonly nodesByType = new Map<NodeType<unknown>, unknown[]>();
+  private readonly memos = new Map<string, unknown>();
+
+  private constructor(program: readonly AstNode[]) {
+    walkNodes(program, node => this.nodes.push(node));
+  }
+
+  /**
+   * Every node that is an instance of `type`, in pre-order. The same as
+   * calling the languages' extractExpressions(program, type).
+   */
+  public nodesOf<T>(type: NodeType<T>): T[] {
+    let nodes = this.nodesByType.get(type) as T[] | undefined;
+    if (nodes === undefined) {
+      nodes = this.nodes.filter((node): node is T & AstNode => node instanceof type);
+      this.nodesByType.set(type, nodes);
+    }
+    return nodes;
+  }
+
+  /**
+   * The nodes of `type` grouped by `keyOf`, leaving out nodes it returns
+   * undefined for. Memoised under `key`, so pass the same `keyOf` every time.
+   */
+  public groupNodesOf<T>(key: string, type: NodeType<T>, keyOf: (node: T) => string | undefined): Map<string, T[]> {
+    return this.memo(key, () => {
+      const groups = new Map<string, T[]>();
+      for (const node of this.nodesOf(type)) {
+        const group = keyOf(node);
+        if (group === undefined) {
+          continue;
+        }
+        const members = groups.get(group);
+        if (members === undefined) {
+          groups.set(group, [node]);
+        } else {
+          members.push(node);
+        }
+      }
+      return groups;
+    });
+  }
+
+  /**
+   * The result of `compute`, worked out the first time `key` is asked for.
+   * `compute` must only depend on the program (and whatever `key` encodes).
+   */
+  public memo<T>(key: string, compute: () => T): T {
+    if (this.memos.has(key)) {
+      return this.memos.get(key) as T;
+    }
+    const value = compute();
+    this.memos.set(key, value);
+    return value;
+  }
+}
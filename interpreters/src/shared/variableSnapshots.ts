@@ -0,0 +1,116 @@
+import type { Frame, TestAugmentedFrame } from "./frames";
+import type { JikiObject } from "./jikiObject";
+
+interface VariableDelta {
+  changed: Array<[string, JikiObject]>;
+  removed: string[];
+}
+
+/**
+ * The variables in scope at each test-mode frame, stored as per-frame deltas.
+ *
+ * Test mode used to `cloneDeep` the whole merged scope chain on every frame,
+ * even though almost every frame changes one variable at most and tests only
+ * ever inspect a handful of frames. Recording is now one pass over the scope:
+ * values are snapshotted with `clone()` (O(1) for immutables and copy-on-write
+ * containers) and only those that differ from the last snapshot are kept. The
+ * full view for a frame is only rebuilt when `frame.variables` is read.
+ */
+export class VariableSnapshotLog {
+  private readonly deltas: Array<VariableDelta | null> = [];
+  private readonly latest = new Map<string, JikiObject>();
+
+  // Replay cursor, so reading frames in order rebuilds each view incrementally.
+  private cursor = -1;
+  private cursorState = new Map<string, JikiObject>();
+
+  /**
+   * Record the variables in scope now. Returns the index to read them back with.
+   */
+  public record(variables: Record<string, JikiObject>): number {
+    const changed: Array<[string, JikiObject]> = [];
+    const removed: string[] = [];
+    let count = 0;
+
+    for (const name in variables) {
+      count++;
+      const value = variables[name];
+      // Mutable values may have changed in place, so they're always snapshotted.
+      // Values that clone to themselves (functions, modules) then compare equal.
+      const snapshot = value.isImmutable ? value : value.clone();
+      if (this.latest.get(name) === snapshot) {
+        continue;
+      }
+      this.latest.set(name, snapshot);
+      changed.push([name, snapshot]);
+    }
+
+    // Every name in scope is in `latest`, so anything beyond that has left scope.
+    if (this.latest.size > count) {
+      for (const name of this.latest.keys()) {
+        if (!Object.hasOwn(variables, name)) {
+          removed.push(name);
+        }
+      }
+      for (const name of removed) {
+        this.latest.delete(name);
+      }
+    }
+
+    this.deltas.push(changed.length > 0 || removed.length > 0 ? { changed, removed } : null);
+    return this.deltas.length - 1;
+  }
+
+  public variablesAt(index: number): Record<string, JikiObject> {
+    if (index < this.cursor) {
+      this.cursor = -1;
+      this.cursorState = new Map();
+    }
+
+    while (this.cursor < index) {
+      this.cursor++;
+      const delta = this.deltas[this.cursor];
+      if (delta === null) {
+        continue;
+      }
+      for (const [name, value] of delta.changed) {
+        this.cursorState.set(name, value);
+      }
+      for (const name of delta.removed) {
+        this.cursorState.delete(name);
+      }
+    }
+
+    return Object.fromEntries(this.cursorState);
+  }
+}
+
+/**
+ * Attach the test-only `variables` and `description` fields to a frame as
+ * memoised getters, so neither is built unless a test reads it.
+ */
+export function augmentFrameForTests(
+  frame: Frame,
+  snapshots: VariableSnapshotLog,
+  snapshotIndex: number,
+  describe: () => string
+): void {
+  defineLazy(frame as TestAugmentedFrame, "variables", () => snapshots.variablesAt(snapshotIndex));
+  defineLazy(frame as TestAugmentedFrame, "description", describe);
+}
+
+function defineLazy<K extends "variables" | "description">(
+  frame: TestAugmentedFrame,
+  key: K,
+  build: () => TestAugmentedFrame[K]
+): void {
+  Object.defineProperty(frame, key, {
+    configurable: true,
+    enumerable: true,
+    get() {
+      const value = build();
+      Object.defineProperty(frame, key, { value, writable: true, configurable: true, enumerable: true });
+      return value;
+    },
+  });
+}
@@ -0,0 +1,78 @@
+import { workloads, type Language } from "./workloads";
+import {
+  type Baseline,
+  type Comparison,
+  TOLERANCE,
+  compare,
+  measure,
+  readBaseline,
+  report,
+  writeBaseline,
+} from "./harness";
+
+// Interpreter benchmarks across all three languages.
+//
+// Each workload is timed and compared against the medians stored in
+// baseline.json, rather than against fixed millisecond limits, so the suite
+// works on any machine as long as the baseline was recorded on the same one.
+//
+//   pnpm test:benchmark          compare against baseline.json
+//   pnpm test:benchmark:update   (re)record baseline.json
+//
+// BENCHMARK_ITERATIONS and BENCHMARK_TOLERANCE (a fraction, default 0.25)
+// tune the measured passes and the allowed slowdown.
+
+const languages: Language[] = ["jikiscript", "javascript", "python"];
+const iterations = Number(process.env.BENCHMARK_ITERATIONS ?? 7);
+const updateBaseline = process.env.UPDATE_BENCHMARK_BASELINE === "true";
+
+describe("Interpreter benchmarks", () => {
+  const baseline = readBaseline();
+  const results: Baseline = {};
+  const comparisons: Comparison[] = [];
+
+  beforeAll(() => {
+    // Benchmark mode skips the test-only frame augmentation
+    process.env.RUNNING_BENCHMARKS = "true";
+  });
+
+  afterAll(() => {
+    delete process.env.RUNNING_BENCHMARKS;
+
+    report(comparisons);
+    if (updateBaseline) {
+      writeBaseline({ ...baseline, ...results });
+    }
+  });
+
+  for (const workload of workloads) {
+    describe(workload.name, () => {
+      for (const language of languages) {
+        const build = workload.build[language];
+        if (build === null) {
+          continue;
+        }
+
+        for (const size of workload.sizes) {
+          const id = `${language}/${workload.name}/${size}`;
+
+          test(id, { timeout: 120_000 }, () => {
+            const measurement = measure(build(size), iterations);
+            expect(measurement.frames).toBeGreaterThan(0);
+
+            results[id] = measurement;
+            const comparison = compare(id, measurement, baseline);
+            comparisons.push(comparison);
+
+            if (!updateBaseline && comparison.regressed) {
+              throw new Error(
+                `${id} regressed: median ${measurement.medianMs}ms vs baseline ${comparison.baseline!.medianMs}ms ` +
+                  `(x${comparison.ratio}, tolerance ${Math.round(TOLERANCE * 100)}%)`
+              );
+            }
+          });
+        }
+      }
+    });
+  }
+});
@@ -0,0 +1,129 @@
+import fs from "fs";
+import path from "path";
+import type { Run } from "./workloads";
+
+export interface Measurement {
+  warmupMs: number;
+  medianMs: number;
+  p95Ms: number;
+  // Median growth in heapUsed across a run. Approximates allocation: a GC during
+  // the run will make it read low, so it's a trend line rather than an exact figure.
+  heapDeltaBytes: number;
+  // Highest heapUsed seen after a run, i.e. what a run (and its frames) retains.
+  peakHeapBytes: number;
+  frames: number;
+}
+
+export type Baseline = Record<string, Measurement>;
+
+export interface Comparison {
+  id: string;
+  current: Measurement;
+  baseline?: Measurement;
+  // current / baseline median, when there's a baseline to compare against.
+  ratio?: number;
+  regressed: boolean;
+}
+
+export const BASELINE_PATH = path.resolve(__dirname, "baseline.json");
+
+// How much slower than the baseline median a run may be before it counts as a regression.
+export const TOLERANCE = Number(process.env.BENCHMARK_TOLERANCE ?? 0.25);
+
+// Differences below this are timer noise, however large they look as a ratio.
+const NOISE_FLOOR_MS = 1;
+
+// Only available when node runs with `--expose-gc`; heap figures are noisier without it.
+const gc = (globalThis as { gc?: () => void }).gc;
+
+function percentile(sorted: number[], p: number): number {
+  const index = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, index)];
+}
+
+function round(value: number): number {
+  return Math.round(value * 100) / 100;
+}
+
+/**
+ * Time `run`: one warm-up pass (reported separately, as it includes JIT
+ * warm-up), then `iterations` measured passes.
+ */
+export function measure(run: Run, iterations: number): Measurement {
+  const warmupStart = performance.now();
+  const warmup = run();
+  const warmupMs = performance.now() - warmupStart;
+  if (warmup.error) {
+    throw warmup.error;
+  }
+
+  const timings: number[] = [];
+  const heapDeltas: number[] = [];
+  let peakHeapBytes = 0;
+
+  for (let i = 0; i < iterations; i++) {
+    gc?.();
+    const heapBefore = process.memoryUsage().heapUsed;
+    const start = performance.now();
+    const result = run();
+    timings.push(performance.now() - start);
+    const heapAfter = process.memoryUsage().heapUsed;
+
+    heapDeltas.push(Math.max(0, heapAfter - heapBefore));
+    peakHeapBytes = Math.max(peakHeapBytes, heapAfter);
+    if (result.error) {
+      throw result.error;
+    }
+  }
+
+  timings.sort((a, b) => a - b);
+  heapDeltas.sort((a, b) => a - b);
+
+  return {
+    warmupMs: round(warmupMs),
+    medianMs: round(percentile(timings, 50)),
+    p95Ms: round(percentile(timings, 95)),
+    heapDeltaBytes: percentile(heapDeltas, 50),
+    peakHeapBytes,
+    frames: warmup.frames.length,
+  };
+}
+
+export function compare(id: string, current: Measurement, baseline: Baseline): Comparison {
+  const previous = baseline[id] as Measurement | undefined;
+  if (previous === undefined) {
+    return { id, current, regressed: false };
+  }
+
+  const ratio = current.medianMs / previous.medianMs;
+  const regressed = ratio > 1 + TOLERANCE && current.medianMs - previous.medianMs > NOISE_FLOOR_MS;
+  return { id, current, baseline: previous, ratio: round(ratio), regressed };
+}
+
+export function readBaseline(): Baseline {
+  if (!fs.existsSync(BASELINE_PATH)) {
+    return {};
+  }
+  return JSON.parse(fs.readFileSync(BASELINE_PATH, "utf8")) as Baseline;
+}
+
+export function writeBaseline(results: Baseline): void {
+  const sorted = Object.fromEntries(Object.entries(results).sort(([a], [b]) => a.localeCompare(b)));
+  fs.writeFileSync(BASELINE_PATH, JSON.stringify(sorted, null, 2) + "\n");
+}
+
+export function report(comparisons: Comparison[]): void {
+  console.table(
+    comparisons.map(({ id, current, baseline, ratio, regressed }) => ({
+      workload: id,
+      frames: current.frames,
+      "warm-up ms": current.warmupMs,
+      "median ms": current.medianMs,
+      "p95 ms": current.p95Ms,
+      "heap Δ KB": Math.round(current.heapDeltaBytes / 1024),
+      "baseline ms": baseline?.medianMs ?? "-",
+      ratio: ratio ?? "-",
+      status: regressed ? "REGRESSED" : "ok",
+    }))
+  );
+}
@@ -0,0 +1,225 @@
+import * as jikiscript from "@jikiscript/interpreter";
+import * as javascript from "@javascript/interpreter";
+import * as python from "@python/interpreter";
+
+export type Language = "jikiscript" | "javascript" | "python";
+
+// A single run of a workload. Returns the number of frames produced so the
+// harness can sanity-check that the workload actually did its work.
+export type Run = () => { frames: unknown[]; error: unknown };
+
+export interface Workload {
+  name: string;
+  // Parameter sweep (e.g. loop iterations, recursion depth).
+  sizes: number[];
+  // null where a language can't express the workload (e.g. Python has no list append yet).
+  build: Record<Language, ((size: number) => Run) | null>;
+}
+
+// Generous limits so the workloads measure the interpreters, not their guards.
+const languageFeatures = {
+  maxTotalLoopIterations: 10_000_000,
+  maxTotalExecutionTime: 600_000_000,
+};
+
+function runJikiScript(code: string, allowedStdlibFunctions?: string[]): Run {
+  return () => jikiscript.interpret(code, { languageFeatures: { ...languageFeatures, allowedStdlibFunctions } });
+}
+
+function runJavaScript(code: string): Run {
+  return () => javascript.interpret(code, { languageFeatures });
+}
+
+function runPython(code: string): Run {
+  return () => python.interpret(code, { languageFeatures });
+}
+
+export const workloads: Workload[] = [
+  {
+    // One assignment per iteration, so the frame count tracks `size`.
+    name: "frames",
+    sizes: [10, 1_000, 10_000, 100_000],
+    build: {
+      jikiscript: size =>
+        runJikiScript(`
+set total to 0
+repeat ${size} times do
+  change total to total + 1
+end`),
+      javascript: size =>
+        runJavaScript(`
+let total = 0;
+for (let i = 0; i < ${size}; i++) {
+  total = total + 1;
+}`),
+      python: size =>
+        runPython(`
+total = 0
+while total < ${size}:
+    total = total + 1`),
+    },
+  },
+  {
+    name: "recursion",
+    sizes: [50, 200],
+    build: {
+      jikiscript: size =>
+        runJikiScript(`
+function depth with n do
+  if n is 0 do
+    return 0
+  end
+  return 1 + depth(n - 1)
+end
+set result to depth(${size})`),
+      javascript: size =>
+        runJavaScript(`
+function depth(n) {
+  if (n === 0) {
+    return 0;
+  }
+  return 1 + depth(n - 1);
+}
+let result = depth(${size});`),
+      python: size =>
+        runPython(`
+def depth(n):
+    if n == 0:
+        return 0
+    return 1 + depth(n - 1)
+result = depth(${size})`),
+    },
+  },
+  {
+    name: "list-growth",
+    sizes: [100, 1_000],
+    build: {
+      jikiscript: size =>
+        runJikiScript(
+          `
+set items to []
+repeat ${size} times do
+  change items to push(items, 1)
+end`,
+          ["push"]
+        ),
+      javascript: size =>
+        runJavaScript(`
+let items = [];
+for (let i = 0; i < ${size}; i++) {
+  items.push(i);
+}`),
+      python: null,
+    },
+  },
+  {
+    name: "string-building",
+    sizes: [100, 1_000],
+    build: {
+      jikiscript: size =>
+        runJikiScript(
+          `
+set text to ""
+repeat ${size} times do
+  change text to concatenate(text, "ab")
+end`,
+          ["concatenate"]
+        ),
+      javascript: size =>
+        runJavaScript(`
+let text = "";
+for (let i = 0; i < ${size}; i++) {
+  text = text + "ab";
+}`),
+      python: size =>
+        runPython(`
+text = ""
+count = 0
+while count < ${size}:
+    text = text + "ab"
+    count = count + 1`),
+    },
+  },
+  {
+    name: "stdlib",
+    sizes: [1_000],
+    build: {
+      jikiscript: size =>
+        runJikiScript(
+          `
+set word to ""
+repeat ${size} times do
+  change word to to_upper_case(concatenate("ji", "ki"))
+end`,
+          ["concatenate", "to_upper_case"]
+        ),
+      javascript: size =>
+        runJavaScript(`
+let items = [1, 2, 3, 4, 5];
+let word = "";
+for (let i = 0; i < ${size}; i++) {
+  word = "jiki".toUpperCase();
+  let found = items.indexOf(4);
+}`),
+      python: size =>
+        runPython(`
+items = [1, 2, 3, 4, 5]
+count = 0
+while count < ${size}:
+    word = "jiki".upper()
+    found = items.index(4)
+    count = count + 1`),
+    },
+  },
+  {
+    // The IO-exercise path: compile a solution and call one function with arguments.
+    name: "evaluate-function",
+    sizes: [100],
+    build: {
+      jikiscript: size => () =>
+        jikiscript.evaluateFunction(
+          `
+function sum_to with n do
+  set total to 0
+  set i to 0
+  repeat n times do
+    change i to i + 1
+    change total to total + i
+  end
+  return total
+end`,
+          { languageFeatures },
+          "sum_to",
+          size
+        ),
+      javascript: size => () =>
+        javascript.evaluateFunction(
+          `
+function sumTo(n) {
+  let total = 0;
+  for (let i = 1; i <= n; i++) {
+    total = total + i;
+  }
+  return total;
+}`,
+          { languageFeatures },
+          "sumTo",
+          size
+        ),
+      python: size => () =>
+        python.evaluateFunction(
+          `
+def sum_to(n):
+    total = 0
+    i = 0
+    while i < n:
+        i = i + 1
+        total = total + i
+    return total`,
+          { languageFeatures },
+          "sum_to",
+          size
+        ),
+    },
+  },
+];
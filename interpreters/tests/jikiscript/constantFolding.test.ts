@@ -0,0 +1,62 @@
+import { test, expect, describe } from "vitest";
+import { parse } from "@jikiscript/parser";
+import { interpret } from "@jikiscript/interpreter";
+import { foldConstants } from "@jikiscript/constantFolding";
+import type { IfStatement, SetVariableStatement } from "@jikiscript/statement";
+import type { BinaryExpression } from "@jikiscript/expression";
+import type { TestAugmentedFrame } from "@shared/frames";
+
+describe("foldConstants", () => {
+  test("marks literal arithmetic and its operands", () => {
+    const [statement] = foldConstants(parse("set x to (1 + 2) * 3")) as [SetVariableStatement];
+    const value = statement.value as BinaryExpression;
+    expect(value.isConstant).toBe(true);
+    expect(value.left.isConstant).toBe(true);
+    expect(value.right.isConstant).toBe(true);
+  });
+
+  test("doesn't mark expressions that read variables, but marks their constant parts", () => {
+    const [, statement] = foldConstants(parse("set y to 1\nset x to y + (2 * 3)")) as [
+      SetVariableStatement,
+      SetVariableStatement,
+    ];
+    const value = statement.value as BinaryExpression;
+    expect(value.isConstant).toBeUndefined();
+    expect(value.left.isConstant).toBeUndefined();
+    expect(value.right.isConstant).toBe(true);
+  });
+
+  test("marks constant conditions", () => {
+    const [statement] = foldConstants(parse("if 1 < 2 and true do\n  set x to 1\nend")) as [IfStatement];
+    expect(statement.condition.isConstant).toBe(true);
+  });
+});
+
+describe("executing folded constants", () => {
+  test("reuses the result across loop iterations", () => {
+    const { frames } = interpret("set x to 0\nrepeat 3 times do\n  change x to x + (2 * 5)\nend");
+    const lastFrame = frames.at(-1) as TestAugmentedFrame;
+    expect(lastFrame.status).toBe("SUCCESS");
+    expect(lastFrame.variables.x.toString()).toBe("30");
+
+    const changes = frames.filter(frame => frame.line === 3);
+    const products = changes.map(frame => (frame.result as any).value.right);
+    expect(products).toHaveLength(3);
+    expect(products[1]).toBe(products[0]);
+    expect(products[2]).toBe(products[0]);
+  });
+
+  test("keeps the same descriptions", () => {
+    const { frames } = interpret("repeat 2 times do\n  set x to 1 + 2\nend");
+    const descriptions = frames.filter(frame => frame.line === 2).map(frame => frame.generateDescription());
+    expect(descriptions[1]).toBe(descriptions[0]);
+    expect(descriptions[0]).toContain("3");
+  });
+
+  test("still errors on every run", () => {
+    for (let i = 0; i < 2; i++) {
+      const { frames } = interpret('set x to "a" + 1');
+      expect(frames.at(-1)?.status).toBe("ERROR");
+    }
+  });
+});
@@ -314,4 +314,42 @@ def sign(n):
     );
     expect(value).toBe("negative");
   });
+
+  test("function with string arguments containing quotes and newlines", () => {
+    const { value } = evaluateFunction(
+      `
+def shout(text):
+    return text.upper()
+    `,
+      {},
+      "shout",
+      'say "hi"\nthen go'
+    );
+    expect(value).toBe('SAY "HI"\nTHEN GO');
+  });
+
+  test("function with boolean and None arguments", () => {
+    const { value } = evaluateFunction(
+      `
+def pick(flag, fallback):
+    if flag:
+        return fallback
+    return 1
+    `,
+      {},
+      "pick",
+      true,
+      null
+    );
+    expect(value).toBeNull();
+  });
+
+  test("calling an undefined function reports an error frame", () => {
+    const { value, frames, success } = evaluateFunction(`x = 1`, {}, "move");
+
+    expect(value).toBeUndefined();
+    expect(success).toBe(false);
+    expect(frames.at(-1)!.status).toBe("ERROR");
+    expect(frames.at(-1)!.error!.type).toBe("UndefinedVariable");
+  });
 });
@@ -0,0 +1,44 @@
+import { PyBoolean, PyNone, PyNumber, PyString, createPyObject } from "@python/jikiObjects";
+import { JSNumber } from "@javascript/jikiObjects";
+
+describe("interned Python objects", () => {
+  test("small integers are shared", () => {
+    expect(PyNumber.of(1)).toBe(PyNumber.of(1));
+    expect(PyNumber.of(-5)).toBe(createPyObject(-5));
+    expect(PyNumber.of(256)).toBe(PyNumber.of(256));
+  });
+
+  test("other numbers get new instances", () => {
+    expect(PyNumber.of(257)).not.toBe(PyNumber.of(257));
+    expect(PyNumber.of(1.5)).not.toBe(PyNumber.of(1.5));
+    expect(Object.is(PyNumber.of(-0).value, -0)).toBe(true);
+  });
+
+  test("empty and single-character strings are shared", () => {
+    expect(PyString.of("")).toBe(PyString.of(""));
+    expect(PyString.of("a")).toBe(createPyObject("a"));
+    expect(PyString.of("ab")).not.toBe(PyString.of("ab"));
+  });
+
+  test("booleans and None are singletons", () => {
+    expect(createPyObject(true)).toBe(PyBoolean.True);
+    expect(createPyObject(false)).toBe(PyBoolean.False);
+    expect(createPyObject(null)).toBe(PyNone.instance);
+    expect(createPyObject(undefined)).toBe(PyNone.instance);
+  });
+});
+
+describe("objectId", () => {
+  test("is stable for an object and distinct between objects", () => {
+    const a = new JSNumber(1);
+    const b = new JSNumber(1);
+    expect(a.objectId).toBe(a.objectId);
+    expect(a.objectId).not.toBe(b.objectId);
+  });
+
+  test("is not stored on the object", () => {
+    const num = new PyNumber(1000);
+    void num.objectId;
+    expect(Object.keys(num)).not.toContain("objectId");
+  });
+});
@@ -0,0 +1,65 @@
+import { Parser } from "@python/parser";
+import { Opcode, buildNodeAllowance, lowerNode, lowerProgram } from "@python/opcodes";
+import { interpret } from "@python/interpreter";
+import { FunctionDeclaration, ForInStatement, IfStatement } from "@python/statement";
+import { BinaryExpression } from "@python/expression";
+
+describe("Python opcode lowering", () => {
+  test("stamps every node, including nested bodies", () => {
+    const statements = new Parser({}).parse(
+      `
+def add(a, b):
+    return a + b
+for i in [1, 2]:
+    if i > 1:
+        x = add(i, 1)
+    `.trim()
+    );
+
+    const count = lowerProgram(statements);
+    expect(count).toBeGreaterThan(0);
+
+    const func = statements[0] as FunctionDeclaration;
+    expect(func.opcode).toBe(Opcode.FunctionDeclaration);
+    expect(func.body[0].opcode).toBe(Opcode.ReturnStatement);
+
+    const loop = statements[1] as ForInStatement;
+    expect(loop.opcode).toBe(Opcode.ForInStatement);
+    expect(loop.iterable.opcode).toBe(Opcode.ListExpression);
+
+    const ifStmt = loop.body[0] as IfStatement;
+    expect(ifStmt.opcode).toBe(Opcode.IfStatement);
+    expect((ifStmt.condition as BinaryExpression).opcode).toBe(Opcode.BinaryExpression);
+  });
+
+  test("lowerNode falls back to Unknown for unrecognised node types", () => {
+    const node = { type: "MadeUpExpression" } as any;
+    expect(lowerNode(node)).toBe(Opcode.Unknown);
+    expect(node.opcode).toBe(Opcode.Unknown);
+  });
+
+  test("buildNodeAllowance returns null when all nodes are allowed", () => {
+    expect(buildNodeAllowance(null)).toBeNull();
+    expect(buildNodeAllowance(undefined)).toBeNull();
+  });
+
+  test("buildNodeAllowance resolves allowed node types by opcode", () => {
+    const allowance = buildNodeAllowance(["LiteralExpression", "AssignmentStatement"])!;
+    expect(allowance[Opcode.LiteralExpression]).toBe(1);
+    expect(allowance[Opcode.AssignmentStatement]).toBe(1);
+    expect(allowance[Opcode.BinaryExpression]).toBe(0);
+    expect(allowance[Opcode.Unknown]).toBe(0);
+  });
+
+  test("lowered programs still produce a frame per executed step", () => {
+    const code = `
+total = 0
+for i in [1, 2, 3]:
+    total = total + i
+    `.trim();
+    const { frames, error } = interpret(code);
+    expect(error).toBeNull();
+    expect(frames.map(f => f.line)).toEqual([1, 2, 2, 3, 2, 3, 2, 3]);
+    expect(frames.every(f => f.status === "SUCCESS")).toBe(true);
+  });
+});
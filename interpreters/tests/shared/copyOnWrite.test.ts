@@ -0,0 +1,96 @@
+import { CopyOnWriteArray, CopyOnWriteMap } from "@shared/copyOnWrite";
+import { PyList, PyNumber } from "@python/jikiObjects";
+import { JSArray, JSDictionary, JSNumber } from "@javascript/jikiObjects";
+
+const num = (n: number) => new PyNumber(n);
+const values = (array: CopyOnWriteArray) => array.elements.map(e => e.value);
+
+describe("CopyOnWriteArray", () => {
+  test("snapshots of immutable elements share the backing store", () => {
+    const live = new CopyOnWriteArray([num(1), num(2)]);
+    const snapshot = live.snapshot(e => e.clone());
+    expect(snapshot.elements).toBe(live.elements);
+  });
+
+  test("appending after a snapshot leaves the snapshot untouched", () => {
+    const live = new CopyOnWriteArray([num(1), num(2)]);
+    const snapshot = live.snapshot(e => e.clone());
+
+    live.push(num(3));
+
+    expect(values(live)).toEqual([1, 2, 3]);
+    expect(values(snapshot)).toEqual([1, 2]);
+    expect(snapshot.length).toBe(2);
+  });
+
+  test("writes after a snapshot copy the store first", () => {
+    const live = new CopyOnWriteArray([num(1), num(2)]);
+    const snapshot = live.snapshot(e => e.clone());
+
+    live.set(0, num(10));
+    live.mutate(elements => elements.reverse());
+
+    expect(values(live)).toEqual([2, 10]);
+    expect(values(snapshot)).toEqual([1, 2]);
+  });
+
+  test("popping after a snapshot leaves the snapshot untouched", () => {
+    const live = new CopyOnWriteArray([num(1), num(2), num(3)]);
+    const snapshot = live.snapshot(e => e.clone());
+
+    expect(live.pop()?.value).toBe(3);
+    live.push(num(4));
+
+    expect(values(live)).toEqual([1, 2, 4]);
+    expect(values(snapshot)).toEqual([1, 2, 3]);
+  });
+
+  test("falls back to a deep clone once it holds a mutable element", () => {
+    const inner = new PyList([num(1)]);
+    const live = new CopyOnWriteArray<PyList | PyNumber>([num(0)]);
+    live.push(inner);
+
+    const snapshot = live.snapshot(e => e.clone());
+    inner.setElement(0, num(99));
+
+    expect((snapshot.get(1) as PyList).getElement(0)?.value).toBe(1);
+    expect(snapshot.elements).not.toBe(live.elements);
+  });
+});
+
+describe("CopyOnWriteMap", () => {
+  test("writes after a snapshot leave the snapshot untouched", () => {
+    const live = new CopyOnWriteMap(new Map([["a", new JSNumber(1)]]));
+    const snapshot = live.snapshot(v => v.clone());
+    expect(snapshot.entries).toBe(live.entries);
+
+    live.set("a", new JSNumber(2));
+    live.set("b", new JSNumber(3));
+
+    expect(live.get("a")?.value).toBe(2);
+    expect(snapshot.get("a")?.value).toBe(1);
+    expect(snapshot.has("b")).toBe(false);
+  });
+});
+
+describe("container clones", () => {
+  test("cloned lists are isolated from later mutation", () => {
+    const list = new JSArray([new JSNumber(1)]);
+    const clone = list.clone();
+
+    list.push(new JSNumber(2));
+    list.setElement(0, new JSNumber(5));
+
+    expect(clone.value.map(e => e.value)).toEqual([1]);
+    expect(list.value.map(e => e.value)).toEqual([5, 2]);
+  });
+
+  test("cloned dictionaries are isolated from later mutation", () => {
+    const dict = new JSDictionary(new Map([["a", new JSNumber(1)]]));
+    const clone = dict.clone();
+
+    dict.setProperty("a", new JSNumber(2));
+
+    expect(clone.getProperty("a")?.value).toBe(1);
+  });
+});
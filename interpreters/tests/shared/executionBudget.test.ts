@@ -0,0 +1,63 @@
+import { ExecutionBudget } from "@shared/executionBudget";
+import { interpret as interpretJavaScript } from "@javascript/interpreter";
+import { interpret as interpretPython } from "@python/interpreter";
+
+describe("ExecutionBudget", () => {
+  test("only reads the clock every 1024 steps", () => {
+    let time = 0;
+    const now = vi.fn(() => time);
+    const budget = new ExecutionBudget(100, now);
+    now.mockClear();
+
+    time = 500;
+    for (let step = 1; step < 1024; step++) {
+      expect(budget.exhausted()).toBe(false);
+    }
+    expect(now).not.toHaveBeenCalled();
+    expect(budget.exhausted()).toBe(true);
+    expect(now).toHaveBeenCalledTimes(1);
+  });
+
+  test("isn't exhausted before its deadline", () => {
+    let time = 0;
+    const budget = new ExecutionBudget(100, () => time);
+    time = 100;
+    for (let step = 0; step < 4096; step++) {
+      expect(budget.exhausted()).toBe(false);
+    }
+  });
+
+  test("never runs out without a limit", () => {
+    const now = vi.fn(() => Infinity);
+    const budget = new ExecutionBudget(undefined, now);
+    for (let step = 0; step < 4096; step++) {
+      expect(budget.exhausted()).toBe(false);
+    }
+    expect(now).not.toHaveBeenCalled();
+  });
+});
+
+describe("maxWallClockTimeMs", () => {
+  test("stops a JavaScript run that goes over it", () => {
+    const { frames, error } = interpretJavaScript("repeat(5000) {\n  let x = 1\n}", {
+      languageFeatures: { maxTotalLoopIterations: 10000, maxWallClockTimeMs: 0 },
+    });
+    expect(error).toBeNull();
+    expect(frames.find(f => f.status === "ERROR")?.error?.type).toBe("MaxExecutionTimeExceeded");
+  });
+
+  test("stops a Python run that goes over it", () => {
+    const { frames, error } = interpretPython("repeat:\n    x = 1", {
+      languageFeatures: { maxTotalLoopIterations: 10000, maxWallClockTimeMs: 0 },
+    });
+    expect(error).toBeNull();
+    expect(frames.find(f => f.status === "ERROR")?.error?.type).toBe("MaxExecutionTimeExceeded");
+  });
+
+  test("leaves runs within it alone", () => {
+    const { frames } = interpretJavaScript("repeat(5000) {\n  let x = 1\n}", {
+      languageFeatures: { maxTotalLoopIterations: 10000, maxWallClockTimeMs: 60_000 },
+    });
+    expect(frames.every(f => f.status === "SUCCESS")).toBe(true);
+  });
+});
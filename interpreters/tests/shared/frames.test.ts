@@ -0,0 +1,76 @@
+import { ExecutionFrame, LoopIterationFrame } from "@shared/frames";
+import { Location, Span } from "@shared/location";
+import { interpret } from "@python/interpreter";
+
+describe("ExecutionFrame", () => {
+  const source = "let x = 1;\nx = 2;";
+  const location = new Location(2, new Span(1, 7), new Span(12, 18));
+
+  test("derives code from its location and the source", () => {
+    const frame = new ExecutionFrame(location, source, "SUCCESS", 5001);
+    expect(frame.line).toBe(2);
+    expect(frame.code).toBe("x = 2;");
+  });
+
+  test("derives timeInMs from its time", () => {
+    const frame = new ExecutionFrame(location, source, "SUCCESS", 5001);
+    expect(frame.timeInMs).toBeCloseTo(5.001);
+  });
+
+  test("doesn't build code until it's read", () => {
+    const toCode = vi.fn((code: string) => code);
+    const frame = new ExecutionFrame({ line: 1, toCode }, source, "SUCCESS", 0);
+    expect(toCode).not.toHaveBeenCalled();
+    expect(frame.code).toBe(source);
+    expect(toCode).toHaveBeenCalledTimes(1);
+  });
+
+  test("describes itself with the describer it was given", () => {
+    const describer = vi.fn(() => "x was changed");
+    const frame = new ExecutionFrame(location, source, "SUCCESS", 0, describer);
+    expect(frame.generateDescription()).toBe("x was changed");
+    expect(describer).toHaveBeenCalledWith(frame);
+  });
+});
+
+describe("LoopIterationFrame", () => {
+  const source = "for i in [1, 2, 3]:\n    x = i";
+  const location = new Location(1, new Span(1, 19), new Span(0, 19));
+  const template = { type: "ForInStatement", variableName: "i" };
+
+  test("puts its result together from the template and its own fields", () => {
+    const frame = new LoopIterationFrame(location, source, 0, () => "", template, { iteration: 2 });
+    expect(frame.result).toEqual({ type: "ForInStatement", variableName: "i", iteration: 2 });
+    expect(frame.result).toBe(frame.result);
+  });
+
+  test("can have its result replaced", () => {
+    const frame = new LoopIterationFrame(location, source, 0, () => "", template, { iteration: 2 });
+    frame.result = { type: "Other" };
+    expect(frame.result).toEqual({ type: "Other" });
+  });
+
+  test("lets go of its result, template and fields when the result is deleted", () => {
+    const fields = { iteration: 2 };
+    const unread = new LoopIterationFrame(location, source, 0, () => "", template, fields);
+    delete unread.result;
+    expect(unread.result).toBeUndefined();
+    expect(Object.getOwnPropertyDescriptor(unread, "result")).toBeUndefined();
+    expect(Object.values(unread)).not.toContain(template);
+    expect(Object.values(unread)).not.toContain(fields);
+
+    const read = new LoopIterationFrame(location, source, 0, () => "", template, fields);
+    expect(read.result.iteration).toBe(2);
+    delete read.result;
+    expect(read.result).toBeUndefined();
+  });
+
+  test("is recorded for each iteration of a loop", () => {
+    const { frames } = interpret("for i in [1, 2, 3]:\n    x = i");
+    const iterations = frames.filter(frame => frame.result?.type === "ForInStatement");
+    expect(iterations.map(frame => frame.result.iteration)).toEqual([0, 1, 2, 3]);
+    expect(iterations.slice(1).every(frame => frame instanceof LoopIterationFrame)).toBe(true);
+    expect(iterations[2].result.iterable).toBe(iterations[3].result.iterable);
+    expect(iterations[2].generateDescription()).not.toBe("");
+  });
+});
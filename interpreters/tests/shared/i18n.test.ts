@@ -56,4 +56,12 @@ describe("createTranslator", () => {
     expect(t("nth", { count: 2, ordinal: true })).toBe("2th");
     expect(t("nth", { count: 3, ordinal: true })).toBe("3th");
   });
+
+  test("reuses the translator for the same dict and locale", () => {
+    const dict = tagLocale("en", messages);
+
+    expect(createTranslator(dict)).toBe(createTranslator(dict));
+    expect(createTranslator(dict, "fr")).not.toBe(createTranslator(dict));
+    expect(createTranslator(tagLocale("en", messages))).not.toBe(createTranslator(dict));
+  });
 });
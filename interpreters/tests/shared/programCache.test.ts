@@ -0,0 +1,72 @@
+import { ProgramCache, programCacheKey } from "@shared/programCache";
+import { interpret as interpretPython, clearProgramCache } from "@python/interpreter";
+
+describe("ProgramCache", () => {
+  test("parses each key once", () => {
+    const cache = new ProgramCache<string[]>(2);
+    let parses = 0;
+    const parse = () => {
+      parses++;
+      return ["parsed"];
+    };
+
+    const first = cache.getOrParse("a", parse);
+    const second = cache.getOrParse("a", parse);
+
+    expect(second).toBe(first);
+    expect(parses).toBe(1);
+  });
+
+  test("evicts the least recently used entry", () => {
+    const cache = new ProgramCache<number>(2);
+    cache.getOrParse("a", () => 1);
+    cache.getOrParse("b", () => 2);
+    cache.getOrParse("a", () => 1); // "b" is now least recently used
+    cache.getOrParse("c", () => 3);
+
+    expect(cache.size).toBe(2);
+    expect(cache.getOrParse("a", () => -1)).toBe(1);
+    expect(cache.getOrParse("b", () => -1)).toBe(-1);
+  });
+
+  test("doesn't cache parse errors", () => {
+    const cache = new ProgramCache<number>(2);
+    expect(() =>
+      cache.getOrParse("a", () => {
+        throw new Error("bad syntax");
+      })
+    ).toThrow("bad syntax");
+    expect(cache.size).toBe(0);
+  });
+
+  test("keys differ by options and locale", () => {
+    const messages = {};
+    const base = programCacheKey("x = 1", { allowedNodes: null });
+
+    expect(programCacheKey("x = 1", { allowedNodes: null })).toBe(base);
+    expect(programCacheKey("x = 1", { allowedNodes: [] })).not.toBe(base);
+    expect(programCacheKey("x = 1", { allowedNodes: null }, messages)).not.toBe(base);
+    expect(programCacheKey("x = 1", { allowedNodes: null }, messages)).toBe(
+      programCacheKey("x = 1", { allowedNodes: null }, messages)
+    );
+  });
+});
+
+describe("interpreter program cache", () => {
+  beforeEach(() => clearProgramCache());
+
+  test("re-running unchanged code reuses the parsed program", () => {
+    const first = interpretPython("x = 1\ny = x + 1");
+    const second = interpretPython("x = 1\ny = x + 1");
+
+    expect(second.meta.statements).toBe(first.meta.statements);
+    expect(second.frames.map(f => f.line)).toEqual(first.frames.map(f => f.line));
+  });
+
+  test("different language features parse separately", () => {
+    const first = interpretPython("x = 1");
+    const second = interpretPython("x = 1", { languageFeatures: { allowTruthiness: true } });
+
+    expect(second.meta.statements).not.toBe(first.meta.statements);
+  });
+});
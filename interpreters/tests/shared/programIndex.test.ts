@@ -0,0 +1,58 @@
+import { ProgramIndex, walkNodes } from "@shared/programIndex";
+import { parse } from "@javascript/parser";
+import { extractExpressions } from "@javascript/assertion-helpers";
+import { CallExpression, BinaryExpression } from "@javascript/expression";
+import { interpret } from "@javascript/interpreter";
+
+const source = `function area(w, h) {
+  return w * h;
+}
+for (let i = 0; i < 3; i++) {
+  rectangle(area(i, 2), i + 1);
+}`;
+
+describe("ProgramIndex", () => {
+  test("is built once per program", () => {
+    const statements = parse(source);
+    expect(ProgramIndex.for(statements)).toBe(ProgramIndex.for(statements));
+    expect(ProgramIndex.for(parse(source))).not.toBe(ProgramIndex.for(statements));
+  });
+
+  test("finds the same nodes, in the same order, as extractExpressions", () => {
+    const statements = parse(source);
+    const index = ProgramIndex.for(statements);
+    expect(index.nodesOf(CallExpression)).toEqual(extractExpressions(statements, CallExpression));
+    expect(index.nodesOf(BinaryExpression)).toEqual(extractExpressions(statements, BinaryExpression));
+  });
+
+  test("groups nodes by key", () => {
+    const index = ProgramIndex.for(parse(source));
+    const groups = index.groupNodesOf("byOperator", BinaryExpression, expr => expr.operator.lexeme);
+    expect([...groups.keys()].sort()).toEqual(["*", "+", "<"]);
+  });
+
+  test("memoises analyses", () => {
+    const index = ProgramIndex.for(parse(source));
+    let computed = 0;
+    const compute = () => ++computed;
+    expect(index.memo("count", compute)).toBe(1);
+    expect(index.memo("count", compute)).toBe(1);
+    expect(computed).toBe(1);
+  });
+
+  test("walks nodes before their children", () => {
+    const visited: string[] = [];
+    walkNodes(parse("a(b(c()));"), node => visited.push(node.constructor.name));
+    expect(visited.filter(name => name === "CallExpression")).toHaveLength(3);
+    expect(visited[0]).toBe("ExpressionStatement");
+  });
+
+  test("shares analyses between runs of the same program", () => {
+    const first = interpret(source);
+    const second = interpret(source);
+    expect(first.meta.statements).toBe(second.meta.statements);
+    expect(first.assertors.numFunctionCallsInCode("rectangle")).toBe(1);
+    expect(second.assertors.numFunctionCallsInCode("area")).toBe(1);
+    expect(second.assertors.assertOperatorUsed("*")).toBe(true);
+  });
+});
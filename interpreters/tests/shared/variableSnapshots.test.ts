@@ -0,0 +1,33 @@
+import { VariableSnapshotLog } from "@shared/variableSnapshots";
+import { PyList, PyNumber } from "@python/jikiObjects";
+
+const num = (n: number) => new PyNumber(n);
+
+describe("VariableSnapshotLog", () => {
+  test("rebuilds each frame's variables from the recorded deltas", () => {
+    const log = new VariableSnapshotLog();
+    const x = num(1);
+
+    const first = log.record({ x });
+    const second = log.record({ x, y: num(2) });
+    const third = log.record({ y: num(3) });
+
+    expect(log.variablesAt(first)).toEqual({ x });
+    expect(log.variablesAt(third)).toEqual({ y: num(3) });
+    // Reading backwards replays from the start.
+    expect(Object.keys(log.variablesAt(second))).toEqual(["x", "y"]);
+    expect(log.variablesAt(second).y.value).toBe(2);
+  });
+
+  test("snapshots containers mutated in place between frames", () => {
+    const log = new VariableSnapshotLog();
+    const list = new PyList([num(1)]);
+
+    const before = log.record({ list });
+    list.setElement(0, num(5));
+    const after = log.record({ list });
+
+    expect((log.variablesAt(before).list as PyList).getElement(0)?.value).toBe(1);
+    expect((log.variablesAt(after).list as PyList).getElement(0)?.value).toBe(5);
+  });
+});
@@ -0,0 +1,129 @@
+/**
+ * Caching for exercise content fetched from the assets host.
+ *
+ * Content URLs embed a content hash (`prose-${proseHash}.json`,
+ * `code-${codeHash}.json`), so the JSON behind a URL never changes and can be
+ * cached indefinitely. Students tend to send follow-ups in bursts, and without
+ * this every message re-fetched both files before the prompt could be built.
+ *
+ * Two levels:
+ * - An in-isolate LRU of parsed JSON, keyed by URL. It holds promises, so
+ *   concurrent requests for the same URL share one fetch.
+ * - The Workers Cache API (`caches.default`), which survives isolate restarts
+ *   and is shared by isolates in the same data centre. Failures here are logged
+ *   and otherwise ignored: the cache is an optimisation, never a dependency.
+ */
+
+// Each exercise has one prose and one code file per locale/language, so this
+// comfortably covers the exercises in active use on one isolate.
+const MAX_ENTRIES = 200;
+
+// Cache-Control for entries we store in the Workers cache. Safe because the
+// URL changes whenever the content does.
+const IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable";
+
+/** A Map-backed LRU: Maps iterate in insertion order, so the first key is the oldest. */
+export class LruCache<V> {
+  private readonly entries = new Map<string, V>();
+
+  constructor(private readonly capacity: number) {}
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get(key: string): V | undefined {
+    const value = this.entries.get(key);
+    if (value !== undefined) {
+      // Re-insert to mark as most recently used
+      this.entries.delete(key);
+      this.entries.set(key, value);
+    }
+    return value;
+  }
+
+  set(key: string, value: V): void {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    if (this.entries.size > this.capacity) {
+      this.entries.delete(this.entries.keys().next().value!);
+    }
+  }
+
+  delete(key: string): void {
+    this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
+
+const contentCache = new LruCache<Promise<unknown>>(MAX_ENTRIES);
+
+/**
+ * Fetches and parses the JSON at `url`, from cache where possible.
+ * @throws Error if the content can't be fetched
+ */
+export function fetchContentJson(url: string): Promise<unknown> {
+  const cached = contentCache.get(url);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const pending = loadContentJson(url);
+  contentCache.set(url, pending);
+  // Don't keep failures around: the next message should retry.
+  pending.catch(() => contentCache.delete(url));
+  return pending;
+}
+
+/** Empties the in-isolate cache (the Workers cache is left alone). Used by tests. */
+export function clearContentCache(): void {
+  contentCache.clear();
+}
+
+async function loadContentJson(url: string): Promise<unknown> {
+  const edgeCache = getEdgeCache();
+
+  if (edgeCache) {
+    try {
+      const hit = await edgeCache.match(url);
+      if (hit) {
+        return await hit.json();
+      }
+    } catch (error) {
+      console.error(`[Content Cache] Cache read failed for ${url}:`, error);
+    }
+  }
+
+  const res = await fetch(url);
+  if (!res.ok) {
+    throw new Error(`Failed to fetch exercise content from ${url}: ${res.status}`);
+  }
+  const json: unknown = await res.json();
+
+  if (edgeCache) {
+    try {
+      await edgeCache.put(
+        url,
+        new Response(JSON.stringify(json), {
+          headers: { "Content-Type": "application/json", "Cache-Control": IMMUTABLE_CACHE_CONTROL }
+        })
+      );
+    } catch (error) {
+      console.error(`[Content Cache] Cache write failed for ${url}:`, error);
+    }
+  }
+
+  return json;
+}
+
+// The Workers runtime provides `caches.default`; Node (tests, scripts) has no
+// Cache API at all, in which case only the in-isolate cache is used.
+function getEdgeCache(): Cache | undefined {
+  if (typeof caches === "undefined") {
+    return undefined;
+  }
+  return (caches as CacheStorage & { default?: Cache }).default;
+}
@@ -4,7 +4,7 @@ import { verifyJWT } from "./auth";
 import { streamGeminiResponse } from "./gemini";
 import { buildPrompt } from "./prompt-builder";
 import { createSignaturePayload, generateSignature } from "./crypto";
-import { checkUsage, recordUsage, buildUsageMeta } from "./usage";
+import { buildUsageMeta } from "./usage";
 import type { Bindings, ChatRequest } from "./types";
 
 const app = new Hono<{ Bindings: Bindings }>();
@@ -95,24 +95,6 @@ app.post("/chat", async (c) => {
       );
     }
 
-    // 1c. Per-user message caps: 100/day, 500/month (UTC), keyed on JWT sub.
-    // Checked before any work so capped users never reach Gemini (no cost).
-    const now = new Date();
-    const usage = await checkUsage(c.env.USAGE_KV, userId, now);
-    if (!usage.allowed) {
-      console.log(
-        `[Chat] ⛔ ${usage.scope} cap reached for user ${userId} (day=${usage.counts.day}, month=${usage.counts.month})`
-      );
-      return c.json(
-        {
-          error: "usage_limit_reached",
-          scope: usage.scope,
-          ...buildUsageMeta(usage.counts)
-        },
-        429
-      );
-    }
-
     // 2. Parse request
     const body = await c.req.json<ChatRequest>();
     const {
@@ -154,6 +136,28 @@ app.post("/chat", async (c) => {
       return c.json({ error: "Invalid locale or content hash" }, 400);
     }
 
+    // 2d. Per-user message caps: 100/day, 500/month (UTC), keyed on JWT sub.
+    // Checked and counted in one atomic call to the user's UsageCounter, before
+    // any work, so capped users never reach Gemini (no cost). If Gemini doesn't
+    // accept the request below, the message is released again.
+    const now = new Date();
+    const usageCounter = c.env.USAGE_COUNTER.get(c.env.USAGE_COUNTER.idFromName(userId));
+    const usage = await usageCounter.reserve(userId, now.toISOString());
+    if (!usage.allowed) {
+      console.log(
+        `[Chat] ⛔ ${usage.scope} cap reached for user ${userId} (day=${usage.counts.day}, month=${usage.counts.month})`
+      );
+      return c.json(
+        {
+          error: "usage_limit_reached",
+          scope: usage.scope,
+          ...buildUsageMeta(usage.counts)
+        },
+        429
+      );
+    }
+    const usageCounts = usage.counts;
+
     // 3. Fetch exercise content from the assets cache tree and build prompt.
     //
     // In production we ALWAYS fetch from the persistent R2 asset host
@@ -169,29 +173,31 @@ app.post("/chat", async (c) => {
     const proseUrl = `${origin}/static/exercises/${exerciseSlug}/${locale}/prose-${proseHash}.json`;
     const codeUrl = `${origin}/static/exercises/${exerciseSlug}/code/${language}/code-${codeHash}.json`;
 
-    const { systemInstruction, prompt } = await buildPrompt({
-      exerciseSlug,
-      code,
-      question,
-      history,
-      nextTaskId,
-      language,
-      proseUrl,
-      codeUrl
-    });
-
-    // 4. Stream from Gemini and collect the full response. The stream is opened
-    // FIRST so that a failure to reach Gemini (e.g. all models rate limited, or
-    // an API error) does NOT consume the user's quota - we only count requests
-    // Gemini actually accepted.
+    // 4. Stream from Gemini and collect the full response. A failure to build
+    // the prompt or reach Gemini (e.g. all models rate limited, or an API error)
+    // releases the reserved message, so it does NOT consume the user's quota - we
+    // only count requests Gemini actually accepted.
     let fullResponse = "";
-    const geminiStream = await streamGeminiResponse(prompt, c.env.GOOGLE_GEMINI_API_KEY, systemInstruction, (chunk) => {
-      fullResponse += chunk;
-    });
+    let geminiStream: ReadableStream;
+    try {
+      const { systemInstruction, prompt } = await buildPrompt({
+        exerciseSlug,
+        code,
+        question,
+        history,
+        nextTaskId,
+        language,
+        proseUrl,
+        codeUrl
+      });
 
-    // Now that Gemini has accepted the request and is streaming, record usage.
-    // recordUsage returns the new totals (including this message) for the client.
-    const usageCounts = await recordUsage(c.env.USAGE_KV, userId, now);
+      geminiStream = await streamGeminiResponse(prompt, c.env.GOOGLE_GEMINI_API_KEY, systemInstruction, (chunk) => {
+        fullResponse += chunk;
+      });
+    } catch (error) {
+      await usageCounter.release(now.toISOString());
+      throw error;
+    }
 
     // 5. Create a new stream that includes the signature at the end
     const timestamp = now.toISOString();
@@ -263,4 +269,7 @@ app.post("/chat", async (c) => {
   }
 });
 
+// Durable Object classes must be exported from the Worker's main module.
+export { UsageCounter } from "./usage-counter";
+
 export default app;
@@ -1,6 +1,7 @@
 import { getExercise, getLanguageFeatures, getLLMMetadata, getTaughtConcepts } from "@jiki/curriculum";
 import type { ExerciseCore, LLMMetadata, Language } from "@jiki/curriculum";
 import type { ChatMessage } from "./types";
+import { LruCache, clearContentCache, fetchContentJson } from "./content-cache";
 
 interface ExerciseContent {
   instructions: string;
@@ -85,7 +86,7 @@ function validateInput(question: string, history: ChatMessage[]): void {
  * Fetches exercise content (instructions, stub, solution) from the app's static files.
  */
 async function fetchExerciseContent(proseUrl: string, codeUrl: string): Promise<ExerciseContent> {
-  const [prose, code] = await Promise.all([fetchJson(proseUrl), fetchJson(codeUrl)]);
+  const [prose, code] = await Promise.all([fetchContentJson(proseUrl), fetchContentJson(codeUrl)]);
 
   return {
     instructions: (prose as { instructions: string }).instructions,
@@ -94,12 +95,61 @@ async function fetchExerciseContent(proseUrl: string, codeUrl: string): Promise<
   };
 }
 
-async function fetchJson(url: string): Promise<unknown> {
-  const res = await fetch(url);
-  if (!res.ok) {
-    throw new Error(`Failed to fetch exercise content from ${url}: ${res.status}`);
+// The per-exercise prompt sections, memoised: they depend only on the exercise,
+// task, language and content URLs, never on the student's message. Holds
+// promises so a burst of messages shares one build.
+const staticSectionsCache = new LruCache<Promise<Array<string | null>>>(200);
+
+/** Empties the prompt and exercise-content caches. Used by tests. */
+export function clearPromptCache(): void {
+  staticSectionsCache.clear();
+  clearContentCache();
+}
+
+function getStaticSections(
+  exerciseSlug: string,
+  nextTaskId: string | undefined,
+  language: Language,
+  proseUrl: string,
+  codeUrl: string
+): Promise<Array<string | null>> {
+  const key = [exerciseSlug, nextTaskId ?? "", language, proseUrl, codeUrl].join("\u0000");
+  const cached = staticSectionsCache.get(key);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  const pending = buildStaticSections(exerciseSlug, nextTaskId, language, proseUrl, codeUrl);
+  staticSectionsCache.set(key, pending);
+  pending.catch(() => staticSectionsCache.delete(key));
+  return pending;
+}
+
+async function buildStaticSections(
+  exerciseSlug: string,
+  nextTaskId: string | undefined,
+  language: Language,
+  proseUrl: string,
+  codeUrl: string
+): Promise<Array<string | null>> {
+  // Load exercise core (scenarios, tasks, level) and content (stub, solution) in parallel
+  const [exercise, content] = await Promise.all([getExercise(exerciseSlug), fetchExerciseContent(proseUrl, codeUrl)]);
+
+  if (exercise === null) {
+    throw new Error(`Exercise not found: ${exerciseSlug}`);
   }
-  return res.json();
+
+  // Get LLM metadata for context-aware help
+  const llmMetadata = getLLMMetadata(exerciseSlug);
+
+  return [
+    buildExerciseSection(llmMetadata, nextTaskId),
+    buildTaughtConceptsSection(exercise),
+    buildAvailableFeaturesSection(exercise.levelId, language),
+    buildInstructionsContentSection(content.instructions),
+    buildInitialCodeSection(content.stub, language),
+    buildTargetCodeSection(content.solution, language)
+  ];
 }
 
 /**
@@ -120,15 +170,7 @@ export async function buildPrompt(options: PromptOptions): Promise<{ systemInstr
   // Crop overly long code rather than rejecting the whole request.
   const { code: croppedCode, wasCropped: codeWasCropped } = cropCode(code);
 
-  // Load exercise core (scenarios, tasks, level) and content (stub, solution) in parallel
-  const [exercise, content] = await Promise.all([getExercise(exerciseSlug), fetchExerciseContent(proseUrl, codeUrl)]);
-
-  if (exercise === null) {
-    throw new Error(`Exercise not found: ${exerciseSlug}`);
-  }
-
-  // Get LLM metadata for context-aware help
-  const llmMetadata = getLLMMetadata(exerciseSlug);
+  const staticSections = await getStaticSections(exerciseSlug, nextTaskId, language, proseUrl, codeUrl);
 
   // The system instruction carries the stable persona and tutor rules. Keeping
   // them out of the user turn improves instruction adherence and separates the
@@ -142,12 +184,7 @@ export async function buildPrompt(options: PromptOptions): Promise<{ systemInstr
   // across messages. Dynamic content (history, question, current code) follows.
   const sections = [
     // --- Cacheable prefix: identical for every message on the same exercise ---
-    buildExerciseSection(llmMetadata, nextTaskId),
-    buildTaughtConceptsSection(exercise),
-    buildAvailableFeaturesSection(exercise.levelId, language),
-    buildInstructionsContentSection(content.instructions),
-    buildInitialCodeSection(content.stub, language),
-    buildTargetCodeSection(content.solution, language),
+    ...staticSections,
     // --- Dynamic suffix: changes per message ---
     buildConversationHistorySection(history),
     buildStudentQuestionSection(question),
@@ -1,4 +1,5 @@
 import type { Language } from "@jiki/curriculum";
+import type { UsageCounter } from "./usage-counter";
 
 export interface ChatRequest {
   exerciseSlug: string;
@@ -30,5 +31,6 @@ export interface Bindings {
   DEVISE_JWT_SECRET_KEY: string;
   LLM_SIGNATURE_SECRET: string;
   RATE_LIMITER: RateLimit; // Workers rate-limit binding (see wrangler.toml [[ratelimits]])
-  USAGE_KV: KVNamespace; // Per-user daily/monthly message counters (see usage.ts)
+  USAGE_COUNTER: DurableObjectNamespace<UsageCounter>; // Per-user daily/monthly message counters (see usage.ts)
+  USAGE_KV: KVNamespace; // Legacy KV counters, only read to seed USAGE_COUNTER (see usage-counter.ts)
 }
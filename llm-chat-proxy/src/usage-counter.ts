@@ -0,0 +1,92 @@
+import { DurableObject } from "cloudflare:workers";
+import type { Bindings } from "./types";
+import { UsageLedger, usagePeriods } from "./usage";
+import type { UsageBucket, UsageCheck } from "./usage";
+
+/**
+ * Durable Object holding one user's UsageLedger (see usage.ts). Get the stub
+ * with `USAGE_COUNTER.idFromName(userId)`.
+ *
+ * The ledger lives in memory and is loaded from storage once per activation.
+ * Writes aren't awaited: the runtime coalesces them and holds back this object's
+ * responses until they're durable, so a count is never reported that could
+ * later be lost.
+ */
+export class UsageCounter extends DurableObject<Bindings> {
+  private ledger = new UsageLedger();
+  private legacyImported = false;
+  private legacyImport: Promise<void> | null = null;
+
+  constructor(ctx: DurableObjectState, env: Bindings) {
+    super(ctx, env);
+    void ctx.blockConcurrencyWhile(async () => {
+      const stored = await ctx.storage.get<UsageBucket | boolean>(["day", "month", "legacyImported"]);
+      this.ledger = new UsageLedger(
+        stored.get("day") as UsageBucket | undefined,
+        stored.get("month") as UsageBucket | undefined
+      );
+      this.legacyImported = stored.get("legacyImported") === true;
+    });
+  }
+
+  /** Atomically checks the caps and, if the message is allowed, counts it. */
+  async reserve(userId: string, now: string): Promise<UsageCheck> {
+    await this.importLegacyCounts(userId, new Date(now));
+
+    const check = this.ledger.reserve(new Date(now));
+    if (check.allowed) {
+      this.persist();
+    }
+    return check;
+  }
+
+  /** Gives back a message reserved at `reservedAt` that never reached Gemini. */
+  release(reservedAt: string): void {
+    this.ledger.release(new Date(reservedAt));
+    this.persist();
+  }
+
+  private persist() {
+    const { day, month } = this.ledger;
+    if (day !== undefined && month !== undefined) {
+      void this.ctx.storage.put<UsageBucket>({ day, month });
+    }
+  }
+
+  // Counts used to live in KV. The first time a user's counter is used, it picks
+  // up their KV counts for the current day and month so the switch-over doesn't
+  // hand everyone a fresh allowance. Remove this (and the USAGE_KV binding) once
+  // those keys have expired, 40 days after the switch.
+  private importLegacyCounts(userId: string, now: Date): Promise<void> {
+    if (this.legacyImported) {
+      return Promise.resolve();
+    }
+    this.legacyImport ??= (async () => {
+      const periods = usagePeriods(now);
+      const [dayRaw, monthRaw] = await Promise.all([
+        this.env.USAGE_KV.get(`usage:${userId}:day:${periods.day}`),
+        this.env.USAGE_KV.get(`usage:${userId}:month:${periods.month}`)
+      ]);
+      const counts = this.ledger.counts(now);
+      this.ledger.day = { period: periods.day, count: counts.day + parseCount(dayRaw) };
+      this.ledger.month = { period: periods.month, count: counts.month + parseCount(monthRaw) };
+      this.legacyImported = true;
+      this.persist();
+      void this.ctx.storage.put("legacyImported", true);
+    })().catch((error: unknown) => {
+      // Counts are added to, not replaced, so it's safe to carry on and retry
+      // on the next message.
+      console.error("[Usage] Legacy KV import failed:", error);
+      this.legacyImport = null;
+    });
+    return this.legacyImport;
+  }
+}
+
+function parseCount(raw: string | null): number {
+  if (raw === null) {
+    return 0;
+  }
+  const n = parseInt(raw, 10);
+  return Number.isFinite(n) ? n : 0;
+}
@@ -1,38 +1,25 @@
 /**
- * Per-user message usage tracking, backed by Cloudflare KV.
+ * Per-user message usage tracking.
  *
- * Counters are keyed by JWT sub and bucketed by UTC day and UTC month, capping a
- * user at DAILY_LIMIT messages per day and MONTHLY_LIMIT per month. KV is
- * eventually consistent, so under heavy concurrency from a single user a count
- * can slightly lag (a user might squeak one or two past the cap). That is an
- * acceptable trade for a cost guard.
+ * Each user gets a UsageCounter Durable Object (see usage-counter.ts), keyed by
+ * JWT sub, holding a UsageLedger: their count for the current UTC day and UTC
+ * month, capping them at DAILY_LIMIT messages per day and MONTHLY_LIMIT per
+ * month. A Durable Object handles one request at a time, so checking and
+ * incrementing happen atomically in a single round trip: concurrent messages
+ * from one user can no longer both read the same count and squeak past the cap,
+ * as they could when the counters lived in eventually-consistent KV.
+ *
+ * A message's usage is reserved before the prompt is built and released again
+ * if Gemini never accepts it, so only requests that reach Gemini count.
  */
 
 export const DAILY_LIMIT = 100;
 export const MONTHLY_LIMIT = 500;
 
-// KV resets a key's TTL on every put, so each TTL is measured from the LAST
-// write and must outlive the rest of its bucket: a day key may still be read
-// ~24h after its final write, a month key up to ~31 days. Generous margins.
-const DAY_TTL_SECONDS = 2 * 24 * 60 * 60; // 48h
-const MONTH_TTL_SECONDS = 40 * 24 * 60 * 60; // 40 days
-
-function bucketKeys(userId: string, now: Date): { dayKey: string; monthKey: string } {
-  const year = now.getUTCFullYear();
-  const month = String(now.getUTCMonth() + 1).padStart(2, "0");
-  const day = String(now.getUTCDate()).padStart(2, "0");
-  return {
-    dayKey: `usage:${userId}:day:${year}-${month}-${day}`,
-    monthKey: `usage:${userId}:month:${year}-${month}`
-  };
-}
-
-function parseCount(raw: string | null): number {
-  if (raw === null) {
-    return 0;
-  }
-  const n = parseInt(raw, 10);
-  return Number.isFinite(n) ? n : 0;
+/** A count for one UTC day (`YYYY-MM-DD`) or month (`YYYY-MM`). */
+export interface UsageBucket {
+  period: string;
+  count: number;
 }
 
 export interface UsageCounts {
@@ -66,37 +53,63 @@ export interface UsageCheck {
   counts: UsageCounts;
 }
 
+export function usagePeriods(now: Date): { day: string; month: string } {
+  const year = now.getUTCFullYear();
+  const month = String(now.getUTCMonth() + 1).padStart(2, "0");
+  const day = String(now.getUTCDate()).padStart(2, "0");
+  return { day: `${year}-${month}-${day}`, month: `${year}-${month}` };
+}
+
+function countIn(bucket: UsageBucket | undefined, period: string): number {
+  return bucket?.period === period ? bucket.count : 0;
+}
+
 /**
- * Reads the user's current day/month counts and decides whether another message
- * is allowed. Does NOT mutate anything - call recordUsage() once the request is
- * committed to reaching Gemini. Monthly limit takes precedence over daily.
+ * One user's day and month counts. Buckets from an earlier period simply read as
+ * zero and are replaced on the next reservation, so nothing needs expiring.
  */
-export async function checkUsage(kv: KVNamespace, userId: string, now: Date): Promise<UsageCheck> {
-  const { dayKey, monthKey } = bucketKeys(userId, now);
-  const [dayRaw, monthRaw] = await Promise.all([kv.get(dayKey), kv.get(monthKey)]);
-  const counts: UsageCounts = { day: parseCount(dayRaw), month: parseCount(monthRaw) };
+export class UsageLedger {
+  constructor(
+    public day?: UsageBucket,
+    public month?: UsageBucket
+  ) {}
 
-  if (counts.month >= MONTHLY_LIMIT) {
-    return { allowed: false, scope: "monthly", counts };
+  counts(now: Date): UsageCounts {
+    const periods = usagePeriods(now);
+    return { day: countIn(this.day, periods.day), month: countIn(this.month, periods.month) };
   }
-  if (counts.day >= DAILY_LIMIT) {
-    return { allowed: false, scope: "daily", counts };
+
+  /**
+   * Decides whether another message is allowed and, if so, counts it. The
+   * returned counts include this message when it's allowed. Monthly limit takes
+   * precedence over daily.
+   */
+  reserve(now: Date): UsageCheck {
+    const counts = this.counts(now);
+    if (counts.month >= MONTHLY_LIMIT) {
+      return { allowed: false, scope: "monthly", counts };
+    }
+    if (counts.day >= DAILY_LIMIT) {
+      return { allowed: false, scope: "daily", counts };
+    }
+
+    const periods = usagePeriods(now);
+    this.day = { period: periods.day, count: counts.day + 1 };
+    this.month = { period: periods.month, count: counts.month + 1 };
+    return { allowed: true, counts: this.counts(now) };
   }
-  return { allowed: true, counts };
-}
 
-/**
- * Increments both counters and returns the new totals (including this message),
- * suitable for reporting back to the client.
- */
-export async function recordUsage(kv: KVNamespace, userId: string, now: Date): Promise<UsageCounts> {
-  const { dayKey, monthKey } = bucketKeys(userId, now);
-  const [dayRaw, monthRaw] = await Promise.all([kv.get(dayKey), kv.get(monthKey)]);
-  const day = parseCount(dayRaw) + 1;
-  const month = parseCount(monthRaw) + 1;
-  await Promise.all([
-    kv.put(dayKey, String(day), { expirationTtl: DAY_TTL_SECONDS }),
-    kv.put(monthKey, String(month), { expirationTtl: MONTH_TTL_SECONDS })
-  ]);
-  return { day, month };
+  /**
+   * Gives back a message reserved at `reservedAt` that never reached Gemini.
+   * A bucket that has since rolled over is left alone.
+   */
+  release(reservedAt: Date): void {
+    const periods = usagePeriods(reservedAt);
+    if (this.day?.period === periods.day && this.day.count > 0) {
+      this.day = { ...this.day, count: this.day.count - 1 };
+    }
+    if (this.month?.period === periods.month && this.month.count > 0) {
+      this.month = { ...this.month, count: this.month.count - 1 };
+    }
+  }
 }
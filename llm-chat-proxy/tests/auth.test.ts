@@ -1,6 +1,11 @@
 import { describe, it, expect, vi } from "vitest";
 import { verifyJWT } from "../src/auth";
 import { SignJWT } from "jose";
+import { UsageLedger } from "../src/usage";
+
+// The Workers runtime module doesn't exist under Node; UsageCounter only needs
+// its DurableObject base class to be importable.
+vi.mock("cloudflare:workers", () => ({ DurableObject: class {} }));
 
 vi.mock("../src/gemini", () => ({
   streamGeminiResponse: vi.fn(
@@ -169,16 +174,22 @@ describe("Chat Endpoint Authentication", () => {
       .sign(secret);
   }
 
-  const usageStore = new Map<string, string>();
+  // In-memory stand-in for the UsageCounter Durable Object namespace.
+  const ledgers = new Map<string, UsageLedger>();
   const mockEnv = {
     DEVISE_JWT_SECRET_KEY: testSecret,
     GOOGLE_GEMINI_API_KEY: "test-gemini-key",
     LLM_SIGNATURE_SECRET: "test-signature-secret",
     RATE_LIMITER: { limit: async () => ({ success: true }) },
-    USAGE_KV: {
-      get: async (key: string) => usageStore.get(key) ?? null,
-      put: async (key: string, value: string) => {
-        usageStore.set(key, value);
+    USAGE_COUNTER: {
+      idFromName: (name: string) => name,
+      get: (id: string) => {
+        const ledger = ledgers.get(id) ?? new UsageLedger();
+        ledgers.set(id, ledger);
+        return {
+          reserve: async (_userId: string, now: string) => ledger.reserve(new Date(now)),
+          release: async (reservedAt: string) => ledger.release(new Date(reservedAt))
+        };
       }
     }
   };
@@ -0,0 +1,58 @@
+import { describe, it, expect, vi, beforeEach } from "vitest";
+import { LruCache, clearContentCache, fetchContentJson } from "../src/content-cache";
+
+const URL_A = "https://assets.jiki.io/static/exercises/maze/en/prose-aaa111.json";
+
+function stubFetch(responses: Array<{ ok: boolean; status?: number; body?: unknown }>) {
+  const fetchMock = vi.fn();
+  for (const { ok, status = 200, body = {} } of responses) {
+    fetchMock.mockResolvedValueOnce({ ok, status, json: () => Promise.resolve(body) });
+  }
+  vi.stubGlobal("fetch", fetchMock);
+  return fetchMock;
+}
+
+beforeEach(() => {
+  clearContentCache();
+});
+
+describe("LruCache", () => {
+  it("evicts the least recently used entry", () => {
+    const cache = new LruCache<number>(2);
+    cache.set("a", 1);
+    cache.set("b", 2);
+    cache.get("a");
+    cache.set("c", 3);
+
+    expect(cache.get("a")).toBe(1);
+    expect(cache.get("b")).toBeUndefined();
+    expect(cache.get("c")).toBe(3);
+    expect(cache.size).toBe(2);
+  });
+});
+
+describe("fetchContentJson", () => {
+  it("fetches each URL once", async () => {
+    const fetchMock = stubFetch([{ ok: true, body: { instructions: "hi" } }]);
+
+    expect(await fetchContentJson(URL_A)).toEqual({ instructions: "hi" });
+    expect(await fetchContentJson(URL_A)).toEqual({ instructions: "hi" });
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it("shares one fetch between concurrent requests", async () => {
+    const fetchMock = stubFetch([{ ok: true, body: { instructions: "hi" } }]);
+
+    await Promise.all([fetchContentJson(URL_A), fetchContentJson(URL_A)]);
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+  });
+
+  it("does not cache failed fetches", async () => {
+    const fetchMock = stubFetch([{ ok: false, status: 503 }, { ok: true, body: { instructions: "hi" } }]);
+
+    await expect(fetchContentJson(URL_A)).rejects.toThrow("503");
+    expect(await fetchContentJson(URL_A)).toEqual({ instructions: "hi" });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+});
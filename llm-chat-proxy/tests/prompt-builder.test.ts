@@ -1,5 +1,5 @@
 import { describe, it, expect, vi, beforeEach } from "vitest";
-import { buildPrompt, INPUT_LIMITS } from "../src/prompt-builder";
+import { buildPrompt, clearPromptCache, INPUT_LIMITS } from "../src/prompt-builder";
 
 // Mock exercise content. Prose and code are separate artifacts served at
 // separate URLs, so the mocks are separate too: the prose file carries the
@@ -30,6 +30,7 @@ function stubContentFetch(instructions: string = mockProse.instructions) {
 }
 
 beforeEach(() => {
+  clearPromptCache();
   stubContentFetch();
 });
 
@@ -298,6 +299,15 @@ describe("Prompt Builder", () => {
     expect(fetch).toHaveBeenCalledWith(PROSE_URL);
     expect(fetch).toHaveBeenCalledWith(CODE_URL);
   });
+
+  it("should fetch exercise content only once across messages", async () => {
+    await buildPrompt(defaultOpts({ question: "first" }));
+    const prompt = await buildText(defaultOpts({ question: "second" }));
+
+    expect(fetch).toHaveBeenCalledTimes(2);
+    expect(prompt).toContain("Solve the maze by moving Jiki to the exit.");
+    expect(prompt).toContain("second");
+  });
 });
 
 describe("Input Validation", () => {
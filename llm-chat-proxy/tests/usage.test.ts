@@ -1,84 +1,85 @@
-import { describe, it, expect, vi } from "vitest";
-import { checkUsage, recordUsage, DAILY_LIMIT, MONTHLY_LIMIT } from "../src/usage";
+import { describe, it, expect } from "vitest";
+import { UsageLedger, usagePeriods, DAILY_LIMIT, MONTHLY_LIMIT } from "../src/usage";
 
-// Minimal in-memory KV mock supporting the get/put surface usage.ts relies on.
-function makeKV(initial: Record<string, string> = {}) {
-  const store = new Map<string, string>(Object.entries(initial));
-  const kv = {
-    get: vi.fn(async (key: string) => store.get(key) ?? null),
-    put: vi.fn(async (key: string, value: string) => {
-      store.set(key, value);
-    }),
-    store
-  };
-  return kv as unknown as KVNamespace & { store: Map<string, string>; put: ReturnType<typeof vi.fn> };
+const NOW = new Date("2026-06-19T12:00:00Z");
+const DAY = "2026-06-19";
+const MONTH = "2026-06";
+
+function makeLedger(day: number, month: number) {
+  return new UsageLedger({ period: DAY, count: day }, { period: MONTH, count: month });
 }
 
-const NOW = new Date("2026-06-19T12:00:00Z");
-const DAY_KEY = "usage:user-1:day:2026-06-19";
-const MONTH_KEY = "usage:user-1:month:2026-06";
+describe("usagePeriods", () => {
+  it("buckets by UTC day and month", () => {
+    expect(usagePeriods(NOW)).toEqual({ day: DAY, month: MONTH });
+    expect(usagePeriods(new Date("2026-06-30T23:30:00-02:00"))).toEqual({ day: "2026-07-01", month: "2026-07" });
+  });
+});
 
-describe("checkUsage", () => {
-  it("allows a fresh user with zero counts", async () => {
-    const kv = makeKV();
-    const result = await checkUsage(kv, "user-1", NOW);
-    expect(result).toEqual({ allowed: true, counts: { day: 0, month: 0 } });
+describe("UsageLedger.reserve", () => {
+  it("allows a fresh user and returns the new totals", () => {
+    const result = new UsageLedger().reserve(NOW);
+    expect(result).toEqual({ allowed: true, counts: { day: 1, month: 1 } });
   });
 
-  it("buckets keys by UTC day and month", async () => {
-    const kv = makeKV();
-    await checkUsage(kv, "user-1", NOW);
-    expect(kv.get).toHaveBeenCalledWith(DAY_KEY);
-    expect(kv.get).toHaveBeenCalledWith(MONTH_KEY);
+  it("increments from existing counts", () => {
+    const result = makeLedger(7, 42).reserve(NOW);
+    expect(result.counts).toEqual({ day: 8, month: 43 });
   });
 
-  it("blocks when the daily limit is reached", async () => {
-    const kv = makeKV({ [DAY_KEY]: String(DAILY_LIMIT), [MONTH_KEY]: String(DAILY_LIMIT) });
-    const result = await checkUsage(kv, "user-1", NOW);
+  it("blocks when the daily limit is reached", () => {
+    const ledger = makeLedger(DAILY_LIMIT, DAILY_LIMIT);
+    const result = ledger.reserve(NOW);
     expect(result.allowed).toBe(false);
     expect(result.scope).toBe("daily");
+    expect(ledger.counts(NOW)).toEqual({ day: DAILY_LIMIT, month: DAILY_LIMIT });
   });
 
-  it("blocks when the monthly limit is reached, even if the day is fresh", async () => {
-    const kv = makeKV({ [DAY_KEY]: "0", [MONTH_KEY]: String(MONTHLY_LIMIT) });
-    const result = await checkUsage(kv, "user-1", NOW);
+  it("blocks when the monthly limit is reached, even if the day is fresh", () => {
+    const result = makeLedger(0, MONTHLY_LIMIT).reserve(NOW);
     expect(result.allowed).toBe(false);
     expect(result.scope).toBe("monthly");
   });
 
-  it("prioritises the monthly cap over the daily cap", async () => {
-    const kv = makeKV({ [DAY_KEY]: String(DAILY_LIMIT), [MONTH_KEY]: String(MONTHLY_LIMIT) });
-    const result = await checkUsage(kv, "user-1", NOW);
+  it("prioritises the monthly cap over the daily cap", () => {
+    const result = makeLedger(DAILY_LIMIT, MONTHLY_LIMIT).reserve(NOW);
     expect(result.scope).toBe("monthly");
   });
 
-  it("allows the message at one below the daily limit", async () => {
-    const kv = makeKV({ [DAY_KEY]: String(DAILY_LIMIT - 1), [MONTH_KEY]: "10" });
-    const result = await checkUsage(kv, "user-1", NOW);
+  it("allows the message at one below the daily limit", () => {
+    const result = makeLedger(DAILY_LIMIT - 1, 10).reserve(NOW);
     expect(result.allowed).toBe(true);
   });
+
+  it("lets exactly the remaining allowance through when reserved back to back", () => {
+    const ledger = makeLedger(DAILY_LIMIT - 2, 10);
+    const results = [ledger.reserve(NOW), ledger.reserve(NOW), ledger.reserve(NOW)];
+    expect(results.map((r) => r.allowed)).toEqual([true, true, false]);
+  });
+
+  it("treats buckets from an earlier period as zero", () => {
+    const ledger = new UsageLedger({ period: "2026-06-18", count: DAILY_LIMIT }, { period: "2026-05", count: 300 });
+    expect(ledger.reserve(NOW)).toEqual({ allowed: true, counts: { day: 1, month: 1 } });
+  });
 });
 
-describe("recordUsage", () => {
-  it("increments both counters from zero and returns the new totals", async () => {
-    const kv = makeKV();
-    const counts = await recordUsage(kv, "user-1", NOW);
-    expect(counts).toEqual({ day: 1, month: 1 });
-    expect(kv.store.get(DAY_KEY)).toBe("1");
-    expect(kv.store.get(MONTH_KEY)).toBe("1");
+describe("UsageLedger.release", () => {
+  it("undoes a reservation", () => {
+    const ledger = makeLedger(7, 42);
+    ledger.reserve(NOW);
+    ledger.release(NOW);
+    expect(ledger.counts(NOW)).toEqual({ day: 7, month: 42 });
   });
 
-  it("increments from existing counts", async () => {
-    const kv = makeKV({ [DAY_KEY]: "7", [MONTH_KEY]: "42" });
-    const counts = await recordUsage(kv, "user-1", NOW);
-    expect(counts).toEqual({ day: 8, month: 43 });
+  it("leaves a bucket that has rolled over alone", () => {
+    const ledger = makeLedger(7, 42);
+    ledger.release(new Date("2026-06-18T23:59:00Z"));
+    expect(ledger.counts(NOW)).toEqual({ day: 7, month: 41 });
   });
 
-  it("writes counters with an expiry TTL", async () => {
-    const kv = makeKV();
-    await recordUsage(kv, "user-1", NOW);
-    for (const call of kv.put.mock.calls) {
-      expect(call[2]).toMatchObject({ expirationTtl: expect.any(Number) });
-    }
+  it("never goes below zero", () => {
+    const ledger = new UsageLedger();
+    ledger.release(NOW);
+    expect(ledger.counts(NOW)).toEqual({ day: 0, month: 0 });
   });
 });